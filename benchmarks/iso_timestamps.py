@@ -0,0 +1,84 @@
+'''Benchmark of the ISO 8601 timestamp codec used on the order path.
+
+Usage: python -m benchmarks.iso_timestamps
+
+Compares iso_to_epoch_seconds and epoch_seconds_to_iso (see
+dydx3.helpers.request_helpers) with the dateutil and strftime based
+routines they replace, on timestamps in the API format.
+'''
+
+import random
+import timeit
+from datetime import datetime
+
+import dateutil.parser as dp
+
+from dydx3.helpers.request_helpers import epoch_seconds_to_iso
+from dydx3.helpers.request_helpers import iso_to_epoch_seconds
+
+N_TIMESTAMPS = 1000
+REPEAT = 5
+
+
+def dateutil_iso_to_epoch_seconds(iso):
+    return dp.parse(iso).timestamp()
+
+
+def strftime_epoch_seconds_to_iso(epoch):
+    return datetime.utcfromtimestamp(epoch).strftime(
+        '%Y-%m-%dT%H:%M:%S.%f',
+    )[:-3] + 'Z'
+
+
+def generate_epochs():
+    random.seed(0)
+    return [
+        random.randint(1600000000, 1800000000) + random.randint(0, 999) / 1000
+        for _ in range(N_TIMESTAMPS)
+    ]
+
+
+def _time_per_call(function, values):
+    def run():
+        for value in values:
+            function(value)
+    return min(timeit.repeat(run, number=1, repeat=REPEAT)) / len(values)
+
+
+def main():
+    epochs = generate_epochs()
+    isos = [strftime_epoch_seconds_to_iso(epoch) for epoch in epochs]
+    assert [iso_to_epoch_seconds(iso) for iso in isos] == [
+        dateutil_iso_to_epoch_seconds(iso) for iso in isos
+    ]
+    assert [epoch_seconds_to_iso(epoch) for epoch in epochs] == isos
+
+    print('{:<24} {:>12} {:>12} {:>8}'.format(
+        'function', 'before (us)', 'after (us)', 'speedup',
+    ))
+    for name, before, after, values in (
+        (
+            'iso_to_epoch_seconds',
+            dateutil_iso_to_epoch_seconds,
+            iso_to_epoch_seconds,
+            isos,
+        ),
+        (
+            'epoch_seconds_to_iso',
+            strftime_epoch_seconds_to_iso,
+            epoch_seconds_to_iso,
+            epochs,
+        ),
+    ):
+        before_time = _time_per_call(before, values)
+        after_time = _time_per_call(after, values)
+        print('{:<24} {:>12.2f} {:>12.2f} {:>7.1f}x'.format(
+            name,
+            before_time * 1e6,
+            after_time * 1e6,
+            before_time / after_time,
+        ))
+
+
+if __name__ == '__main__':
+    main()
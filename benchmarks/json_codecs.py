@@ -0,0 +1,164 @@
+'''Benchmark of the JSON codecs available to the transport.
+
+Usage: python -m benchmarks.json_codecs [--generated | --record | paths]
+
+Compares decoding and encoding time of each installed codec (see
+dydx3.helpers.json_codecs). By default, the public API responses saved in
+benchmarks/payloads are benchmarked. The files in the repository follow the
+example responses of the v3 API reference; run with --record to replace them
+with responses of the live API (get_markets, get_orderbook, get_trades and
+get_candles for BTC-USD). Pass the paths of other recorded responses to
+benchmark them instead, or --generated for larger generated get_candles,
+get_trades and get_fills pages.
+'''
+
+import os
+import random
+import sys
+import timeit
+
+from dydx3 import Client
+from dydx3.constants import API_HOST_MAINNET
+from dydx3.constants import MARKET_BTC_USD
+from dydx3.helpers.json_codecs import JSON_CODECS
+from dydx3.helpers.json_codecs import get_json_codec
+from dydx3.helpers.json_codecs import StdlibJsonCodec
+
+N_RECORDS = 100
+REPEAT = 5
+
+PAYLOADS_DIRECTORY = os.path.join(os.path.dirname(__file__), 'payloads')
+RECORDED_ENDPOINTS = {
+    'markets': lambda public: public.get_markets(),
+    'orderbook': lambda public: public.get_orderbook(MARKET_BTC_USD),
+    'trades': lambda public: public.get_trades(MARKET_BTC_USD),
+    'candles': lambda public: public.get_candles(MARKET_BTC_USD),
+}
+
+
+def _iso(i):
+    return '2021-01-{:02d}T{:02d}:{:02d}:00.000Z'.format(
+        i % 28 + 1,
+        i % 24,
+        i % 60,
+    )
+
+
+def _price():
+    return '{:.1f}'.format(random.uniform(30000, 60000))
+
+
+def generate_payloads():
+    random.seed(0)
+    candles = {'candles': [
+        {
+            'startedAt': _iso(i),
+            'updatedAt': _iso(i),
+            'market': 'BTC-USD',
+            'resolution': '1MIN',
+            'low': _price(),
+            'high': _price(),
+            'open': _price(),
+            'close': _price(),
+            'baseTokenVolume': '{:.4f}'.format(random.random() * 100),
+            'trades': str(random.randint(0, 1000)),
+            'usdVolume': '{:.4f}'.format(random.random() * 1e6),
+            'startingOpenInterest': '{:.4f}'.format(random.random() * 1e4),
+        }
+        for i in range(N_RECORDS)
+    ]}
+    trades = {'trades': [
+        {
+            'side': random.choice(['BUY', 'SELL']),
+            'size': '{:.3f}'.format(random.random()),
+            'price': _price(),
+            'createdAt': _iso(i),
+            'liquidation': False,
+        }
+        for i in range(N_RECORDS)
+    ]}
+    fills = {'fills': [
+        {
+            'id': '{:032x}'.format(random.getrandbits(128)),
+            'side': random.choice(['BUY', 'SELL']),
+            'liquidity': random.choice(['MAKER', 'TAKER']),
+            'type': 'LIMIT',
+            'market': 'BTC-USD',
+            'orderId': '{:032x}'.format(random.getrandbits(128)),
+            'price': _price(),
+            'size': '{:.3f}'.format(random.random()),
+            'fee': '{:.6f}'.format(random.random()),
+            'createdAt': _iso(i),
+        }
+        for i in range(N_RECORDS)
+    ]}
+    stdlib = StdlibJsonCodec()
+    return {
+        'candles': stdlib.dumps(candles),
+        'trades': stdlib.dumps(trades),
+        'fills': stdlib.dumps(fills),
+    }
+
+
+def record_payloads():
+    public = Client(host=API_HOST_MAINNET).public
+    for name, request in RECORDED_ENDPOINTS.items():
+        path = os.path.join(PAYLOADS_DIRECTORY, name + '.json')
+        with open(path, 'wb') as f:
+            f.write(request(public).raw)
+        print('Recorded {}'.format(path))
+
+
+def load_payloads(paths):
+    payloads = {}
+    for path in paths:
+        with open(path, 'rb') as f:
+            payloads[os.path.basename(path)] = f.read()
+    return payloads
+
+
+def main(args):
+    if args == ['--record']:
+        record_payloads()
+        return
+    if args == ['--generated']:
+        payloads = generate_payloads()
+    else:
+        payloads = load_payloads(args or [
+            os.path.join(PAYLOADS_DIRECTORY, name + '.json')
+            for name in RECORDED_ENDPOINTS
+        ])
+    codecs = []
+    for name in JSON_CODECS:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            print('{}: not installed'.format(name))
+
+    print('{:<24} {:<8} {:>12} {:>12}'.format(
+        'payload', 'codec', 'loads (us)', 'dumps (us)',
+    ))
+    for payload_name, content in payloads.items():
+        data = StdlibJsonCodec().loads(content)
+        number = max(1, 2000000 // len(content))
+        for codec in codecs:
+            loads = min(timeit.repeat(
+                lambda: codec.loads(content),
+                number=number,
+                repeat=REPEAT,
+            )) / number
+            dumps = min(timeit.repeat(
+                lambda: codec.dumps(data),
+                number=number,
+                repeat=REPEAT,
+            )) / number
+            print('{:<24} {:<8} {:>12.1f} {:>12.1f}'.format(
+                '{} ({} KB)'.format(payload_name, len(content) // 1024),
+                codec.name,
+                loads * 1e6,
+                dumps * 1e6,
+            ))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
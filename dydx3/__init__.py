@@ -1,14 +1,39 @@
 from dydx3.dydx_client import Client
 from dydx3.errors import DydxError
 from dydx3.errors import DydxApiError
+from dydx3.errors import PaginationError
 from dydx3.errors import TransactionReverted
 
 # Export useful helper functions and objects.
 from dydx3.helpers.request_helpers import epoch_seconds_to_iso
 from dydx3.helpers.request_helpers import iso_to_epoch_seconds
-from dydx3.starkex.helpers import generate_private_key_hex_unsafe
-from dydx3.starkex.helpers import private_key_from_bytes
-from dydx3.starkex.helpers import private_key_to_public_hex
-from dydx3.starkex.helpers import private_key_to_public_key_pair_hex
-from dydx3.starkex.order import SignableOrder
-from dydx3.starkex.withdrawal import SignableWithdrawal
+
+# The async client, STARK helpers and signable objects are imported on first
+# access, so that importing dydx3 does not load aiohttp or the STARK curve
+# parameters.
+_LAZY_EXPORTS = {
+    'AsyncClient': 'dydx3.dydx_async_client',
+    'generate_private_key_hex_unsafe': 'dydx3.starkex.helpers',
+    'private_key_from_bytes': 'dydx3.starkex.helpers',
+    'private_key_to_public_hex': 'dydx3.starkex.helpers',
+    'private_key_to_public_key_pair_hex': 'dydx3.starkex.helpers',
+    'OrderTemplate': 'dydx3.starkex.order',
+    'SignableOrder': 'dydx3.starkex.order',
+    'SignableWithdrawal': 'dydx3.starkex.withdrawal',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name),
+    )
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
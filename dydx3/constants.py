@@ -57,6 +57,25 @@ TRANSFER_STATUS_UNCONFIRMED = 'UNCONFIRMED'
 ACCOUNT_ACTION_DEPOSIT = 'DEPOSIT'
 ACCOUNT_ACTION_WITHDRAWAL = 'WITHDRAWAL'
 
+# ------------ Candle Resolutions ------------
+CANDLE_RESOLUTION_ONE_DAY = '1DAY'
+CANDLE_RESOLUTION_FOUR_HOURS = '4HOURS'
+CANDLE_RESOLUTION_ONE_HOUR = '1HOUR'
+CANDLE_RESOLUTION_THIRTY_MINUTES = '30MINS'
+CANDLE_RESOLUTION_FIFTEEN_MINUTES = '15MINS'
+CANDLE_RESOLUTION_FIVE_MINUTES = '5MINS'
+CANDLE_RESOLUTION_ONE_MINUTE = '1MIN'
+CANDLE_RESOLUTION_SECONDS = {
+    CANDLE_RESOLUTION_ONE_DAY: 24 * 60 * 60,
+    CANDLE_RESOLUTION_FOUR_HOURS: 4 * 60 * 60,
+    CANDLE_RESOLUTION_ONE_HOUR: 60 * 60,
+    CANDLE_RESOLUTION_THIRTY_MINUTES: 30 * 60,
+    CANDLE_RESOLUTION_FIFTEEN_MINUTES: 15 * 60,
+    CANDLE_RESOLUTION_FIVE_MINUTES: 5 * 60,
+    CANDLE_RESOLUTION_ONE_MINUTE: 60,
+}
+MAX_CANDLES_PER_REQUEST = 100
+
 # ------------ Markets ------------
 MARKET_BTC_USD = 'BTC-USD'
 MARKET_ETH_USD = 'ETH-USD'
@@ -316,3 +335,4 @@ OFF_CHAIN_KEY_DERIVATION_ACTION = 'dYdX STARK Key'
 
 # ------------ API Defaults ------------
 DEFAULT_API_TIMEOUT = 3000
+DEFAULT_CREATE_ORDERS_CONCURRENCY = 10
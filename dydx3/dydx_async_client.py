@@ -0,0 +1,46 @@
+import functools
+
+from dydx3.dydx_client import Client
+from dydx3.helpers.async_requests import AsyncTransport
+from dydx3.modules.async_public import AsyncPublic
+
+
+class AsyncClient(Client):
+    '''
+    Asynchronous counterpart of Client, built on one aiohttp session.
+
+    Takes the same arguments as Client, plus signing_executor, the
+    concurrent.futures executor on which STARK signatures are computed (see
+    AsyncPrivate). The endpoint methods of the public, private, eth_private
+    and onboarding modules return coroutines. The eth module, which sends
+    Ethereum transactions through web3, is synchronous.
+
+    Use as an async context manager, or call close(), to close the session:
+
+        async with AsyncClient(host=API_HOST_MAINNET) as client:
+            markets = await client.public.get_markets()
+    '''
+
+    transport_class = AsyncTransport
+    public_class = AsyncPublic
+
+    def __init__(self, *args, signing_executor=None, **kwargs):
+        self.signing_executor = signing_executor
+        super(AsyncClient, self).__init__(*args, **kwargs)
+
+    def _get_private_class(self):
+        from dydx3.modules.async_private import AsyncPrivate
+
+        return functools.partial(
+            AsyncPrivate,
+            signing_executor=self.signing_executor,
+        )
+
+    async def close(self):
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
@@ -1,21 +1,20 @@
-from web3 import Web3
-
 from dydx3.constants import DEFAULT_API_TIMEOUT, NETWORK_ID_MAINNET
-from dydx3.eth_signing import SignWithWeb3
-from dydx3.eth_signing import SignWithKey
-from dydx3.modules.eth_private import EthPrivate
-from dydx3.modules.eth import Eth
-from dydx3.modules.private import Private
+from dydx3.helpers.requests import DEFAULT_POOL_CONNECTIONS
+from dydx3.helpers.requests import DEFAULT_POOL_MAXSIZE
+from dydx3.helpers.requests import Transport
 from dydx3.modules.public import Public
-from dydx3.modules.onboarding import Onboarding
-from dydx3.starkex.helpers import private_key_to_public_key_pair_hex
-from dydx3.starkex.starkex_resources.cpp_signature import (
-    get_cpp_lib,
-)
+
+# The Ethereum, private and STARK signing modules are imported on first use,
+# so that a client for public endpoints only does not pay for importing web3,
+# eth_account and the STARK curve parameters.
 
 
 class Client(object):
 
+    # Overridden by AsyncClient.
+    transport_class = Transport
+    public_class = Public
+
     def __init__(
         self,
         host,
@@ -32,6 +31,18 @@ class Client(object):
         web3_provider=None,
         api_key_credentials=None,
         crypto_c_exports_path=None,
+        stark_presign_pool=None,
+        stark_signer=None,
+        transport=None,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=False,
+        keep_alive=True,
+        tcp_nodelay=True,
+        json_codec=None,
+        rate_limiter=None,
+        response_cache=None,
+        clock_sync=None,
     ):
         # Remove trailing '/' if present, from host.
         if host.endswith('/'):
@@ -43,6 +54,20 @@ class Client(object):
         self.stark_private_key = stark_private_key
         self.api_key_credentials = api_key_credentials
         self.stark_public_key_y_coordinate = stark_public_key_y_coordinate
+        self.stark_presign_pool = stark_presign_pool
+        self.stark_signer = stark_signer
+        self.clock_sync = clock_sync
+
+        # HTTP session and connection pool shared by all modules.
+        self.transport = transport or self.transport_class(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+            tcp_nodelay=tcp_nodelay,
+            json_codec=json_codec,
+            rate_limiter=rate_limiter,
+        )
 
         self.web3 = None
         self.eth_signer = None
@@ -50,9 +75,16 @@ class Client(object):
         self.network_id = None
 
         if crypto_c_exports_path is not None:
+            from dydx3.starkex.starkex_resources.cpp_signature import (
+                get_cpp_lib,
+            )
             get_cpp_lib(crypto_c_exports_path)
 
         if web3 is not None or web3_provider is not None:
+            from web3 import Web3
+
+            from dydx3.eth_signing import SignWithWeb3
+
             if isinstance(web3_provider, str):
                 web3_provider = Web3.HTTPProvider(
                     web3_provider, request_kwargs={'timeout': self.api_timeout}
@@ -63,6 +95,8 @@ class Client(object):
             self.network_id = self.web3.net.version
 
         if eth_private_key is not None or web3_account is not None:
+            from dydx3.eth_signing import SignWithKey
+
             # May override web3 or web3_provider configuration.
             key = eth_private_key or web3_account.key
             self.eth_signer = SignWithKey(key)
@@ -75,7 +109,11 @@ class Client(object):
 
         # Initialize the public module. Other modules are initialized on
         # demand, if the necessary configuration options were provided.
-        self._public = Public(host)
+        self._public = self.public_class(
+            host,
+            transport=self.transport,
+            response_cache=response_cache,
+        )
         self._private = None
         self._eth_private = None
         self._eth = None
@@ -83,6 +121,11 @@ class Client(object):
 
         # Derive the public keys.
         if stark_private_key is not None:
+            from dydx3.starkex.helpers import cache_public_key_pair_hex
+            from dydx3.starkex.helpers import (
+                private_key_to_public_key_pair_hex,
+            )
+
             self.stark_public_key, self.stark_public_key_y_coordinate = (
                 private_key_to_public_key_pair_hex(stark_private_key)
             )
@@ -97,6 +140,10 @@ class Client(object):
                     self.stark_public_key_y_coordinate
             ):
                 raise ValueError('STARK public/private key mismatch (y)')
+            cache_public_key_pair_hex(
+                self.stark_public_key,
+                self.stark_public_key_y_coordinate,
+            )
         else:
             self.stark_public_key = stark_public_key
             self.stark_public_key_y_coordinate = stark_public_key_y_coordinate
@@ -120,6 +167,11 @@ class Client(object):
                     e,
                 )
 
+    def _get_private_class(self):
+        from dydx3.modules.private import Private
+
+        return Private
+
     @property
     def public(self):
         '''
@@ -135,13 +187,17 @@ class Client(object):
         '''
         if not self._private:
             if self.api_key_credentials:
-                self._private = Private(
+                self._private = self._get_private_class()(
                     host=self.host,
                     network_id=self.network_id,
                     stark_private_key=self.stark_private_key,
                     default_address=self.default_address,
                     api_timeout=self.api_timeout,
                     api_key_credentials=self.api_key_credentials,
+                    stark_presign_pool=self.stark_presign_pool,
+                    stark_signer=self.stark_signer,
+                    transport=self.transport,
+                    clock_sync=self.clock_sync,
                 )
             else:
                 raise Exception(
@@ -158,12 +214,16 @@ class Client(object):
         '''
         if not self._eth_private:
             if self.eth_signer:
+                from dydx3.modules.eth_private import EthPrivate
+
                 self._eth_private = EthPrivate(
                     host=self.host,
                     eth_signer=self.eth_signer,
                     network_id=self.network_id,
                     default_address=self.default_address,
                     api_timeout=self.api_timeout,
+                    transport=self.transport,
+                    clock_sync=self.clock_sync,
                 )
             else:
                 raise Exception(
@@ -181,6 +241,8 @@ class Client(object):
         '''
         if not self._onboarding:
             if self.eth_signer:
+                from dydx3.modules.onboarding import Onboarding
+
                 self._onboarding = Onboarding(
                     host=self.host,
                     eth_signer=self.eth_signer,
@@ -191,6 +253,7 @@ class Client(object):
                     stark_public_key_y_coordinate=(
                         self.stark_public_key_y_coordinate
                     ),
+                    transport=self.transport,
                 )
             else:
                 raise Exception(
@@ -208,6 +271,8 @@ class Client(object):
         if not self._eth:
             eth_private_key = getattr(self.eth_signer, '_private_key', None)
             if self.web3 and eth_private_key:
+                from dydx3.modules.eth import Eth
+
                 self._eth = Eth(
                     web3=self.web3,
                     network_id=self.network_id,
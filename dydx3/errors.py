@@ -25,6 +25,20 @@ class DydxApiError(DydxError):
         )
 
 
+class PaginationError(DydxError):
+
+    def __init__(self, timestamp, page_size):
+        self.timestamp = timestamp
+        self.page_size = page_size
+
+    def __str__(self):
+        return (
+            'At least {} rows share the timestamp {}, so the rows beyond '
+            'them cannot be paginated without skipping some. Use a larger '
+            'limit.'.format(self.page_size, self.timestamp)
+        )
+
+
 class TransactionReverted(DydxError):
 
     def __init__(self, tx_receipt):
@@ -1,5 +1,3 @@
-from web3 import Web3
-from web3.auto import w3
 from dydx3 import constants
 
 PREPEND_DEC = '\x19Ethereum Signed Message:\n32'
@@ -23,6 +21,9 @@ def ec_recover_typed_signature(
     if len(strip_hex_prefix(typed_signature)) != 66 * 2:
         raise Exception('Unable to ecrecover signature: ' + typed_signature)
 
+    from eth_account import Account
+    from web3 import Web3
+
     sig_type = int(typed_signature[-2:], 16)
     prepended_hash = ''
     if sig_type == constants.SIGNATURE_TYPE_NO_PREPEND:
@@ -45,7 +46,7 @@ def ec_recover_typed_signature(
 
     signature = typed_signature[:-2]
 
-    address = w3.eth.account.recoverHash(prepended_hash, signature=signature)
+    address = Account.recoverHash(prepended_hash, signature=signature)
     return address
 
 
@@ -104,4 +105,6 @@ def addresses_are_equal(
 
 
 def hash_string(input):
+    from web3 import Web3
+
     return Web3.solidityKeccak(['string'], [input])
@@ -0,0 +1,118 @@
+import json
+
+import aiohttp
+
+from dydx3.errors import DydxApiError
+from dydx3.helpers.json_codecs import get_json_codec
+from dydx3.helpers.request_helpers import remove_nones
+from dydx3.helpers.requests import DEFAULT_HEADERS
+from dydx3.helpers.requests import DEFAULT_POOL_CONNECTIONS
+from dydx3.helpers.requests import DEFAULT_POOL_MAXSIZE
+from dydx3.helpers.requests import Response
+
+
+class _ErrorResponse(object):
+    """The parts of a failed aiohttp response used by DydxApiError."""
+
+    def __init__(self, status_code, text, headers):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncTransport(object):
+    """
+    aiohttp session shared by the modules of an AsyncClient.
+
+    Takes the same options as Transport. aiohttp always disables Nagle's
+    algorithm and pools connections for any number of hosts, so tcp_nodelay
+    and pool_connections have no effect. Without pool_block, the number of
+    connections per host is not limited, like with requests, which opens
+    extra connections when its pool is exhausted.
+
+    The session is created on the first request, inside the running event
+    loop, and must be closed with close().
+    """
+
+    def __init__(
+        self,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=False,
+        keep_alive=True,
+        tcp_nodelay=True,
+        json_codec=None,
+        rate_limiter=None,
+    ):
+        self.json_codec = get_json_codec(json_codec)
+        self.rate_limiter = rate_limiter
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self._session = None
+
+    @property
+    def session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.pool_maxsize if self.pool_block else 0,
+                force_close=not self.keep_alive,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_HEADERS,
+            )
+        return self._session
+
+    async def request(
+        self,
+        uri,
+        method,
+        headers=None,
+        data_values={},
+        api_timeout=None,
+        body=None,
+    ):
+        if body is None:
+            body = self.json_codec.dumps(remove_nones(data_values))
+        if self.rate_limiter is not None:
+            bucket = self.rate_limiter.get_bucket(method, uri)
+            await self.rate_limiter.acquire_async(bucket)
+        async with self.session.request(
+            method.upper(),
+            uri,
+            headers=headers,
+            data=body,
+            timeout=aiohttp.ClientTimeout(total=api_timeout),
+        ) as response:
+            content = await response.read()
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(
+                bucket,
+                response.headers,
+                response.status,
+            )
+
+        if not str(response.status).startswith('2'):
+            raise DydxApiError(
+                _ErrorResponse(
+                    response.status,
+                    content.decode(errors='replace'),
+                    response.headers,
+                ),
+            )
+
+        return Response(
+            headers=response.headers,
+            raw=content,
+            json_codec=self.json_codec,
+        )
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
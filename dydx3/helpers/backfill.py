@@ -0,0 +1,219 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dydx3.constants import CANDLE_RESOLUTION_SECONDS
+from dydx3.constants import MAX_CANDLES_PER_REQUEST
+from dydx3.errors import DydxApiError
+from dydx3.helpers.request_helpers import epoch_seconds_to_iso
+from dydx3.helpers.request_helpers import iso_to_epoch_seconds
+
+DEFAULT_BACKFILL_WORKERS = 8
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_RETRY_DELAY_SECONDS = 1
+
+# Columns returned by candles_to_columns(), and how each one is converted.
+CANDLE_TIME_COLUMNS = ('startedAt', 'updatedAt')
+CANDLE_FLOAT_COLUMNS = (
+    'open',
+    'high',
+    'low',
+    'close',
+    'baseTokenVolume',
+    'usdVolume',
+    'startingOpenInterest',
+)
+CANDLE_INT_COLUMNS = ('trades',)
+
+
+def split_time_range(from_iso, to_iso, window_seconds):
+    '''
+    Split [from_iso, to_iso] into consecutive windows of window_seconds.
+
+    :returns: list of (from_iso, to_iso) tuples, oldest first
+
+    :raises: ValueError if window_seconds is not positive
+    '''
+    if not window_seconds > 0:
+        raise ValueError(
+            'window_seconds must be positive, got {}'.format(window_seconds),
+        )
+    start = iso_to_epoch_seconds(from_iso)
+    end = iso_to_epoch_seconds(to_iso)
+    windows = []
+    while start < end:
+        window_end = min(start + window_seconds, end)
+        windows.append((
+            epoch_seconds_to_iso(start),
+            epoch_seconds_to_iso(window_end),
+        ))
+        start = window_end
+    return windows
+
+
+def _retry_delay_seconds(error, attempt):
+    '''
+    Seconds to wait before retrying a rate-limited request, from the
+    Retry-After header (in milliseconds) if present, or else with an
+    exponential backoff.
+    '''
+    headers = getattr(error.response, 'headers', None) or {}
+    retry_after = headers.get('Retry-After')
+    if retry_after is not None:
+        try:
+            return float(retry_after) / 1000
+        except ValueError:
+            pass
+    return DEFAULT_RETRY_DELAY_SECONDS * 2 ** attempt
+
+
+def _get_candles_with_retries(public, market, resolution, window, limit):
+    for attempt in range(DEFAULT_MAX_RETRIES + 1):
+        try:
+            response = public.get_candles(
+                market,
+                resolution=resolution,
+                from_iso=window[0],
+                to_iso=window[1],
+                limit=limit,
+            )
+        except DydxApiError as error:
+            if error.status_code != 429 or attempt == DEFAULT_MAX_RETRIES:
+                raise
+            time.sleep(_retry_delay_seconds(error, attempt))
+            continue
+        if asyncio.iscoroutine(response):
+            response.close()
+            raise TypeError('Backfill is not supported by async modules')
+        return response.data['candles']
+
+
+def backfill_candles(
+    public,
+    markets,
+    resolution,
+    from_iso,
+    to_iso,
+    max_workers=DEFAULT_BACKFILL_WORKERS,
+    limit=MAX_CANDLES_PER_REQUEST,
+):
+    '''
+    Fetch all candles of one or more markets over a time range.
+
+    The range is split into windows of at most limit candles each (both
+    ends of a window are inclusive), which are fetched concurrently on
+    max_workers threads. Rate-limited requests (HTTP 429) are retried after
+    the delay given by the server. The windows are then stitched together,
+    dropping duplicate candles at window boundaries.
+
+    :param public: required
+    :type public: Public
+
+    :param markets: required
+    :type markets: str or list of str
+
+    :param resolution: required
+    :type resolution: str in CANDLE_RESOLUTION_SECONDS
+
+    :param from_iso: required
+    :type from_iso: ISO str
+
+    :param to_iso: required
+    :type to_iso: ISO str
+
+    :param max_workers: optional
+    :type max_workers: int
+
+    :param limit: optional, candles per request, at least 2
+    :type limit: int
+
+    :returns: dict of market to list of candles, oldest first
+
+    :raises: DydxAPIError, ValueError
+    '''
+    if int(limit) < 2:
+        # Consecutive windows share a candle, so each needs at least two.
+        raise ValueError('limit must be at least 2, got {}'.format(limit))
+    if isinstance(markets, str):
+        markets = [markets]
+    windows = split_time_range(
+        from_iso,
+        to_iso,
+        CANDLE_RESOLUTION_SECONDS[resolution] * (int(limit) - 1),
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            market: [
+                executor.submit(
+                    _get_candles_with_retries,
+                    public,
+                    market,
+                    resolution,
+                    window,
+                    limit,
+                )
+                for window in windows
+            ]
+            for market in markets
+        }
+        candles_by_market = {}
+        for market, market_futures in futures.items():
+            candles_by_started_at = {}
+            for future in market_futures:
+                for candle in future.result():
+                    candles_by_started_at[candle['startedAt']] = candle
+            candles_by_market[market] = [
+                candles_by_started_at[started_at]
+                for started_at in sorted(candles_by_started_at)
+            ]
+    return candles_by_market
+
+
+def import_numpy():
+    '''
+    Import numpy, which is an optional dependency.
+
+    :raises: ImportError with installation instructions if it is missing
+    '''
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            'numpy is required to convert candles to columns; install it '
+            'with `pip install dydx-v3-python[numpy]`',
+        )
+    return numpy
+
+
+def candles_to_columns(candles):
+    '''
+    Convert a list of candles to columnar NumPy arrays. Requires numpy.
+
+    Timestamps are converted to datetime64[ms], prices and volumes to
+    float64 and trade counts to int64.
+
+    :param candles: required
+    :type candles: list of candles
+
+    :returns: dict of column name to numpy.ndarray
+
+    :raises: ImportError if numpy is not installed
+    '''
+    np = import_numpy()
+
+    columns = {}
+    for name in CANDLE_TIME_COLUMNS:
+        columns[name] = np.array(
+            # NumPy does not parse the 'Z' suffix.
+            [candle[name].rstrip('Z') for candle in candles],
+            dtype='datetime64[ms]',
+        )
+    for name in CANDLE_FLOAT_COLUMNS:
+        columns[name] = np.array(
+            [candle[name] for candle in candles],
+        ).astype(np.float64)
+    for name in CANDLE_INT_COLUMNS:
+        columns[name] = np.array(
+            [candle[name] for candle in candles],
+        ).astype(np.int64)
+    return columns
@@ -0,0 +1,143 @@
+import threading
+import time
+
+from dydx3.helpers.request_helpers import format_epoch_seconds_iso
+
+DEFAULT_SYNC_INTERVAL_SECONDS = 60
+DEFAULT_MAX_SAMPLES = 8
+
+
+class ClockSync(object):
+    '''
+    Estimate of the offset between the local clock and the API server clock,
+    used to timestamp private requests and compute expirations on the server
+    clock.
+
+    The offset is sampled the NTP way with Public.get_time(): a sample sent
+    at local time t0 and received at t1, with server time s, has a round
+    trip time of t1 - t0 and an offset of s - (t0 + t1) / 2, with an error of
+    at most half the round trip time. Of the last max_samples samples, the
+    one with the shortest round trip time is used.
+
+    The clock is sampled on first use, and again on use once interval
+    seconds have passed since the last sample. If resampling fails, the
+    previous samples are kept. Call start() to resample on a background
+    thread instead, e.g. when used from an event loop.
+
+    :param public: required, synchronous module used to get the server time
+    :type public: Public
+
+    :param interval: optional, seconds between samples
+    :type interval: number
+
+    :param max_samples: optional, number of recent samples to pick from
+    :type max_samples: int
+    '''
+
+    def __init__(
+        self,
+        public,
+        interval=DEFAULT_SYNC_INTERVAL_SECONDS,
+        max_samples=DEFAULT_MAX_SAMPLES,
+    ):
+        self.public = public
+        self.interval = interval
+        self.max_samples = max_samples
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()
+        self._samples = []
+        self._sampled_at = None
+        self._thread = None
+        self._stopped = threading.Event()
+
+    @property
+    def offset(self):
+        '''Seconds to add to the local clock to get the server clock.'''
+        self._sync_if_stale()
+        return min(self._samples)[1]
+
+    @property
+    def rtt(self):
+        '''Round trip time in seconds of the sample the offset is from.'''
+        self._sync_if_stale()
+        return min(self._samples)[0]
+
+    def sync(self):
+        '''
+        Sample the server clock once.
+
+        :returns: (offset, rtt) of the new sample, in seconds
+
+        :raises: DydxAPIError
+        '''
+        sent_at = time.time()
+        response = self.public.get_time()
+        received_at = time.time()
+        sample = (
+            received_at - sent_at,
+            float(response.data['epoch']) - (sent_at + received_at) / 2,
+        )
+        with self._lock:
+            self._samples = (self._samples + [sample])[-self.max_samples:]
+            self._sampled_at = time.monotonic()
+        return sample[1], sample[0]
+
+    def _sync_if_stale(self):
+        sampled_at = self._sampled_at
+        if sampled_at is None:
+            with self._sync_lock:
+                if self._sampled_at is None:
+                    self.sync()
+        elif (
+            self._thread is None and
+            time.monotonic() - sampled_at >= self.interval and
+            self._sync_lock.acquire(blocking=False)
+        ):
+            # Other threads keep using the previous samples meanwhile, and
+            # if resampling fails.
+            try:
+                self.sync()
+            except Exception:
+                pass
+            finally:
+                self._sync_lock.release()
+
+    def now(self):
+        '''Get the server time, in epoch seconds.'''
+        return time.time() + self.offset
+
+    def now_iso(self):
+        '''Get the server time, as an ISO string.'''
+        return format_epoch_seconds_iso(self.now())
+
+    def expiration_epoch_seconds(self, seconds):
+        '''
+        Get the epoch seconds of an expiration seconds from now on the server
+        clock, e.g. for the expiration_epoch_seconds of an order.
+        '''
+        return self.now() + seconds
+
+    def start(self):
+        '''Sample the server clock every interval on a background thread.'''
+        if self._thread is not None:
+            return
+        self.sync()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        '''Stop the background thread started by start().'''
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.sync()
+            except Exception:
+                # Keep the previous samples, and retry on the next interval.
+                pass
@@ -0,0 +1,123 @@
+import json
+
+# Integers outside of the 64-bit range have at least 20 digits. orjson
+# cannot encode them and decodes them to floats, so contents with such a run
+# of digits are handled by the standard library instead. Digits in strings
+# also match, which is only slower. Mapping all digits to '0' and searching
+# for 20 zeros is much faster than a regular expression.
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+_LONG_DIGITS = b'0' * 20
+
+
+def _may_contain_big_int(content):
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return _LONG_DIGITS in content.translate(_DIGITS_TO_ZERO)
+
+
+class StdlibJsonCodec(object):
+    '''JSON codec using the standard library json module.'''
+
+    name = 'json'
+
+    def dumps(self, data):
+        '''Serialize data to compact JSON bytes.'''
+        return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, content):
+        '''Deserialize JSON from bytes or str.'''
+        return json.loads(content)
+
+
+class OrjsonCodec(object):
+    '''
+    JSON codec using orjson, if installed.
+
+    orjson only supports 64-bit integers. Data it cannot encode, and
+    contents which may hold larger integers, are handled by the standard
+    library, so that results are the same as with StdlibJsonCodec.
+    '''
+
+    name = 'orjson'
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+        self._stdlib = StdlibJsonCodec()
+
+    def dumps(self, data):
+        try:
+            return self._orjson.dumps(data)
+        except TypeError:
+            return self._stdlib.dumps(data)
+
+    def loads(self, content):
+        if _may_contain_big_int(content):
+            return self._stdlib.loads(content)
+        return self._orjson.loads(content)
+
+
+class UjsonCodec(object):
+    '''
+    JSON codec using ujson, if installed.
+
+    Like OrjsonCodec, integers outside of the 64-bit range are handled by
+    the standard library.
+    '''
+
+    name = 'ujson'
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+        self._stdlib = StdlibJsonCodec()
+
+    def dumps(self, data):
+        try:
+            return self._ujson.dumps(
+                data,
+                ensure_ascii=False,
+                escape_forward_slashes=False,
+            ).encode('utf-8')
+        except (OverflowError, TypeError):
+            return self._stdlib.dumps(data)
+
+    def loads(self, content):
+        if _may_contain_big_int(content):
+            return self._stdlib.loads(content)
+        return self._ujson.loads(content)
+
+
+JSON_CODECS = {
+    codec_class.name: codec_class
+    for codec_class in (OrjsonCodec, UjsonCodec, StdlibJsonCodec)
+}
+
+
+def get_json_codec(json_codec=None):
+    '''
+    Get a JSON codec.
+
+    :param json_codec: optional, a codec object with dumps() and loads()
+    methods, or the name of a codec in JSON_CODECS. Defaults to the standard
+    library json module; the faster "orjson" and "ujson" codecs must be
+    requested explicitly.
+    :type json_codec: object or str in list [
+        "orjson",
+        "ujson",
+        "json",
+    ]
+
+    :returns: object with dumps() (data to bytes) and loads() (bytes or str
+    to data) methods
+
+    :raises: ValueError if the codec is unknown, ImportError if the named
+    codec is not installed
+    '''
+    if json_codec is None:
+        return StdlibJsonCodec()
+    if not isinstance(json_codec, str):
+        return json_codec
+    if json_codec not in JSON_CODECS:
+        raise ValueError('Unknown JSON codec: {}'.format(json_codec))
+    return JSON_CODECS[json_codec]()
@@ -0,0 +1,123 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from dydx3.errors import PaginationError
+
+
+def _row_key(row):
+    if 'id' in row:
+        return row['id']
+    return repr(sorted(row.items()))
+
+
+def iter_pages(
+    fetch_page,
+    data_key,
+    timestamp_key,
+    before_or_at=None,
+    limit=None,
+    prefetch=False,
+):
+    '''
+    Iterate over the rows of a history endpoint, newest first, one page at a
+    time.
+
+    Each page is requested with the timestamp of the oldest row of the
+    previous page as the (inclusive) cursor. Rows of the previous page
+    which are returned again at that timestamp are skipped. Only the rows of
+    the current page and the keys of the rows at the cursor are held in
+    memory.
+
+    If a whole page of rows shares the cursor timestamp, the cursor cannot
+    advance through it without possibly skipping rows, so PaginationError
+    is raised after the rows of that page, unless the page is shorter than
+    the page size (limit, or else the longest page received so far), in
+    which case no rows remain. Pass the limit, so that a short page is not
+    mistaken for a full one.
+
+    :param fetch_page: required, function of the cursor (ISO str or None)
+    returning the Response for that page
+    :type fetch_page: function
+
+    :param data_key: required, key of the rows in the response data
+    :type data_key: str
+
+    :param timestamp_key: required, key of the timestamp in each row
+    :type timestamp_key: str
+
+    :param before_or_at: optional, initial cursor
+    :type before_or_at: ISO str
+
+    :param limit: optional, page size requested by fetch_page. A shorter
+    page ends the iteration without another request.
+    :type limit: int
+
+    :param prefetch: optional, fetch the next page on a background thread
+    while the rows of the current page are being consumed
+    :type prefetch: bool
+
+    :returns: generator of rows
+
+    :raises: DydxAPIError, PaginationError
+    '''
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+    def fetch(cursor):
+        response = fetch_page(cursor)
+        if asyncio.iscoroutine(response):
+            response.close()
+            raise TypeError('Pagination is not supported by async modules')
+        return response.data[data_key]
+
+    try:
+        cursor = before_or_at
+        boundary_keys = set()
+        next_page = None
+        page_size = limit and int(limit)
+        rows = fetch(cursor)
+        while rows:
+            if limit is None:
+                page_size = max(page_size or 0, len(rows))
+            page_cursor = cursor
+            new_rows = [
+                row for row in rows
+                if not (
+                    row[timestamp_key] == page_cursor and
+                    _row_key(row) in boundary_keys
+                )
+            ]
+            cursor = rows[-1][timestamp_key]
+            if cursor == page_cursor:
+                # The whole page shares the cursor timestamp. Unless all of
+                # the rows at it fit in the page, there may be more, which
+                # the next page would not reach.
+                for row in new_rows:
+                    yield row
+                if len(rows) < page_size:
+                    return
+                raise PaginationError(cursor, page_size)
+            is_last_page = limit is not None and len(rows) < page_size
+
+            if executor is not None and not is_last_page:
+                next_page = executor.submit(fetch, cursor)
+
+            boundary_keys = {
+                _row_key(row) for row in rows
+                if row[timestamp_key] == cursor
+            }
+
+            for row in new_rows:
+                yield row
+
+            if is_last_page:
+                return
+            if next_page is not None:
+                rows = next_page.result()
+                next_page = None
+            else:
+                rows = fetch(cursor)
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,215 @@
+import asyncio
+import threading
+import time
+from urllib.parse import urlparse
+
+RATE_LIMIT_BUCKET_ORDERS = 'orders'
+RATE_LIMIT_BUCKET_CANCELS = 'cancels'
+RATE_LIMIT_BUCKET_READS = 'reads'
+
+# Initial (requests, window in seconds) of each bucket. These are
+# conservative guesses, corrected by the rate limit headers of responses.
+DEFAULT_RATE_LIMITS = {
+    RATE_LIMIT_BUCKET_ORDERS: (40, 10),
+    RATE_LIMIT_BUCKET_CANCELS: (250, 10),
+    RATE_LIMIT_BUCKET_READS: (175, 10),
+}
+
+# How long requests yield to a waiting cancel before checking again.
+CANCEL_PRIORITY_WAIT_SECONDS = 0.001
+
+
+def _header_number(headers, name):
+    value = headers.get(name) if headers is not None else None
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class _TokenBucket(object):
+    '''Token bucket, refilled continuously at capacity per window.'''
+
+    def __init__(self, capacity, window_seconds):
+        self.capacity = capacity
+        self.window_seconds = window_seconds
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0
+
+    def _refill(self, now):
+        rate = self.capacity / self.window_seconds
+        self.tokens = min(
+            self.capacity,
+            self.tokens + (now - self.updated_at) * rate,
+        )
+        self.updated_at = now
+
+    def get_wait_seconds(self, now):
+        self._refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.tokens >= 1:
+            return 0
+        return (1 - self.tokens) * self.window_seconds / self.capacity
+
+    def take(self):
+        self.tokens -= 1
+
+    def update(self, headers, status_code, now):
+        self._refill(now)
+        limit = _header_number(headers, 'RateLimit-Limit')
+        if limit:
+            self.capacity = limit
+        remaining = _header_number(headers, 'RateLimit-Remaining')
+        if remaining is not None:
+            # Requests still in flight have already been taken locally.
+            self.tokens = min(self.tokens, remaining)
+
+        # Both are in milliseconds: Retry-After is a delay, and
+        # RateLimit-Reset the epoch time at which the window resets.
+        retry_after = _header_number(headers, 'Retry-After')
+        reset = _header_number(headers, 'RateLimit-Reset')
+        if status_code == 429:
+            self.tokens = min(self.tokens, 0)
+        if status_code == 429 and retry_after is not None:
+            self.blocked_until = max(
+                self.blocked_until,
+                now + retry_after / 1000,
+            )
+        elif (status_code == 429 or remaining == 0) and reset is not None:
+            self.blocked_until = max(
+                self.blocked_until,
+                now + reset / 1000 - time.time(),
+            )
+
+
+class RateLimiter(object):
+    '''
+    Client-side scheduler which paces requests to stay within the API rate
+    limits, instead of having them rejected with 429 errors.
+
+    Requests are sorted into token buckets: order placement, cancels and
+    reads. Each request takes a token from its bucket, waiting for one if
+    the bucket is empty. The budget of each bucket is learned from the
+    RateLimit-Limit, RateLimit-Remaining and RateLimit-Reset headers of its
+    responses, and a 429 response blocks the bucket for its Retry-After
+    delay. Other requests are not limited.
+
+    Cancels go ahead of everything else: while a cancel is waiting for its
+    bucket, requests of the other buckets wait too.
+
+    A RateLimiter is thread-safe, and may be shared by the Transport or
+    AsyncTransport of all clients using the same API key.
+
+    :param limits: optional, initial (requests, window in seconds) of
+    buckets, overriding DEFAULT_RATE_LIMITS
+    :type limits: dict
+    '''
+
+    def __init__(self, limits=None):
+        limits = dict(DEFAULT_RATE_LIMITS, **(limits or {}))
+        self._buckets = {
+            name: _TokenBucket(capacity, window_seconds)
+            for name, (capacity, window_seconds) in limits.items()
+        }
+        self._condition = threading.Condition()
+        self._waiting_cancels = 0
+
+    @staticmethod
+    def get_bucket(method, uri):
+        '''
+        Get the name of the bucket limiting a request, or None if the
+        request is not limited.
+        '''
+        method = method.upper()
+        path = urlparse(uri).path
+        if method == 'DELETE' and (
+            path.startswith('/v3/orders') or
+            path.startswith('/v3/active-orders')
+        ):
+            return RATE_LIMIT_BUCKET_CANCELS
+        if method == 'POST' and path == '/v3/orders':
+            return RATE_LIMIT_BUCKET_ORDERS
+        if method == 'GET':
+            return RATE_LIMIT_BUCKET_READS
+        return None
+
+    def get_tokens(self, bucket_name):
+        '''Get the number of requests which can be sent right away.'''
+        with self._condition:
+            bucket = self._buckets[bucket_name]
+            bucket._refill(time.monotonic())
+            return bucket.tokens
+
+    def _reserve(self, bucket_name):
+        # Takes a token and returns 0, or returns the seconds to wait before
+        # trying again. Must be called with the lock held.
+        now = time.monotonic()
+        if (
+            bucket_name != RATE_LIMIT_BUCKET_CANCELS and
+            self._waiting_cancels
+        ):
+            return max(
+                self._buckets[RATE_LIMIT_BUCKET_CANCELS].get_wait_seconds(
+                    now,
+                ),
+                CANCEL_PRIORITY_WAIT_SECONDS,
+            )
+        bucket = self._buckets[bucket_name]
+        wait_seconds = bucket.get_wait_seconds(now)
+        if wait_seconds <= 0:
+            bucket.take()
+        return wait_seconds
+
+    def _set_waiting(self, bucket_name, waiting):
+        # Must be called with the lock held.
+        if bucket_name == RATE_LIMIT_BUCKET_CANCELS:
+            self._waiting_cancels += 1 if waiting else -1
+            if not waiting:
+                self._condition.notify_all()
+
+    def acquire(self, bucket_name):
+        '''Wait for, and take, a token from a bucket.'''
+        if bucket_name is None:
+            return
+        with self._condition:
+            self._set_waiting(bucket_name, True)
+            try:
+                wait_seconds = self._reserve(bucket_name)
+                while wait_seconds > 0:
+                    self._condition.wait(wait_seconds)
+                    wait_seconds = self._reserve(bucket_name)
+            finally:
+                self._set_waiting(bucket_name, False)
+
+    async def acquire_async(self, bucket_name):
+        '''Like acquire(), without blocking the event loop.'''
+        if bucket_name is None:
+            return
+        with self._condition:
+            self._set_waiting(bucket_name, True)
+        try:
+            while True:
+                with self._condition:
+                    wait_seconds = self._reserve(bucket_name)
+                if wait_seconds <= 0:
+                    return
+                await asyncio.sleep(wait_seconds)
+        finally:
+            with self._condition:
+                self._set_waiting(bucket_name, False)
+
+    def update(self, bucket_name, headers, status_code):
+        '''Update a bucket from the status and headers of a response.'''
+        if bucket_name is None:
+            return
+        with self._condition:
+            self._buckets[bucket_name].update(
+                headers,
+                status_code,
+                time.monotonic(),
+            )
+            self._condition.notify_all()
@@ -1,8 +1,15 @@
-from datetime import datetime
+from datetime import date
 import json
+import math
 import random
+import re
+import time
 
-import dateutil.parser as dp
+# Timestamps in the format used by the API, YYYY-MM-DDTHH:MM:SS.mmmZ.
+_API_ISO_PATTERN = re.compile(
+    r'(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)\.(\d{3})Z\Z',
+)
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
 
 
 def generate_query_path(url, params):
@@ -26,20 +33,59 @@ def random_client_id():
     return str(int(float(str(random.random())[2:])))
 
 
+# Formatted date and time of the last whole second formatted by
+# format_epoch_seconds_iso(), which is reused for timestamps within it.
+_last_formatted_second = (None, None)
+
+
+def format_epoch_seconds_iso(epoch):
+    '''
+    Format epoch seconds as YYYY-MM-DDTHH:MM:SS.mmmZ, like
+    epoch_seconds_to_iso(), formatting each second only once.
+    '''
+    # Round to microseconds and truncate to milliseconds, like datetime.
+    second = math.floor(epoch)
+    microsecond = round((epoch - second) * 1000000)
+    if microsecond == 1000000:
+        second += 1
+        microsecond = 0
+    millisecond = microsecond // 1000
+    global _last_formatted_second
+    cached_second, prefix = _last_formatted_second
+    if cached_second != second:
+        prefix = '%04d-%02d-%02dT%02d:%02d:%02d.' % time.gmtime(second)[:6]
+        _last_formatted_second = (second, prefix)
+    return '%s%03dZ' % (prefix, millisecond)
+
+
 def generate_now_iso():
-    return datetime.utcnow().strftime(
-        '%Y-%m-%dT%H:%M:%S.%f',
-    )[:-3] + 'Z'
+    return format_epoch_seconds_iso(time.time())
 
 
 def iso_to_epoch_seconds(iso):
-    return dp.parse(iso).timestamp()
+    '''
+    Parse an ISO 8601 timestamp to epoch seconds. Timestamps in the format
+    used by the API are parsed directly, and others with dateutil.
+    '''
+    match = _API_ISO_PATTERN.match(iso)
+    if match is None:
+        import dateutil.parser as dp
+
+        return dp.parse(iso).timestamp()
+    year, month, day, hour, minute, second, millisecond = map(
+        int,
+        match.groups(),
+    )
+    if hour > 23 or minute > 59 or second > 59:
+        raise ValueError('Invalid time: {}'.format(iso))
+    days = date(year, month, day).toordinal() - _EPOCH_ORDINAL
+    seconds = ((days * 24 + hour) * 60 + minute) * 60 + second
+    # Divide once, like datetime.timestamp(), for identical rounding.
+    return (seconds * 1000 + millisecond) / 1000
 
 
 def epoch_seconds_to_iso(epoch):
-    return datetime.utcfromtimestamp(epoch).strftime(
-        '%Y-%m-%dT%H:%M:%S.%f',
-    )[:-3] + 'Z'
+    return format_epoch_seconds_iso(epoch)
 
 
 def remove_nones(original):
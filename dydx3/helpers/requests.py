@@ -1,43 +1,203 @@
-import json
+import socket
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from dydx3.errors import DydxApiError
+from dydx3.helpers.json_codecs import get_json_codec
 from dydx3.helpers.request_helpers import remove_nones
 
-# TODO: Use a separate session per client instance.
-session = requests.session()
-session.headers.update({
+DEFAULT_HEADERS = {
     'Accept': 'application/json',
     'Content-Type': 'application/json',
     'User-Agent': 'dydx/python',
-})
+}
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+# Marker for response data which has not been decoded yet.
+_NOT_DECODED = object()
 
 
 class Response(object):
-    def __init__(self, data={}, headers=None):
-        self.data = data
+    """
+    Response to a request.
+
+    raw holds the body bytes as received. data, the decoded body, is only
+    decoded on first access, and is {} if the body is empty.
+    """
+
+    def __init__(
+        self,
+        data=_NOT_DECODED,
+        headers=None,
+        raw=None,
+        json_codec=None,
+    ):
+        self._data = data
         self.headers = headers
+        self.raw = raw
+        self._json_codec = json_codec
+
+    @property
+    def data(self):
+        if self._data is _NOT_DECODED:
+            if self.raw:
+                json_codec = self._json_codec or get_json_codec()
+                self._data = json_codec.loads(self.raw)
+            else:
+                self._data = {}
+        return self._data
+
+    @data.setter
+    def data(self, data):
+        self._data = data
+
+
+class _SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter which sets the given options on each new socket."""
+
+    def __init__(self, socket_options, **kwargs):
+        self.socket_options = socket_options
+        super(_SocketOptionsAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = self.socket_options
+        super(_SocketOptionsAdapter, self).init_poolmanager(*args, **kwargs)
+
+
+class Transport(object):
+    """
+    HTTP session and connection pool shared by the modules of a client.
+
+    :param pool_connections: optional, number of hosts to keep pools for
+    :type pool_connections: int
+
+    :param pool_maxsize: optional, maximum number of connections kept open
+    per host. Should be at least the number of threads sending requests
+    concurrently.
+    :type pool_maxsize: int
+
+    :param pool_block: optional, when all pooled connections are in use,
+    wait for one to be released instead of opening a throwaway connection
+    :type pool_block: bool
+
+    :param keep_alive: optional, reuse connections between requests, and
+    send TCP keep-alive probes on idle connections
+    :type keep_alive: bool
+
+    :param tcp_nodelay: optional, disable Nagle's algorithm on new
+    connections
+    :type tcp_nodelay: bool
+
+    :param json_codec: optional, codec used to encode request bodies and
+    decode responses (see get_json_codec). Defaults to the standard library
+    json module.
+    :type json_codec: object or str
+
+    :param rate_limiter: optional, scheduler pacing requests to stay within
+    the API rate limits
+    :type rate_limiter: RateLimiter
+    """
+
+    def __init__(
+        self,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=False,
+        keep_alive=True,
+        tcp_nodelay=True,
+        json_codec=None,
+        rate_limiter=None,
+    ):
+        self.json_codec = get_json_codec(json_codec)
+        self.rate_limiter = rate_limiter
+
+        socket_options = []
+        if tcp_nodelay:
+            socket_options.append(
+                (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            )
+        if keep_alive:
+            socket_options.append(
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            )
+
+        self.session = requests.session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+        adapter = _SocketOptionsAdapter(
+            socket_options,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def request(
+        self,
+        uri,
+        method,
+        headers=None,
+        data_values={},
+        api_timeout=None,
+        body=None,
+    ):
+        '''
+        Send a request. The body is data_values, serialized as JSON, unless
+        it is given already serialized as body.
+        '''
+        if body is None:
+            body = self.json_codec.dumps(remove_nones(data_values))
+        if self.rate_limiter is not None:
+            bucket = self.rate_limiter.get_bucket(method, uri)
+            self.rate_limiter.acquire(bucket)
+        response = self.send_request(
+            uri,
+            method,
+            headers,
+            data=body,
+            timeout=api_timeout
+        )
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(
+                bucket,
+                response.headers,
+                response.status_code,
+            )
+        if not str(response.status_code).startswith('2'):
+            raise DydxApiError(response)
+
+        return Response(
+            headers=response.headers,
+            raw=response.content,
+            json_codec=self.json_codec,
+        )
+
+    def send_request(self, uri, method, headers=None, **kwargs):
+        return getattr(self.session, method)(uri, headers=headers, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+# Transport used by modules which were not given one.
+default_transport = Transport()
+session = default_transport.session
 
 
 def request(uri, method, headers=None, data_values={}, api_timeout=None):
-    response = send_request(
+    return default_transport.request(
         uri,
         method,
         headers,
-        data=json.dumps(
-            remove_nones(data_values)
-        ),
-        timeout=api_timeout
+        data_values,
+        api_timeout,
     )
-    if not str(response.status_code).startswith('2'):
-        raise DydxApiError(response)
-
-    if response.content:
-        return Response(response.json(), response.headers)
-    else:
-        return Response('{}', response.headers)
 
 
 def send_request(uri, method, headers=None, **kwargs):
-    return getattr(session, method)(uri, headers=headers, **kwargs)
+    return default_transport.send_request(uri, method, headers, **kwargs)
@@ -0,0 +1,199 @@
+import asyncio
+import threading
+import time
+from collections import Counter
+from concurrent.futures import Future
+from urllib.parse import urlparse
+
+from dydx3.errors import DydxApiError
+
+# Seconds for which responses of each public endpoint are reused. Responses
+# with a TTL of 0 are only shared by concurrent callers, and kept for ETag
+# revalidation. Other endpoints are not cached.
+DEFAULT_CACHE_TTLS = {
+    'config': 60,
+    'markets': 1,
+    'stats': 10,
+    'orderbook': 0,
+}
+
+CACHE_STATS = ('hits', 'misses', 'coalesced', 'revalidated')
+
+
+class _CacheEntry(object):
+
+    def __init__(self, response, etag, expires_at):
+        self.response = response
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+def _get_endpoint(uri):
+    # E.g. 'orderbook' for https://api.dydx.exchange/v3/orderbook/BTC-USD.
+    parts = urlparse(uri).path.split('/')
+    return parts[2] if len(parts) > 2 else ''
+
+
+class ResponseCache(object):
+    '''
+    Cache of GET responses of public endpoints.
+
+    Responses are reused for the TTL of their endpoint. Once expired, a
+    response carrying an ETag is revalidated with If-None-Match, and reused
+    if the server answers 304 Not Modified. Identical GET requests in flight
+    at the same time are coalesced, so concurrent callers share a single
+    request and its response, whether the endpoint is cached or not.
+
+    Cached responses are shared, so their data must not be modified. A
+    cache is used either by synchronous or by asynchronous modules, not
+    both.
+
+    :param ttls: optional, TTL in seconds by endpoint (e.g. 'markets'),
+    overriding DEFAULT_CACHE_TTLS. A TTL of None disables caching for the
+    endpoint.
+    :type ttls: dict
+    '''
+
+    def __init__(self, ttls=None):
+        self.ttls = dict(DEFAULT_CACHE_TTLS, **(ttls or {}))
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._in_flight = {}
+        self._stats = {}
+
+    def _count(self, endpoint, stat):
+        # Must be called with the lock held.
+        self._stats.setdefault(endpoint, Counter())[stat] += 1
+
+    def get_stats(self):
+        '''
+        Get the number of hits (fresh responses reused), misses (requests
+        sent), coalesced requests (which waited for an identical one in
+        flight) and revalidated responses (answered 304) by endpoint.
+
+        :returns: dict of endpoint to dict of counts
+        '''
+        with self._lock:
+            return {
+                endpoint: {stat: counter[stat] for stat in CACHE_STATS}
+                for endpoint, counter in self._stats.items()
+            }
+
+    def clear(self):
+        '''Drop all cached responses.'''
+        with self._lock:
+            self._entries.clear()
+
+    def _start(self, uri, new_future):
+        '''
+        Look up a request. Returns the cached response, or the future of the
+        identical request in flight, or else registers new_future for this
+        one and returns the expired entry to revalidate, if any.
+        '''
+        endpoint = _get_endpoint(uri)
+        with self._lock:
+            entry = self._entries.get(uri)
+            if entry is not None and time.monotonic() < entry.expires_at:
+                self._count(endpoint, 'hits')
+                return entry.response, None, None
+            future = self._in_flight.get(uri)
+            if future is not None:
+                self._count(endpoint, 'coalesced')
+                return None, future, None
+            self._count(endpoint, 'misses')
+            self._in_flight[uri] = new_future
+            return None, None, entry
+
+    def _get_revalidation_headers(self, entry):
+        if entry is None or entry.etag is None:
+            return None
+        return {'If-None-Match': entry.etag}
+
+    def _finish(self, uri, entry, response, error):
+        '''
+        Store the response of a request, or the cached one if the server
+        answered 304. Returns the response, or raises the request's error.
+        '''
+        endpoint = _get_endpoint(uri)
+        with self._lock:
+            del self._in_flight[uri]
+            if error is not None:
+                if not (
+                    entry is not None and
+                    isinstance(error, DydxApiError) and
+                    error.status_code == 304
+                ):
+                    raise error
+                self._count(endpoint, 'revalidated')
+                response = entry.response
+            ttl = self.ttls.get(endpoint)
+            if ttl is not None:
+                headers = response.headers or {}
+                self._entries[uri] = _CacheEntry(
+                    response,
+                    headers.get('ETag', entry.etag if entry else None),
+                    time.monotonic() + ttl,
+                )
+            return response
+
+    def get(self, uri, fetch):
+        '''
+        Get the response to a GET request.
+
+        :param uri: required
+        :type uri: str
+
+        :param fetch: required, function of the extra request headers (dict
+        or None) sending the request and returning its Response
+        :type fetch: function
+
+        :returns: Response
+
+        :raises: DydxAPIError
+        '''
+        future = Future()
+        response, in_flight, entry = self._start(uri, future)
+        if response is not None:
+            return response
+        if in_flight is not None:
+            return in_flight.result()
+
+        response = error = None
+        try:
+            response = fetch(self._get_revalidation_headers(entry))
+        except BaseException as e:
+            error = e
+        try:
+            response = self._finish(uri, entry, response, error)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        future.set_result(response)
+        return response
+
+    async def get_async(self, uri, fetch):
+        '''Like get(), with fetch returning a coroutine.'''
+        future = asyncio.get_running_loop().create_future()
+        response, in_flight, entry = self._start(uri, future)
+        if response is not None:
+            return response
+        if in_flight is not None:
+            return await asyncio.shield(in_flight)
+
+        response = error = None
+        try:
+            response = await fetch(self._get_revalidation_headers(entry))
+        except BaseException as e:
+            error = e
+        try:
+            response = self._finish(uri, entry, response, error)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Retrieve it, as there may be no other caller waiting.
+            future.exception()
+            raise
+        future.set_result(response)
+        return response
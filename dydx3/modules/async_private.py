@@ -0,0 +1,161 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from dydx3.constants import DEFAULT_CREATE_ORDERS_CONCURRENCY
+from dydx3.helpers.async_requests import AsyncTransport
+from dydx3.modules.private import Private
+from dydx3.starkex.signable import sign_batch
+
+
+def _sign_signable(signable, private_key_hex, presign_pool=None):
+    # Module-level, so that it can be sent to a process pool.
+    return signable.sign(private_key_hex, presign_pool=presign_pool)
+
+
+class AsyncPrivate(Private):
+    '''
+    Asynchronous counterpart of Private. Each endpoint method takes the same
+    arguments as in Private and returns a coroutine resolving to the
+    response.
+
+    STARK signatures for orders, transfers and withdrawals are computed on
+    signing_executor (by default, the event loop's default thread pool), so
+    the event loop is not blocked while signing. Signing starts when the
+    endpoint method is called, so the signature for one order is computed
+    while earlier requests are still in flight. The request itself is
+    authenticated once the signature is ready. Endpoint methods which sign
+    must therefore be called from a running event loop.
+
+    With a ProcessPoolExecutor as signing_executor, the stark_presign_pool
+    is not used. If a stark_signer is given, it is called from the event
+    loop's default thread pool instead.
+    '''
+
+    def __init__(
+        self,
+        *args,
+        transport=None,
+        signing_executor=None,
+        **kwargs
+    ):
+        super(AsyncPrivate, self).__init__(
+            *args,
+            transport=transport or AsyncTransport(),
+            **kwargs,
+        )
+        self.signing_executor = signing_executor
+
+    # ============ Request Helpers ============
+
+    async def _private_request(
+        self,
+        method,
+        endpoint,
+        data={},
+    ):
+        signature = data.get('signature')
+        if asyncio.isfuture(signature):
+            data = dict(data, signature=await signature)
+        return await super(AsyncPrivate, self)._private_request(
+            method,
+            endpoint,
+            data,
+        )
+
+    # ============ Requests ============
+
+    async def create_orders(
+        self,
+        orders,
+        max_concurrency=DEFAULT_CREATE_ORDERS_CONCURRENCY,
+    ):
+        '''
+        Like Private.create_orders(). The orders are signed together on
+        signing_executor, and posted concurrently on the event loop.
+        '''
+        if max_concurrency < 1:
+            raise ValueError(
+                'max_concurrency must be at least 1, got {}'.format(
+                    max_concurrency,
+                ),
+            )
+        results, prepared = self._prepare_orders(orders)
+        signables = [
+            order_to_sign for _, _, order_to_sign in prepared
+            if order_to_sign is not None
+        ]
+        if signables:
+            loop = asyncio.get_running_loop()
+            if self.stark_signer is not None:
+                signatures = loop.run_in_executor(
+                    None,
+                    self._sign_stark_batch,
+                    signables,
+                )
+            elif (
+                self.stark_presign_pool is None or
+                isinstance(self.signing_executor, ProcessPoolExecutor)
+            ):
+                signatures = loop.run_in_executor(
+                    self.signing_executor,
+                    sign_batch,
+                    signables,
+                    self.stark_private_key,
+                )
+            else:
+                signatures = loop.run_in_executor(
+                    self.signing_executor,
+                    self._sign_stark_batch,
+                    signables,
+                )
+            try:
+                signatures = await signatures
+            except Exception as e:
+                signatures = e
+            prepared = self._set_order_signatures(
+                results,
+                prepared,
+                signatures,
+            )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def post(order):
+            async with semaphore:
+                try:
+                    return await self._post('orders', order)
+                except Exception as e:
+                    return e
+
+        responses = await asyncio.gather(
+            *[post(order) for _, order, _ in prepared],
+        )
+        for (i, _, _), response in zip(prepared, responses):
+            results[i] = response
+        return results
+
+    # ============ Signing ============
+
+    def _sign_stark(self, signable):
+        '''
+        Start signing on the executor. Returns an asyncio future, which is
+        awaited by _private_request() before sending the request.
+        '''
+        loop = asyncio.get_running_loop()
+        if self.stark_signer is not None:
+            return loop.run_in_executor(
+                None,
+                self.stark_signer.sign,
+                signable,
+            )
+        presign_pool = (
+            None if isinstance(self.signing_executor, ProcessPoolExecutor)
+            else self.stark_presign_pool
+        )
+        return loop.run_in_executor(
+            self.signing_executor,
+            _sign_signable,
+            signable,
+            self.stark_private_key,
+            presign_pool,
+        )
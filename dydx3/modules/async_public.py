@@ -0,0 +1,36 @@
+from dydx3.helpers.async_requests import AsyncTransport
+from dydx3.helpers.request_helpers import generate_query_path
+from dydx3.modules.public import Public
+
+
+class AsyncPublic(Public):
+    '''
+    Asynchronous counterpart of Public. Each endpoint method takes the same
+    arguments as in Public and returns a coroutine resolving to the
+    response.
+    '''
+
+    def __init__(
+        self,
+        host,
+        api_timeout=None,
+        transport=None,
+        response_cache=None,
+    ):
+        super(AsyncPublic, self).__init__(
+            host,
+            api_timeout=api_timeout,
+            transport=transport or AsyncTransport(),
+            response_cache=response_cache,
+        )
+
+    # ============ Request Helpers ============
+
+    def _get(self, request_path, params={}):
+        if self.response_cache is None:
+            return super(AsyncPublic, self)._get(request_path, params)
+        uri = generate_query_path(self.host + request_path, params)
+        return self.response_cache.get_async(
+            uri,
+            lambda headers: self._send_get(uri, headers),
+        )
@@ -2,7 +2,7 @@ from dydx3.helpers.request_helpers import generate_now_iso
 from dydx3.helpers.request_helpers import generate_query_path
 from dydx3.helpers.request_helpers import json_stringify
 from dydx3.eth_signing import SignEthPrivateAction
-from dydx3.helpers.requests import request
+from dydx3.helpers.requests import default_transport
 
 
 class EthPrivate(object):
@@ -15,10 +15,14 @@ class EthPrivate(object):
         network_id,
         default_address,
         api_timeout,
+        transport=None,
+        clock_sync=None,
     ):
         self.host = host
         self.default_address = default_address
         self.api_timeout = api_timeout
+        self.transport = transport or default_transport
+        self.clock_sync = clock_sync
 
         self.signer = SignEthPrivateAction(eth_signer, network_id)
 
@@ -34,7 +38,10 @@ class EthPrivate(object):
         ethereum_address = opt_ethereum_address or self.default_address
 
         request_path = '/'.join(['/v3', endpoint])
-        timestamp = generate_now_iso()
+        timestamp = (
+            self.clock_sync.now_iso() if self.clock_sync is not None
+            else generate_now_iso()
+        )
         signature = self.signer.sign(
             ethereum_address,
             method=method.upper(),
@@ -43,7 +50,7 @@ class EthPrivate(object):
             timestamp=timestamp,
         )
 
-        return request(
+        return self.transport.request(
             self.host + request_path,
             method,
             {
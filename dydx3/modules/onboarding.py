@@ -5,7 +5,7 @@ from web3 import Web3
 from dydx3.constants import OFF_CHAIN_ONBOARDING_ACTION
 from dydx3.constants import OFF_CHAIN_KEY_DERIVATION_ACTION
 from dydx3.eth_signing import SignOnboardingAction
-from dydx3.helpers.requests import request
+from dydx3.helpers.requests import default_transport
 from dydx3.starkex.helpers import private_key_to_public_key_pair_hex
 
 
@@ -20,10 +20,12 @@ class Onboarding(object):
         api_timeout,
         stark_public_key=None,
         stark_public_key_y_coordinate=None,
+        transport=None,
     ):
         self.host = host
         self.default_address = default_address
         self.api_timeout = api_timeout
+        self.transport = transport or default_transport
         self.stark_public_key = stark_public_key
         self.stark_public_key_y_coordinate = stark_public_key_y_coordinate
 
@@ -45,7 +47,7 @@ class Onboarding(object):
         )
 
         request_path = '/'.join(['/v3', endpoint])
-        return request(
+        return self.transport.request(
             self.host + request_path,
             'post',
             {
@@ -1,14 +1,17 @@
 import hmac
 import hashlib
 import base64
+from concurrent.futures import ThreadPoolExecutor
 
 from dydx3.constants import COLLATERAL_ASSET
 from dydx3.constants import COLLATERAL_TOKEN_DECIMALS
+from dydx3.constants import DEFAULT_CREATE_ORDERS_CONCURRENCY
 from dydx3.constants import FACT_REGISTRY_CONTRACT
 from dydx3.constants import NETWORK_ID_SEPOLIA
 from dydx3.constants import TIME_IN_FORCE_GTT
 from dydx3.constants import TOKEN_CONTRACTS
 from dydx3.helpers.db import get_account_id
+from dydx3.helpers.pagination import iter_pages
 from dydx3.helpers.request_helpers import epoch_seconds_to_iso
 from dydx3.helpers.request_helpers import generate_now_iso
 from dydx3.helpers.request_helpers import generate_query_path
@@ -16,10 +19,11 @@ from dydx3.helpers.request_helpers import random_client_id
 from dydx3.helpers.request_helpers import iso_to_epoch_seconds
 from dydx3.helpers.request_helpers import json_stringify
 from dydx3.helpers.request_helpers import remove_nones
-from dydx3.helpers.requests import request
+from dydx3.helpers.requests import default_transport
 from dydx3.starkex.helpers import get_transfer_erc20_fact
 from dydx3.starkex.helpers import nonce_from_client_id
 from dydx3.starkex.order import SignableOrder
+from dydx3.starkex.signable import sign_batch as sign_stark_batch
 from dydx3.starkex.withdrawal import SignableWithdrawal
 from dydx3.starkex.conditional_transfer import SignableConditionalTransfer
 from dydx3.starkex.transfer import SignableTransfer
@@ -35,6 +39,10 @@ class Private(object):
         default_address,
         api_timeout,
         api_key_credentials,
+        stark_presign_pool=None,
+        stark_signer=None,
+        transport=None,
+        clock_sync=None,
     ):
         self.host = host
         self.network_id = network_id
@@ -42,6 +50,12 @@ class Private(object):
         self.default_address = default_address
         self.api_timeout = api_timeout
         self.api_key_credentials = api_key_credentials
+        self.stark_presign_pool = stark_presign_pool
+        self.stark_signer = stark_signer
+        self.transport = transport or default_transport
+        self.clock_sync = clock_sync
+        self._request_auth = None
+        self._request_auth_credentials = None
 
     # ============ Request Helpers ============
 
@@ -51,27 +65,54 @@ class Private(object):
         endpoint,
         data={},
     ):
-        now_iso_string = generate_now_iso()
+        now_iso_string = (
+            self.clock_sync.now_iso() if self.clock_sync is not None
+            else generate_now_iso()
+        )
         request_path = '/'.join(['/v3', endpoint])
-        signature = self.sign(
-            request_path=request_path,
-            method=method.upper(),
-            iso_timestamp=now_iso_string,
-            data=remove_nones(data),
+
+        # Serialize the body once, and sign and send exactly those bytes.
+        data = remove_nones(data)
+        body = self.transport.json_codec.dumps(data) if data else b''
+        hmac_key, headers = self._get_request_auth()
+        headers = dict(headers)
+        headers['DYDX-SIGNATURE'] = self._sign_request_body(
+            hmac_key,
+            request_path,
+            method.upper(),
+            now_iso_string,
+            body,
         )
-        headers = {
-            'DYDX-SIGNATURE': signature,
-            'DYDX-API-KEY': self.api_key_credentials['key'],
-            'DYDX-TIMESTAMP': now_iso_string,
-            'DYDX-PASSPHRASE': self.api_key_credentials['passphrase'],
-        }
-        return request(
+        headers['DYDX-TIMESTAMP'] = now_iso_string
+        return self.transport.request(
             self.host + request_path,
             method,
             headers,
-            data,
-            self.api_timeout,
+            api_timeout=self.api_timeout,
+            body=body,
+        )
+
+    def _get_request_auth(self):
+        '''
+        Get the decoded HMAC key and the constant authentication headers,
+        computed once per set of API key credentials.
+        '''
+        credentials = (
+            self.api_key_credentials['key'],
+            self.api_key_credentials['secret'],
+            self.api_key_credentials['passphrase'],
         )
+        if self._request_auth_credentials != credentials:
+            key, secret, passphrase = credentials
+            self._request_auth = (
+                base64.urlsafe_b64decode(secret.encode('utf-8')),
+                {
+                    'DYDX-API-KEY': key,
+                    'DYDX-PASSPHRASE': passphrase,
+                },
+            )
+            self._request_auth_credentials = credentials
+        return self._request_auth
 
     def _get(self, endpoint, params):
         return self._private_request(
@@ -99,6 +140,119 @@ class Private(object):
             generate_query_path(endpoint, params),
         )
 
+    def _prepare_order(
+        self,
+        position_id,
+        market,
+        side,
+        order_type,
+        post_only,
+        size,
+        price,
+        limit_fee,
+        time_in_force=None,
+        cancel_id=None,
+        trigger_price=None,
+        trailing_percent=None,
+        client_id=None,
+        expiration=None,
+        expiration_epoch_seconds=None,
+        signature=None,
+        reduce_only=None
+    ):
+        '''
+        Build the body of an order, and the SignableOrder to sign for it if
+        no signature is given.
+        '''
+        client_id = client_id or random_client_id()
+        if bool(expiration) == bool(expiration_epoch_seconds):
+            raise ValueError(
+                'Exactly one of expiration and expiration_epoch_seconds must '
+                'be specified',
+            )
+        expiration = expiration or epoch_seconds_to_iso(
+            expiration_epoch_seconds,
+        )
+        expiration_epoch_seconds = (
+            expiration_epoch_seconds or iso_to_epoch_seconds(expiration)
+        )
+
+        order_to_sign = None
+        if not signature:
+            if not (self.stark_private_key or self.stark_signer):
+                raise Exception(
+                    'No signature provided and client was not ' +
+                    'initialized with stark_private_key'
+                )
+            order_to_sign = SignableOrder(
+                network_id=self.network_id,
+                position_id=position_id,
+                client_id=client_id,
+                market=market,
+                side=side,
+                human_size=size,
+                human_price=price,
+                limit_fee=limit_fee,
+                expiration_epoch_seconds=expiration_epoch_seconds,
+            )
+
+        order = {
+            'market': market,
+            'side': side,
+            'type': order_type,
+            'timeInForce': time_in_force or TIME_IN_FORCE_GTT,
+            'size': size,
+            'price': price,
+            'limitFee': limit_fee,
+            'expiration': expiration,
+            'cancelId': cancel_id,
+            'triggerPrice': trigger_price,
+            'trailingPercent': trailing_percent,
+            'postOnly': post_only,
+            'clientId': client_id,
+            'signature': signature,
+            'reduceOnly': reduce_only,
+        }
+
+        return order, order_to_sign
+
+    def _prepare_orders(self, orders):
+        '''
+        Prepare orders for create_orders(). Returns the results list, with
+        the exception raised for each order which could not be prepared, and
+        (index, order, order_to_sign) for the others.
+        '''
+        results = [None] * len(orders)
+        prepared = []
+        for i, order_params in enumerate(orders):
+            try:
+                prepared.append((i,) + self._prepare_order(**order_params))
+            except Exception as e:
+                results[i] = e
+        return results, prepared
+
+    def _set_order_signatures(self, results, prepared, signatures):
+        '''
+        Set the signatures of prepared orders. signatures may instead be the
+        exception raised while signing them, which is then stored as the
+        result of each order which needed a signature. Returns the prepared
+        orders left to post.
+        '''
+        if isinstance(signatures, Exception):
+            for i, _, order_to_sign in prepared:
+                if order_to_sign is not None:
+                    results[i] = signatures
+            return [
+                (i, order, order_to_sign)
+                for i, order, order_to_sign in prepared
+                if order_to_sign is None
+            ]
+        signatures = iter(signatures)
+        for _, order, order_to_sign in prepared:
+            if order_to_sign is not None:
+                order['signature'] = next(signatures)
+        return prepared
+
     # ============ Requests ============
 
     def get_api_keys(
@@ -537,62 +691,93 @@ class Private(object):
 
         :raises: DydxAPIError
         '''
-        client_id = client_id or random_client_id()
-        if bool(expiration) == bool(expiration_epoch_seconds):
-            raise ValueError(
-                'Exactly one of expiration and expiration_epoch_seconds must '
-                'be specified',
-            )
-        expiration = expiration or epoch_seconds_to_iso(
-            expiration_epoch_seconds,
+        order, order_to_sign = self._prepare_order(
+            position_id=position_id,
+            market=market,
+            side=side,
+            order_type=order_type,
+            post_only=post_only,
+            size=size,
+            price=price,
+            limit_fee=limit_fee,
+            time_in_force=time_in_force,
+            cancel_id=cancel_id,
+            trigger_price=trigger_price,
+            trailing_percent=trailing_percent,
+            client_id=client_id,
+            expiration=expiration,
+            expiration_epoch_seconds=expiration_epoch_seconds,
+            signature=signature,
+            reduce_only=reduce_only,
         )
-        expiration_epoch_seconds = (
-            expiration_epoch_seconds or iso_to_epoch_seconds(expiration)
-        )
-
-        order_signature = signature
-        if not order_signature:
-            if not self.stark_private_key:
-                raise Exception(
-                    'No signature provided and client was not ' +
-                    'initialized with stark_private_key'
-                )
-            order_to_sign = SignableOrder(
-                network_id=self.network_id,
-                position_id=position_id,
-                client_id=client_id,
-                market=market,
-                side=side,
-                human_size=size,
-                human_price=price,
-                limit_fee=limit_fee,
-                expiration_epoch_seconds=expiration_epoch_seconds,
-            )
-            order_signature = order_to_sign.sign(self.stark_private_key)
-
-        order = {
-            'market': market,
-            'side': side,
-            'type': order_type,
-            'timeInForce': time_in_force or TIME_IN_FORCE_GTT,
-            'size': size,
-            'price': price,
-            'limitFee': limit_fee,
-            'expiration': expiration,
-            'cancelId': cancel_id,
-            'triggerPrice': trigger_price,
-            'trailingPercent': trailing_percent,
-            'postOnly': post_only,
-            'clientId': client_id,
-            'signature': order_signature,
-            'reduceOnly': reduce_only,
-        }
+        if order_to_sign is not None:
+            order['signature'] = self._sign_stark(order_to_sign)
 
         return self._post(
             'orders',
             order,
         )
 
+    def create_orders(
+        self,
+        orders,
+        max_concurrency=DEFAULT_CREATE_ORDERS_CONCURRENCY,
+    ):
+        '''
+        Post several orders
+
+        The orders are all signed at once, in a batch or on the stark_signer,
+        and then posted concurrently. An order with invalid arguments, or
+        which is rejected, does not prevent the others from being posted.
+
+        :param orders: required, the arguments of create_order() for each
+        order
+        :type orders: list of dict
+
+        :param max_concurrency: optional, maximum number of orders posted at
+        the same time. Should not exceed the pool_maxsize of the transport.
+        :type max_concurrency: int
+
+        :returns: list with, for each order in input order, the Order, or the
+        exception raised for that order (e.g. DydxAPIError, or the error of
+        the signer)
+
+        :raises: ValueError if max_concurrency is less than 1
+        '''
+        if max_concurrency < 1:
+            raise ValueError(
+                'max_concurrency must be at least 1, got {}'.format(
+                    max_concurrency,
+                ),
+            )
+        results, prepared = self._prepare_orders(orders)
+        try:
+            signatures = self._sign_stark_batch([
+                order_to_sign for _, _, order_to_sign in prepared
+                if order_to_sign is not None
+            ])
+        except Exception as e:
+            signatures = e
+        prepared = self._set_order_signatures(results, prepared, signatures)
+
+        def post(order):
+            try:
+                return self._post('orders', order)
+            except Exception as e:
+                return e
+
+        if prepared:
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(prepared)),
+            ) as executor:
+                responses = executor.map(
+                    post,
+                    [order for _, order, _ in prepared],
+                )
+                for (i, _, _), response in zip(prepared, responses):
+                    results[i] = response
+        return results
+
     def cancel_order(
         self,
         order_id,
@@ -813,7 +998,7 @@ class Private(object):
         )
 
         if not signature:
-            if not self.stark_private_key:
+            if not (self.stark_private_key or self.stark_signer):
                 raise Exception(
                     'No signature provided and client was not' +
                     'initialized with stark_private_key'
@@ -825,7 +1010,7 @@ class Private(object):
                 human_amount=amount,
                 expiration_epoch_seconds=expiration_epoch_seconds,
             )
-            signature = withdrawal_to_sign.sign(self.stark_private_key)
+            signature = self._sign_stark(withdrawal_to_sign)
 
         params = {
             'amount': amount,
@@ -898,7 +1083,7 @@ class Private(object):
 
         transfer_signature = signature
         if not transfer_signature:
-            if not self.stark_private_key:
+            if not (self.stark_private_key or self.stark_signer):
                 raise Exception(
                     'No signature provided and client was not'
                     + 'initialized with stark_private_key'
@@ -912,7 +1097,7 @@ class Private(object):
                 client_id=client_id,
                 expiration_epoch_seconds=expiration_epoch_seconds,
             )
-            transfer_signature = transfer_to_sign.sign(self.stark_private_key)
+            transfer_signature = self._sign_stark(transfer_to_sign)
 
         params = {
             'amount': amount,
@@ -998,7 +1183,7 @@ class Private(object):
         )
 
         if not signature:
-            if not self.stark_private_key:
+            if not (self.stark_private_key or self.stark_signer):
                 raise Exception(
                     'No signature provided and client was not' +
                     'initialized with stark_private_key'
@@ -1023,7 +1208,7 @@ class Private(object):
                 client_id=client_id,
                 expiration_epoch_seconds=expiration_epoch_seconds,
             )
-            signature = transfer_to_sign.sign(self.stark_private_key)
+            signature = self._sign_stark(transfer_to_sign)
 
         params = {
             'creditAsset': credit_asset,
@@ -1276,8 +1461,210 @@ class Private(object):
         '''
         return self._get('users/links/requests', {})
 
+    # ============ Paginated Requests ============
+
+    def iter_orders(
+        self,
+        market=None,
+        status=None,
+        side=None,
+        order_type=None,
+        limit=None,
+        created_before_or_at=None,
+        prefetch=False,
+    ):
+        '''
+        Iterate over orders, newest first, across all pages. Takes the same
+        arguments as get_orders, where limit is the page size.
+
+        :param prefetch: optional, fetch the next page on a background
+        thread while the current one is being consumed
+        :type prefetch: bool
+
+        :returns: generator of Order
+
+        :raises: DydxAPIError, PaginationError
+        '''
+        return iter_pages(
+            lambda cursor: self.get_orders(
+                market=market,
+                status=status,
+                side=side,
+                order_type=order_type,
+                limit=limit,
+                created_before_or_at=cursor,
+            ),
+            'orders',
+            'createdAt',
+            before_or_at=created_before_or_at,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    def iter_positions(
+        self,
+        market=None,
+        status=None,
+        limit=None,
+        created_before_or_at=None,
+        prefetch=False,
+    ):
+        '''
+        Iterate over positions, newest first, across all pages. Takes the
+        same arguments as get_positions, where limit is the page size.
+
+        :param prefetch: optional, fetch the next page on a background
+        thread while the current one is being consumed
+        :type prefetch: bool
+
+        :returns: generator of Position
+
+        :raises: DydxAPIError, PaginationError
+        '''
+        return iter_pages(
+            lambda cursor: self.get_positions(
+                market=market,
+                status=status,
+                limit=limit,
+                created_before_or_at=cursor,
+            ),
+            'positions',
+            'createdAt',
+            before_or_at=created_before_or_at,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    def iter_fills(
+        self,
+        market=None,
+        order_id=None,
+        limit=None,
+        created_before_or_at=None,
+        prefetch=False,
+    ):
+        '''
+        Iterate over fills, newest first, across all pages. Takes the same
+        arguments as get_fills, where limit is the page size.
+
+        :param prefetch: optional, fetch the next page on a background
+        thread while the current one is being consumed
+        :type prefetch: bool
+
+        :returns: generator of Fill
+
+        :raises: DydxAPIError, PaginationError
+        '''
+        return iter_pages(
+            lambda cursor: self.get_fills(
+                market=market,
+                order_id=order_id,
+                limit=limit,
+                created_before_or_at=cursor,
+            ),
+            'fills',
+            'createdAt',
+            before_or_at=created_before_or_at,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    def iter_transfers(
+        self,
+        transfer_type=None,
+        limit=None,
+        created_before_or_at=None,
+        prefetch=False,
+    ):
+        '''
+        Iterate over transfers, newest first, across all pages. Takes the
+        same arguments as get_transfers, where limit is the page size.
+
+        :param prefetch: optional, fetch the next page on a background
+        thread while the current one is being consumed
+        :type prefetch: bool
+
+        :returns: generator of Transfer
+
+        :raises: DydxAPIError, PaginationError
+        '''
+        return iter_pages(
+            lambda cursor: self.get_transfers(
+                transfer_type=transfer_type,
+                limit=limit,
+                created_before_or_at=cursor,
+            ),
+            'transfers',
+            'createdAt',
+            before_or_at=created_before_or_at,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
+    def iter_funding_payments(
+        self,
+        market=None,
+        limit=None,
+        effective_before_or_at=None,
+        prefetch=False,
+    ):
+        '''
+        Iterate over funding payments, newest first, across all pages. Takes
+        the same arguments as get_funding_payments, where limit is the page
+        size.
+
+        :param prefetch: optional, fetch the next page on a background
+        thread while the current one is being consumed
+        :type prefetch: bool
+
+        :returns: generator of FundingPayment
+
+        :raises: DydxAPIError, PaginationError
+        '''
+        return iter_pages(
+            lambda cursor: self.get_funding_payments(
+                market=market,
+                limit=limit,
+                effective_before_or_at=cursor,
+            ),
+            'fundingPayments',
+            'effectiveAt',
+            before_or_at=effective_before_or_at,
+            limit=limit,
+            prefetch=prefetch,
+        )
+
     # ============ Signing ============
 
+    def _sign_stark_batch(self, signables):
+        '''Sign several objects. Returns the signatures, in order.'''
+        if not signables:
+            return []
+        if self.stark_signer is not None:
+            sign_batch = getattr(self.stark_signer, 'sign_batch', None)
+            if sign_batch is None:
+                return [
+                    self.stark_signer.sign(signable) for signable in signables
+                ]
+            return sign_batch(signables)
+        if self.stark_presign_pool is not None:
+            return [
+                signable.sign(
+                    self.stark_private_key,
+                    presign_pool=self.stark_presign_pool,
+                )
+                for signable in signables
+            ]
+        return sign_stark_batch(signables, self.stark_private_key)
+
+    def _sign_stark(self, signable):
+        if self.stark_signer is not None:
+            return self.stark_signer.sign(signable)
+        return signable.sign(
+            self.stark_private_key,
+            presign_pool=self.stark_presign_pool,
+        )
+
     def sign(
         self,
         request_path,
@@ -1285,18 +1672,23 @@ class Private(object):
         iso_timestamp,
         data,
     ):
-        message_string = (
-            iso_timestamp +
-            method +
-            request_path +
-            (json_stringify(data) if data else '')
+        hmac_key, _ = self._get_request_auth()
+        return self._sign_request_body(
+            hmac_key,
+            request_path,
+            method,
+            iso_timestamp,
+            json_stringify(data).encode('utf-8') if data else b'',
         )
 
-        hashed = hmac.new(
-            base64.urlsafe_b64decode(
-                (self.api_key_credentials['secret']).encode('utf-8'),
-            ),
-            msg=message_string.encode('utf-8'),
-            digestmod=hashlib.sha256,
-        )
-        return base64.urlsafe_b64encode(hashed.digest()).decode()
+    def _sign_request_body(
+        self,
+        hmac_key,
+        request_path,
+        method,
+        iso_timestamp,
+        body,
+    ):
+        message = (iso_timestamp + method + request_path).encode('utf-8')
+        digest = hmac.digest(hmac_key, message + body, hashlib.sha256)
+        return base64.urlsafe_b64encode(digest).decode()
@@ -1,6 +1,11 @@
 from dydx3.constants import DEFAULT_API_TIMEOUT
+from dydx3.helpers.backfill import DEFAULT_BACKFILL_WORKERS
+from dydx3.helpers.backfill import backfill_candles
+from dydx3.helpers.backfill import candles_to_columns
+from dydx3.helpers.backfill import import_numpy
+from dydx3.helpers.pagination import iter_pages
 from dydx3.helpers.request_helpers import generate_query_path
-from dydx3.helpers.requests import request
+from dydx3.helpers.requests import default_transport
 
 
 class Public(object):
@@ -9,21 +14,35 @@ class Public(object):
         self,
         host,
         api_timeout=None,
+        transport=None,
+        response_cache=None,
     ):
         self.host = host
         self.api_timeout = api_timeout or DEFAULT_API_TIMEOUT
+        self.transport = transport or default_transport
+        self.response_cache = response_cache
 
     # ============ Request Helpers ============
 
     def _get(self, request_path, params={}):
-        return request(
-            generate_query_path(self.host + request_path, params),
+        uri = generate_query_path(self.host + request_path, params)
+        if self.response_cache is not None:
+            return self.response_cache.get(
+                uri,
+                lambda headers: self._send_get(uri, headers),
+            )
+        return self._send_get(uri)
+
+    def _send_get(self, uri, headers=None):
+        return self.transport.request(
+            uri,
             'get',
+            headers,
             api_timeout=self.api_timeout,
         )
 
     def _put(self, endpoint, data):
-        return request(
+        return self.transport.request(
             self.host + '/v3/' + endpoint,
             'put',
             {},
@@ -160,6 +179,45 @@ class Public(object):
             {'startingBeforeOrAt': starting_before_or_at},
         )
 
+    def iter_trades(
+        self,
+        market,
+        starting_before_or_at=None,
+        prefetch=False,
+    ):
+        '''
+        Iterate over trades for a market, newest first, across all pages
+
+        :param market: required
+        :type market: str in list [
+            "BTC-USD",
+            "ETH-USD",
+            "LINK-USD",
+            ...
+        ]
+
+        :param starting_before_or_at: optional
+        :type starting_before_or_at: str
+
+        :param prefetch: optional, fetch the next page on a background
+        thread while the current one is being consumed
+        :type prefetch: bool
+
+        :returns: generator of Trade
+
+        :raises: DydxAPIError, PaginationError
+        '''
+        return iter_pages(
+            lambda cursor: self.get_trades(
+                market,
+                starting_before_or_at=cursor,
+            ),
+            'trades',
+            'createdAt',
+            before_or_at=starting_before_or_at,
+            prefetch=prefetch,
+        )
+
     def get_historical_funding(self, market, effective_before_or_at=None):
         '''
         Get historical funding for a market
@@ -271,6 +329,73 @@ class Public(object):
             },
         )
 
+    def backfill_candles(
+        self,
+        markets,
+        resolution,
+        from_iso,
+        to_iso,
+        max_workers=DEFAULT_BACKFILL_WORKERS,
+        as_columns=True,
+    ):
+        '''
+        Get all candles of one or more markets over a long time range
+
+        The range is split into windows which are fetched concurrently,
+        retrying requests which are rate limited, and stitched back together
+        without duplicates.
+
+        :param markets: required
+        :type markets: str or list of str
+
+        :param resolution: required
+        :type resolution: str in list [
+            "1DAY",
+            "4HOURS"
+            "1HOUR",
+            "30MINS",
+            "15MINS",
+            "5MINS",
+            "1MIN",
+        ]
+
+        :param from_iso: required
+        :type from_iso: str
+
+        :param to_iso: required
+        :type to_iso: str
+
+        :param max_workers: optional, number of concurrent requests
+        :type max_workers: int
+
+        :param as_columns: optional, return each market's candles as a dict
+        of NumPy arrays (requires numpy, see the numpy extra) instead of a
+        list of candles
+        :type as_columns: bool
+
+        :returns: dict of market to candles, oldest first
+
+        :raises: DydxAPIError, or ImportError before any request if
+        as_columns is set and numpy is not installed
+        '''
+        if as_columns:
+            # Fail before fetching, rather than after all of the requests.
+            import_numpy()
+        candles_by_market = backfill_candles(
+            self,
+            markets,
+            resolution,
+            from_iso,
+            to_iso,
+            max_workers=max_workers,
+        )
+        if not as_columns:
+            return candles_by_market
+        return {
+            market: candles_to_columns(candles)
+            for market, candles in candles_by_market.items()
+        }
+
     def get_time(self):
         '''
         Get api server time as iso and as epoch in seconds with MS
@@ -0,0 +1,3 @@
+from dydx3.signer.client import SignerClient
+from dydx3.signer.client import SignerError
+from dydx3.signer.server import SignerServer
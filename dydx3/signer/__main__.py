@@ -0,0 +1,67 @@
+"""
+Run a STARK signing daemon on a Unix-domain socket.
+
+    DYDX_STARK_PRIVATE_KEY=... python -m dydx3.signer --socket /tmp/signer
+
+The private key is read from the environment or from a file, never from the
+command line, where it would be visible to other users.
+"""
+
+import argparse
+import logging
+import os
+import sys
+
+from dydx3.signer.server import SignerServer
+
+PRIVATE_KEY_ENV_VAR = 'DYDX_STARK_PRIVATE_KEY'
+DEFAULT_SOCKET_PATH = '/tmp/dydx3-signer.sock'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m dydx3.signer',
+        description='Serve STARK signatures over a Unix-domain socket.',
+    )
+    parser.add_argument(
+        '--socket',
+        default=DEFAULT_SOCKET_PATH,
+        help='Path of the Unix-domain socket to listen on.',
+    )
+    parser.add_argument(
+        '--private-key-file',
+        help='File containing the STARK private key, as hex. Defaults to '
+        'the {} environment variable.'.format(PRIVATE_KEY_ENV_VAR),
+    )
+    args = parser.parse_args(argv)
+
+    if args.private_key_file:
+        with open(args.private_key_file) as f:
+            private_key_hex = f.read().strip()
+    else:
+        private_key_hex = os.environ.get(PRIVATE_KEY_ENV_VAR)
+    if not private_key_hex:
+        parser.error(
+            'No private key given; set {} or pass --private-key-file'.format(
+                PRIVATE_KEY_ENV_VAR,
+            ),
+        )
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        server = SignerServer(args.socket, private_key_hex)
+    except OSError as error:
+        logging.error('Cannot listen on %s: %s', args.socket, error)
+        return 1
+    logging.info('STARK signer listening on %s', args.socket)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+import socket
+import threading
+
+from dydx3.errors import DydxError
+from dydx3.signer import protocol
+from dydx3.starkex.helpers import serialize_signature
+
+
+class SignerError(DydxError):
+    """Raised when the signer daemon rejects a request."""
+
+
+class SignerClient(object):
+    """
+    Client for a SignerServer listening on a Unix-domain socket.
+
+    Can be passed to Client or Private as stark_signer, in place of
+    stark_private_key. Only the Starkware representation of each object is
+    sent to the server, which hashes and signs it.
+    """
+
+    def __init__(self, socket_path, timeout=None):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._sock = None
+        self._lock = threading.Lock()
+
+    def _request(self, op, payload=b''):
+        with self._lock:
+            if self._sock is None:
+                sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                sock.settimeout(self.timeout)
+                sock.connect(self.socket_path)
+                self._sock = sock
+            try:
+                protocol.send_frame(self._sock, op, payload)
+                frame = protocol.recv_frame(self._sock)
+                if frame is None:
+                    raise protocol.ProtocolError(
+                        'Signer closed the connection',
+                    )
+            except Exception:
+                self._close()
+                raise
+        status, response = frame
+        if status != protocol.STATUS_OK:
+            raise SignerError(response.decode())
+        return response
+
+    def get_public_key(self):
+        """Return the STARK public key of the signer as an int."""
+        return protocol.decode_int(self._request(protocol.OP_PUBLIC_KEY))
+
+    def get_hash(self, *elements):
+        """Return the Pedersen hash of the given field elements."""
+        return protocol.decode_int(
+            self._request(
+                protocol.OP_PEDERSEN_HASH,
+                protocol.encode_ints(elements),
+            ),
+        )
+
+    def sign_hashes(self, msg_hashes):
+        """Sign several message hashes. Returns a list of (r, s) tuples."""
+        return protocol.decode_signatures(
+            self._request(
+                protocol.OP_SIGN_HASHES,
+                protocol.encode_ints(msg_hashes),
+            ),
+        )
+
+    def sign_batch(self, signables):
+        """Sign several objects in one round trip. Returns the serialized
+        signatures, in order."""
+        signatures = protocol.decode_signatures(
+            self._request(
+                protocol.OP_SIGN_MESSAGES,
+                protocol.encode_signables(signables),
+            ),
+        )
+        return [serialize_signature(r, s) for r, s in signatures]
+
+    def sign(self, signable):
+        """Sign the object. Returns the serialized signature."""
+        return self.sign_batch([signable])[0]
+
+    def _close(self):
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def close(self):
+        with self._lock:
+            self._close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,202 @@
+"""
+Binary protocol spoken between SignerServer and SignerClient.
+
+Every request is a header of an op code (u8) and a payload length (u32),
+followed by the payload. Every response is a header of a status (u8) and a
+payload length (u32), followed by the payload, which for STATUS_ERROR is a
+UTF-8 error message. All integers are little-endian.
+
+Field elements, hashes and public keys are sent as 32-byte integers and
+signatures as r followed by s. Starkware messages (see
+Signable.to_starkware()) are sent as a signable type (u8), a network ID (u32)
+and a field count (u8), followed by the fields, each prefixed with a tag.
+"""
+
+import struct
+
+from dydx3.starkex.conditional_transfer import SignableConditionalTransfer
+from dydx3.starkex.conditional_transfer import StarkwareConditionalTransfer
+from dydx3.starkex.order import SignableOrder
+from dydx3.starkex.order import StarkwareOrder
+from dydx3.starkex.transfer import SignableTransfer
+from dydx3.starkex.transfer import StarkwareTransfer
+from dydx3.starkex.withdrawal import SignableWithdrawal
+from dydx3.starkex.withdrawal import StarkwareWithdrawal
+
+HEADER = struct.Struct('<BI')
+MESSAGE_HEADER = struct.Struct('<BIB')
+COUNT = struct.Struct('<H')
+STRING_LENGTH = struct.Struct('<H')
+
+MAX_PAYLOAD_SIZE = 1 << 24
+INT_SIZE = 32
+SIGNATURE_SIZE = 2 * INT_SIZE
+
+# ------------ Op Codes ------------
+OP_PUBLIC_KEY = 1
+OP_PEDERSEN_HASH = 2
+OP_SIGN_HASHES = 3
+OP_SIGN_MESSAGES = 4
+
+# ------------ Response Statuses ------------
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+# ------------ Field Tags ------------
+FIELD_INT = ord('i')
+FIELD_BOOL = ord('b')
+FIELD_STR = ord('s')
+
+SIGNABLE_TYPES = {
+    1: (SignableOrder, StarkwareOrder),
+    2: (SignableTransfer, StarkwareTransfer),
+    3: (SignableWithdrawal, StarkwareWithdrawal),
+    4: (SignableConditionalTransfer, StarkwareConditionalTransfer),
+}
+SIGNABLE_TYPE_IDS = {
+    signable_class: type_id
+    for type_id, (signable_class, _) in SIGNABLE_TYPES.items()
+}
+
+
+class ProtocolError(Exception):
+    pass
+
+
+def recv_exact(sock, size):
+    """Read exactly size bytes. Returns None if the peer closed the socket
+    before sending anything."""
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            if not data:
+                return None
+            raise ProtocolError('Connection closed mid-frame')
+        data += chunk
+    return bytes(data)
+
+
+def send_frame(sock, code, payload=b''):
+    sock.sendall(HEADER.pack(code, len(payload)) + payload)
+
+
+def recv_frame(sock):
+    """Read one frame. Returns (code, payload), or None on EOF."""
+    header = recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    code, size = HEADER.unpack(header)
+    if size > MAX_PAYLOAD_SIZE:
+        raise ProtocolError('Frame too large: {}'.format(size))
+    payload = recv_exact(sock, size) if size else b''
+    if payload is None:
+        raise ProtocolError('Connection closed mid-frame')
+    return code, payload
+
+
+def encode_int(value):
+    return value.to_bytes(INT_SIZE, 'little')
+
+
+def decode_int(data, offset=0):
+    return int.from_bytes(data[offset:offset + INT_SIZE], 'little')
+
+
+def encode_ints(values):
+    return b''.join(encode_int(value) for value in values)
+
+
+def decode_ints(data):
+    if len(data) % INT_SIZE:
+        raise ProtocolError('Payload is not a sequence of 32-byte integers')
+    return [
+        decode_int(data, offset)
+        for offset in range(0, len(data), INT_SIZE)
+    ]
+
+
+def encode_signatures(signatures):
+    return b''.join(encode_int(r) + encode_int(s) for r, s in signatures)
+
+
+def decode_signatures(data):
+    values = decode_ints(data)
+    return list(zip(values[0::2], values[1::2]))
+
+
+def encode_signable(signable):
+    try:
+        type_id = SIGNABLE_TYPE_IDS[type(signable)]
+    except KeyError:
+        raise ProtocolError(
+            'Unsupported signable type: {}'.format(type(signable).__name__),
+        )
+    message = signable.to_starkware()
+    parts = [MESSAGE_HEADER.pack(type_id, signable.network_id, len(message))]
+    for value in message:
+        # Check bool first, since bool is a subclass of int.
+        if isinstance(value, bool):
+            parts.append(bytes([FIELD_BOOL, value]))
+        elif isinstance(value, int):
+            parts.append(bytes([FIELD_INT]) + encode_int(value))
+        elif isinstance(value, str):
+            encoded = value.encode()
+            parts.append(
+                bytes([FIELD_STR]) +
+                STRING_LENGTH.pack(len(encoded)) +
+                encoded
+            )
+        else:
+            raise ProtocolError(
+                'Unsupported field type: {}'.format(type(value).__name__),
+            )
+    return b''.join(parts)
+
+
+def encode_signables(signables):
+    return COUNT.pack(len(signables)) + b''.join(
+        encode_signable(signable) for signable in signables
+    )
+
+
+def decode_signables(data):
+    (count,) = COUNT.unpack_from(data)
+    offset = COUNT.size
+    signables = []
+    try:
+        for _ in range(count):
+            type_id, network_id, n_fields = MESSAGE_HEADER.unpack_from(
+                data,
+                offset,
+            )
+            offset += MESSAGE_HEADER.size
+            signable_class, message_class = SIGNABLE_TYPES[type_id]
+            fields = []
+            for _ in range(n_fields):
+                tag = data[offset]
+                offset += 1
+                if tag == FIELD_INT:
+                    fields.append(decode_int(data, offset))
+                    offset += INT_SIZE
+                elif tag == FIELD_BOOL:
+                    fields.append(bool(data[offset]))
+                    offset += 1
+                elif tag == FIELD_STR:
+                    (size,) = STRING_LENGTH.unpack_from(data, offset)
+                    offset += STRING_LENGTH.size
+                    fields.append(data[offset:offset + size].decode())
+                    offset += size
+                else:
+                    raise ProtocolError('Unknown field tag: {}'.format(tag))
+            signables.append(
+                signable_class.from_starkware(
+                    network_id,
+                    message_class(*fields),
+                ),
+            )
+    except (IndexError, KeyError, TypeError, struct.error) as error:
+        raise ProtocolError('Malformed message: {}'.format(error))
+    if offset != len(data):
+        raise ProtocolError('Trailing bytes after messages')
+    return signables
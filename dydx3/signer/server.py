@@ -0,0 +1,135 @@
+import errno
+import logging
+import os
+import socket
+import socketserver
+import stat
+
+from dydx3.signer import protocol
+from dydx3.starkex.starkex_resources.proxy import get_hash
+from dydx3.starkex.starkex_resources.proxy import sign_batch
+from dydx3.starkex.starkex_resources.python_signature import get_ec_gen_table
+from dydx3.starkex.starkex_resources.python_signature import (
+    get_pedersen_table,
+)
+from dydx3.starkex.starkex_resources.python_signature import (
+    private_to_stark_key,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _remove_stale_socket(socket_path):
+    """
+    Remove the socket left behind by a signer that is no longer running.
+
+    Raises OSError if a server is listening on the socket (EADDRINUSE) or
+    if the path is not a socket (EEXIST), so that neither is taken over.
+    """
+    try:
+        mode = os.stat(socket_path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        raise OSError(errno.EEXIST, 'Not a socket', socket_path)
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(socket_path)
+    except FileNotFoundError:
+        return
+    except ConnectionRefusedError:
+        # Nothing is listening on the socket any more.
+        os.unlink(socket_path)
+        return
+    finally:
+        probe.close()
+    raise OSError(
+        errno.EADDRINUSE,
+        'A server is already listening on the socket',
+        socket_path,
+    )
+
+
+class _SignerRequestHandler(socketserver.BaseRequestHandler):
+
+    def handle(self):
+        while True:
+            try:
+                frame = protocol.recv_frame(self.request)
+            except (OSError, protocol.ProtocolError) as error:
+                logger.warning('Dropping signer connection: %s', error)
+                return
+            if frame is None:
+                return
+            op, payload = frame
+            try:
+                response = self.server.handle_op(op, payload)
+            except Exception as error:
+                protocol.send_frame(
+                    self.request,
+                    protocol.STATUS_ERROR,
+                    str(error).encode(),
+                )
+            else:
+                protocol.send_frame(
+                    self.request,
+                    protocol.STATUS_OK,
+                    response,
+                )
+
+
+class SignerServer(socketserver.ThreadingUnixStreamServer):
+    """
+    Serve STARK hashes and signatures over a Unix-domain socket.
+
+    The server owns the STARK private key and keeps the precomputed tables
+    warm, so that any number of local processes can sign through a
+    SignerClient without loading the key or the tables themselves. The socket
+    is only accessible to the user running the server.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path, private_key_hex):
+        self.socket_path = socket_path
+        self._private_key = int(private_key_hex, 16)
+        self._public_key = private_to_stark_key(self._private_key)
+
+        get_ec_gen_table()
+        get_pedersen_table()
+
+        _remove_stale_socket(socket_path)
+        old_umask = os.umask(0o177)
+        try:
+            super(SignerServer, self).__init__(
+                socket_path,
+                _SignerRequestHandler,
+            )
+        finally:
+            os.umask(old_umask)
+
+    def handle_op(self, op, payload):
+        if op == protocol.OP_PUBLIC_KEY:
+            return protocol.encode_int(self._public_key)
+        if op == protocol.OP_PEDERSEN_HASH:
+            return protocol.encode_int(
+                get_hash(*protocol.decode_ints(payload)),
+            )
+        if op == protocol.OP_SIGN_HASHES:
+            return protocol.encode_signatures(
+                sign_batch(protocol.decode_ints(payload), self._private_key),
+            )
+        if op == protocol.OP_SIGN_MESSAGES:
+            signables = protocol.decode_signables(payload)
+            return protocol.encode_signatures(
+                sign_batch(
+                    [signable.hash for signable in signables],
+                    self._private_key,
+                ),
+            )
+        raise protocol.ProtocolError('Unknown op: {}'.format(op))
+
+    def server_close(self):
+        super(SignerServer, self).server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
@@ -0,0 +1,23 @@
+# The batch signing helpers and the signing pool are imported on first
+# access, so that importing any dydx3.starkex module does not load them.
+_LAZY_EXPORTS = {
+    'sign_batch': 'dydx3.starkex.signable',
+    'verify_batch': 'dydx3.starkex.signable',
+    'SigningPool': 'dydx3.starkex.signing_pool',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(
+        'module {!r} has no attribute {!r}'.format(__name__, name),
+    )
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_EXPORTS))
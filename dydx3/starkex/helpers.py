@@ -1,11 +1,11 @@
 import decimal
 import hashlib
 
-from web3 import Web3
-
 from dydx3.constants import ASSET_RESOLUTION
-from dydx3.eth_signing.util import strip_hex_prefix
 from dydx3.starkex.constants import ORDER_FIELD_BIT_LENGTHS
+from dydx3.starkex.starkex_resources.python_signature import (
+    cache_public_key_point,
+)
 from dydx3.starkex.starkex_resources.python_signature import (
     get_random_private_key
 )
@@ -121,6 +121,8 @@ def get_transfer_erc20_fact(
                 token_decimals,
             )
         )
+    from web3 import Web3
+
     hex_bytes = Web3.solidityKeccak(
         [
             'address',
@@ -142,6 +144,10 @@ def fact_to_condition(fact_registry_address, fact):
     """Generate the condition, signed as part of a conditional transfer."""
     if not isinstance(fact, bytes):
         raise ValueError('fact must be a byte-string')
+    from web3 import Web3
+
+    from dydx3.eth_signing.util import strip_hex_prefix
+
     data = bytes.fromhex(strip_hex_prefix(fact_registry_address)) + fact
     return int(Web3.keccak(data).hex(), 16) & BIT_MASK_250
 
@@ -162,6 +168,8 @@ def private_key_from_bytes(data):
     """Generate a STARK key deterministically from binary data."""
     if not isinstance(data, bytes):
         raise ValueError('Input must be a byte-string')
+    from web3 import Web3
+
     return hex(int(Web3.keccak(data).hex(), 16) >> 5)
 
 
@@ -176,3 +184,11 @@ def private_key_to_public_key_pair_hex(private_key_hex):
     private_key_int = int(private_key_hex, 16)
     x, y = private_key_to_ec_point_on_stark_curve(private_key_int)
     return [hex(x), hex(y)]
+
+
+def cache_public_key_pair_hex(public_key_hex, public_key_y_coordinate_hex):
+    """Remember the y-coordinate of a public key, so that verifying signatures
+    for that key does not need to recover it."""
+    cache_public_key_point(
+        (int(public_key_hex, 16), int(public_key_y_coordinate_hex, 16)),
+    )
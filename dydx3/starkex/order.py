@@ -18,10 +18,12 @@ from dydx3.starkex.helpers import to_quantums_exact
 from dydx3.starkex.helpers import to_quantums_round_down
 from dydx3.starkex.helpers import to_quantums_round_up
 from dydx3.starkex.signable import Signable
+from dydx3.starkex.starkex_resources.proxy import PartialHash
 from dydx3.starkex.starkex_resources.proxy import get_hash
 
 DECIMAL_CONTEXT_ROUND_DOWN = decimal.Context(rounding=decimal.ROUND_DOWN)
 DECIMAL_CONTEXT_ROUND_UP = decimal.Context(rounding=decimal.ROUND_UP)
+MAX_CACHED_EXPIRATION_HOURS = 16
 
 StarkwareOrder = namedtuple(
     'StarkwareOrder',
@@ -127,17 +129,41 @@ class SignableOrder(Signable):
 
     def _calculate_hash(self):
         """Calculate the hash of the Starkware order."""
+        return get_hash(
+            get_hash(
+                self._calculate_assets_hash(),
+                self._calculate_part_1(),
+            ),
+            self._calculate_part_2(),
+        )
 
-        # TODO: Check values are in bounds
-
+    def _calculate_assets_hash(self):
+        """Hash of the asset IDs, which only depends on market, side and
+        network."""
         if self._message.is_buying_synthetic:
             asset_id_sell = self._message.asset_id_collateral
             asset_id_buy = self._message.asset_id_synthetic
-            quantums_amount_sell = self._message.quantums_amount_collateral
-            quantums_amount_buy = self._message.quantums_amount_synthetic
         else:
             asset_id_sell = self._message.asset_id_synthetic
             asset_id_buy = self._message.asset_id_collateral
+
+        return get_hash(
+            get_hash(
+                asset_id_sell,
+                asset_id_buy,
+            ),
+            self._message.asset_id_fee,
+        )
+
+    def _calculate_part_1(self):
+        """Packed amounts and nonce, which change with every order."""
+
+        # TODO: Check values are in bounds
+
+        if self._message.is_buying_synthetic:
+            quantums_amount_sell = self._message.quantums_amount_collateral
+            quantums_amount_buy = self._message.quantums_amount_synthetic
+        else:
             quantums_amount_sell = self._message.quantums_amount_synthetic
             quantums_amount_buy = self._message.quantums_amount_collateral
 
@@ -148,7 +174,11 @@ class SignableOrder(Signable):
         part_1 += self._message.quantums_amount_fee
         part_1 <<= ORDER_FIELD_BIT_LENGTHS['nonce']
         part_1 += self._message.nonce
+        return part_1
 
+    def _calculate_part_2(self):
+        """Packed position ID and expiration, which only depend on the
+        position and expiration hour."""
         part_2 = ORDER_PREFIX
         for _ in range(3):
             part_2 <<= ORDER_FIELD_BIT_LENGTHS['position_id']
@@ -156,18 +186,74 @@ class SignableOrder(Signable):
         part_2 <<= ORDER_FIELD_BIT_LENGTHS['expiration_epoch_hours']
         part_2 += self._message.expiration_epoch_hours
         part_2 <<= ORDER_PADDING_BITS
+        return part_2
 
-        assets_hash = get_hash(
-            get_hash(
-                asset_id_sell,
-                asset_id_buy,
-            ),
-            self._message.asset_id_fee,
+
+class OrderTemplate(object):
+    """
+    Factory for orders sharing a network, market, side and position.
+
+    The sub-hashes which only depend on these (and on the expiration hour) are
+    computed once and cached, so that hashing each new order from the template
+    only requires hashing its amounts and nonce.
+    """
+
+    def __init__(
+        self,
+        network_id,
+        market,
+        side,
+        position_id,
+    ):
+        self.network_id = network_id
+        self.market = market
+        self.side = side
+        self.position_id = position_id
+
+        self._assets_partial_hash = None
+        self._part_2_partial_hashes = {}
+
+    def create_order(
+        self,
+        human_size,
+        human_price,
+        limit_fee,
+        client_id,
+        expiration_epoch_seconds,
+    ):
+        """Create a SignableOrder whose hash is computed using the cached
+        sub-hashes."""
+        order = SignableOrder(
+            network_id=self.network_id,
+            market=self.market,
+            side=self.side,
+            position_id=self.position_id,
+            human_size=human_size,
+            human_price=human_price,
+            limit_fee=limit_fee,
+            client_id=client_id,
+            expiration_epoch_seconds=expiration_epoch_seconds,
         )
-        return get_hash(
-            get_hash(
-                assets_hash,
-                part_1,
-            ),
-            part_2,
+
+        if self._assets_partial_hash is None:
+            self._assets_partial_hash = PartialHash(
+                left=order._calculate_assets_hash(),
+            )
+
+        expiration_epoch_hours = order.to_starkware().expiration_epoch_hours
+        part_2_partial_hash = self._part_2_partial_hashes.get(
+            expiration_epoch_hours,
+        )
+        if part_2_partial_hash is None:
+            # Only a few expiration hours are live at any time.
+            if len(self._part_2_partial_hashes) >= MAX_CACHED_EXPIRATION_HOURS:
+                self._part_2_partial_hashes.clear()
+            part_2_partial_hash = PartialHash(right=order._calculate_part_2())
+            self._part_2_partial_hashes[expiration_epoch_hours] = (
+                part_2_partial_hash
+            )
+
+        order._hash = part_2_partial_hash.hash(
+            self._assets_partial_hash.hash(order._calculate_part_1()),
         )
+        return order
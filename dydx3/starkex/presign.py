@@ -0,0 +1,76 @@
+import queue
+import threading
+
+from dydx3.starkex.starkex_resources.python_signature import (
+    generate_presignatures,
+)
+from dydx3.starkex.starkex_resources.python_signature import (
+    py_sign_presigned,
+)
+
+DEFAULT_PRESIGN_POOL_SIZE = 256
+PRESIGN_BATCH_SIZE = 16
+
+
+class PresignPool(object):
+    """
+    Bounded pool of presignatures, kept full by a background thread.
+
+    A presignature is the part of a STARK signature which does not depend on
+    the message or the private key: a random nonce k and r = x(k * G). Signing
+    with a presignature only needs a few modular multiplications and one
+    inversion. Each presignature is used for exactly one signature.
+
+    Note that signatures made with a presign pool use random nonces, so unlike
+    Signable.sign() without a pool, they are not deterministic.
+    """
+
+    def __init__(self, size=DEFAULT_PRESIGN_POOL_SIZE):
+        self._presignatures = queue.Queue(maxsize=size)
+        self._closed = threading.Event()
+        self._thread = threading.Thread(
+            target=self._fill,
+            name='dydx3-presign-pool',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _fill(self):
+        while not self._closed.is_set():
+            for presignature in generate_presignatures(PRESIGN_BATCH_SIZE):
+                while not self._closed.is_set():
+                    try:
+                        self._presignatures.put(presignature, timeout=1)
+                        break
+                    except queue.Full:
+                        pass
+
+    def size(self):
+        """Return the number of presignatures currently available."""
+        return self._presignatures.qsize()
+
+    def take(self):
+        """Remove a presignature from the pool, generating one inline if the
+        pool is empty."""
+        try:
+            return self._presignatures.get_nowait()
+        except queue.Empty:
+            pass
+        while True:
+            # The candidate is dropped if its nonce is unusable, which
+            # happens with negligible probability.
+            presignatures = generate_presignatures(1)
+            if presignatures:
+                return presignatures[0]
+
+    def sign(self, msg_hash, private_key):
+        """Sign a message hash with the given private key (as an int), and
+        return the signature as an r, s pair."""
+        while True:
+            signature = py_sign_presigned(msg_hash, private_key, self.take())
+            if signature is not None:
+                return signature
+
+    def close(self):
+        """Stop refilling the pool."""
+        self._closed.set()
@@ -2,7 +2,11 @@ from dydx3.constants import COLLATERAL_ASSET_ID_BY_NETWORK_ID
 from dydx3.starkex.helpers import deserialize_signature
 from dydx3.starkex.helpers import serialize_signature
 from dydx3.starkex.starkex_resources.proxy import sign
+from dydx3.starkex.starkex_resources.proxy import sign_batch as sign_hashes
 from dydx3.starkex.starkex_resources.proxy import verify
+from dydx3.starkex.starkex_resources.proxy import (
+    verify_batch as verify_signatures,
+)
 
 
 class Signable(object):
@@ -20,6 +24,14 @@ class Signable(object):
                 '{}'.format(network_id),
             )
 
+    @classmethod
+    def from_starkware(cls, network_id, message):
+        """Create a signable object from its Starkware representation, as
+        returned by to_starkware()."""
+        signable = cls.__new__(cls)
+        Signable.__init__(signable, network_id, message)
+        return signable
+
     @property
     def hash(self):
         """Get the hash of the object."""
@@ -27,15 +39,65 @@ class Signable(object):
             self._hash = self._calculate_hash()
         return self._hash
 
-    def sign(self, private_key_hex):
-        """Sign the hash of the object using the given private key."""
-        r, s = sign(self.hash, int(private_key_hex, 16))
+    def sign(self, private_key_hex, presign_pool=None):
+        """Sign the hash of the object using the given private key.
+
+        If a PresignPool is given, sign using one of its presignatures.
+        """
+        if presign_pool is not None:
+            r, s = presign_pool.sign(self.hash, int(private_key_hex, 16))
+        else:
+            r, s = sign(self.hash, int(private_key_hex, 16))
         return serialize_signature(r, s)
 
-    def verify_signature(self, signature_hex, public_key_hex):
-        """Return True if the signature is valid for the given public key."""
+    def verify_signature(self, signature_hex, public_key_hex, fast=False):
+        """Return True if the signature is valid for the given public key.
+
+        With fast, verify in Jacobian coordinates like verify_batch(), with
+        the same result.
+        """
         r, s = deserialize_signature(signature_hex)
-        return verify(self.hash, r, s, int(public_key_hex, 16))
+        return verify(self.hash, r, s, int(public_key_hex, 16), fast=fast)
 
     def _calculate_hash(self):
         raise NotImplementedError
+
+
+def sign_batch(signables, private_key_hex):
+    """Sign the hashes of several objects using the given private key.
+
+    Returns the same signatures as calling sign() on each object, in order,
+    but shares the modular inversions across the whole batch.
+    """
+    signatures = sign_hashes(
+        [signable.hash for signable in signables],
+        int(private_key_hex, 16),
+    )
+    return [serialize_signature(r, s) for r, s in signatures]
+
+
+def verify_batch(signables, signatures_hex, public_keys_hex):
+    """Return, for each object, True if its signature is valid.
+
+    public_keys_hex may be a single public key shared by all of the objects,
+    or a list with one public key per object.
+
+    Signatures are verified in Jacobian coordinates, with the same results
+    as Signable.verify_signature(). A malformed signature is reported as
+    invalid rather than raising.
+    """
+    if isinstance(public_keys_hex, str):
+        public_keys_hex = [public_keys_hex] * len(signables)
+    if not len(signables) == len(signatures_hex) == len(public_keys_hex):
+        raise ValueError(
+            'Expected one signature and public key for each signable',
+        )
+    inputs = []
+    for signable, signature_hex, public_key_hex in zip(
+        signables,
+        signatures_hex,
+        public_keys_hex,
+    ):
+        r, s = deserialize_signature(signature_hex)
+        inputs.append((signable.hash, r, s, int(public_key_hex, 16)))
+    return verify_signatures(inputs)
@@ -0,0 +1,103 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from dydx3.starkex.signable import sign_batch
+from dydx3.starkex.starkex_resources.python_signature import get_ec_gen_table
+from dydx3.starkex.starkex_resources.python_signature import (
+    get_pedersen_table,
+)
+
+# Private key of the current worker process, set by _init_worker().
+_worker_private_key_hex = None
+
+
+def _init_worker(private_key_hex):
+    global _worker_private_key_hex
+    _worker_private_key_hex = private_key_hex
+
+    # Warm up the precomputed tables before the first message arrives.
+    get_ec_gen_table()
+    get_pedersen_table()
+
+
+def _sign_messages(messages):
+    signables = [
+        signable_class.from_starkware(network_id, message)
+        for signable_class, network_id, message in messages
+    ]
+    return sign_batch(signables, _worker_private_key_hex)
+
+
+def _sign_message(signable_class, network_id, message):
+    return _sign_messages([(signable_class, network_id, message)])[0]
+
+
+class SigningPool(object):
+    """
+    Hash and sign Starkware messages on multiple cores.
+
+    STARK signing is pure-Python big-integer arithmetic which holds the GIL,
+    so a single process only signs on one core. A SigningPool owns the STARK
+    private key and hashes and signs messages in worker processes, each with
+    warm precomputed tables. Only the Starkware representation of each object
+    (see Signable.to_starkware()) is sent to the workers.
+
+    A SigningPool can be passed to Client or Private as stark_signer.
+    """
+
+    def __init__(self, private_key_hex, max_workers=None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            initializer=_init_worker,
+            initargs=(private_key_hex,),
+        )
+
+    def submit(self, signable):
+        """Sign the object in a worker process. Returns a Future resolving
+        to the serialized signature."""
+        return self._executor.submit(
+            _sign_message,
+            type(signable),
+            signable.network_id,
+            signable.to_starkware(),
+        )
+
+    def submit_batch(self, signables):
+        """Sign several objects together in one worker process. Returns a
+        Future resolving to the list of serialized signatures."""
+        return self._executor.submit(
+            _sign_messages,
+            [
+                (type(signable), signable.network_id, signable.to_starkware())
+                for signable in signables
+            ],
+        )
+
+    def sign_batch(self, signables):
+        """Sign several objects, split evenly across the worker processes,
+        and wait for the signatures. Returns them in order."""
+        chunk_size = max(1, -(-len(signables) // self.max_workers))
+        futures = [
+            self.submit_batch(signables[i:i + chunk_size])
+            for i in range(0, len(signables), chunk_size)
+        ]
+        return [
+            signature
+            for future in futures
+            for signature in future.result()
+        ]
+
+    def sign(self, signable):
+        """Sign the object in a worker process and wait for the
+        signature."""
+        return self.submit(signable).result()
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
@@ -2,19 +2,16 @@ import ctypes
 import secrets
 import os
 from typing import Optional, Tuple
-import json
 import math
+from dydx3.starkex.starkex_resources.params import get_params
 from dydx3.starkex.starkex_resources.python_signature import (
     inv_mod_curve_size,
 )
 
-PEDERSEN_HASH_POINT_FILENAME = os.path.join(
-    os.path.dirname(__file__), 'pedersen_params.json')
-PEDERSEN_PARAMS = json.load(open(PEDERSEN_HASH_POINT_FILENAME))
+# Changes made by dYdX to share the parameters loaded by python_signature.
+EC_ORDER = get_params().EC_ORDER
 
-EC_ORDER = PEDERSEN_PARAMS['EC_ORDER']
-
-FIELD_PRIME = PEDERSEN_PARAMS['FIELD_PRIME']
+FIELD_PRIME = get_params().FIELD_PRIME
 
 N_ELEMENT_BITS_ECDSA = math.floor(math.log(FIELD_PRIME, 2))
 assert N_ELEMENT_BITS_ECDSA == 251
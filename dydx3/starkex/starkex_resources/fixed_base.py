@@ -0,0 +1,248 @@
+"""Scalar multiplication with precomputed window tables.
+
+Added by dYdX. Sums of the form sum(bit_j(m) * points[j]) over a list of
+points that is known in advance can be sped up by precomputing, for each
+group of w consecutive points, the sums of all 2^w subsets of the group. Each
+evaluation then only needs one mixed addition per w-bit window of m, and no
+doublings.
+
+This covers both multiplying a fixed point (such as the generator of the STARK
+curve) by many different scalars, where points[j] = 2^j * point, and the
+Pedersen hash, where points are the Pedersen constant points.
+"""
+import hashlib
+import struct
+from typing import List, Optional, Sequence
+
+from .math_utils import (
+    ECPoint, JACOBIAN_INFINITY, JacobianPoint, batch_jacobian_to_affine, ec_to_jacobian,
+    jacobian_add_affine, jacobian_double, jacobian_to_affine)
+
+# Serialized table layout: header, SHA-256 digest of the points the table was computed for, then
+# the affine table entries. Coordinates are encoded as fixed-width 32-byte little-endian integers.
+TABLE_MAGIC = b'DYDXSST1'
+TABLE_HEADER = struct.Struct('<8sBH32s')
+COORDINATE_BYTES = 32
+POINT_BYTES = 2 * COORDINATE_BYTES
+
+
+class SubsetSumTable(object):
+    """Precomputed subset sums of a list of points, window_bits points at a time."""
+
+    def __init__(
+        self,
+        points: Sequence[ECPoint],
+        alpha: int,
+        p: int,
+        window_bits: int,
+        rows: Optional[List[List[ECPoint]]] = None,
+    ):
+        assert len(points) % window_bits == 0
+        self.points = [(point[0], point[1]) for point in points]
+        self.alpha = alpha
+        self.p = p
+        self.window_bits = window_bits
+        self.n_windows = len(points) // window_bits
+        self.rows = rows if rows is not None else self._build_rows()
+
+    def _build_rows(self) -> List[List[ECPoint]]:
+        """
+        Computes rows[i][d] = sum(points[window_bits * i + b] for each bit b set in d), for
+        0 < d < 2^window_bits. rows[i][0] is unused and set to None.
+        """
+        row_size = 1 << self.window_bits
+        jacobian_points = []
+        for i in range(self.n_windows):
+            row = [JACOBIAN_INFINITY]
+            for d in range(1, row_size):
+                top_bit = d.bit_length() - 1
+                row.append(jacobian_add_affine(
+                    row[d - (1 << top_bit)],
+                    self.points[self.window_bits * i + top_bit],
+                    self.alpha,
+                    self.p,
+                ))
+            jacobian_points.extend(row[1:])
+        affine_points = batch_jacobian_to_affine(jacobian_points, self.p)
+        return [
+            [None] + affine_points[i * (row_size - 1):(i + 1) * (row_size - 1)]
+            for i in range(self.n_windows)
+        ]
+
+    def mult_jacobian(self, m: int, initial: JacobianPoint = JACOBIAN_INFINITY) -> JacobianPoint:
+        """
+        Returns initial + sum(points[j] for each bit j set in m), in Jacobian coordinates.
+        Assumes 0 <= m < 2^len(points).
+        """
+        assert m >= 0
+        mask = (1 << self.window_bits) - 1
+        result = initial
+        for row in self.rows:
+            if not m:
+                break
+            digit = m & mask
+            if digit:
+                result = jacobian_add_affine(result, row[digit], self.alpha, self.p)
+            m >>= self.window_bits
+        assert m == 0, 'Scalar is too large for the table.'
+        return result
+
+    def mult(self, m: int) -> ECPoint:
+        """
+        Returns sum(points[j] for each bit j set in m), in affine form.
+        """
+        return jacobian_to_affine(self.mult_jacobian(m), self.p)
+
+    def to_bytes(self) -> bytes:
+        chunks = [TABLE_HEADER.pack(
+            TABLE_MAGIC, self.window_bits, self.n_windows, _points_digest(self.points))]
+        for row in self.rows:
+            chunks.extend(_point_to_bytes(point) for point in row[1:])
+        return b''.join(chunks)
+
+    @classmethod
+    def rows_from_bytes(
+        cls,
+        data: bytes,
+        points: Sequence[ECPoint],
+        window_bits: int,
+    ) -> List[List[ECPoint]]:
+        """
+        Loads the rows of a table serialized with to_bytes(). Raises ValueError if the data does not
+        describe a table for the given points and window size.
+        """
+        row_size = (1 << window_bits) - 1
+        n_windows = len(points) // window_bits
+        if len(data) != TABLE_HEADER.size + POINT_BYTES * n_windows * row_size:
+            raise ValueError('Unexpected table size')
+        expected_header = (TABLE_MAGIC, window_bits, n_windows, _points_digest(points))
+        if TABLE_HEADER.unpack_from(data) != expected_header:
+            raise ValueError('Table was computed for different points or parameters')
+        offset = TABLE_HEADER.size
+        rows = []
+        for _ in range(n_windows):
+            row = [None]
+            for _ in range(row_size):
+                row.append(_point_from_bytes(data, offset))
+                offset += POINT_BYTES
+            rows.append(row)
+        return rows
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        points: Sequence[ECPoint],
+        alpha: int,
+        p: int,
+        window_bits: int,
+    ) -> 'SubsetSumTable':
+        rows = cls.rows_from_bytes(data, points, window_bits)
+        _check_rows(rows, points, alpha, p, window_bits)
+        return cls(points, alpha, p, window_bits, rows)
+
+
+class FixedBaseTable(SubsetSumTable):
+    """Precomputed multiples of a fixed point for fast scalar multiplication."""
+
+    def __init__(
+        self,
+        point: ECPoint,
+        alpha: int,
+        p: int,
+        n_bits: int,
+        window_bits: int = 8,
+        rows: Optional[List[List[ECPoint]]] = None,
+    ):
+        n_windows = -(-n_bits // window_bits)
+        super(FixedBaseTable, self).__init__(
+            _powers_of_two(point, alpha, p, n_windows * window_bits),
+            alpha,
+            p,
+            window_bits,
+            rows,
+        )
+        self.point = self.points[0]
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        point: ECPoint,
+        alpha: int,
+        p: int,
+        n_bits: int,
+        window_bits: int = 8,
+    ) -> 'FixedBaseTable':
+        table = cls(point, alpha, p, n_bits, window_bits, rows=[])
+        rows = cls.rows_from_bytes(data, table.points, window_bits)
+        _check_rows(rows, table.points, alpha, p, window_bits)
+        table.rows = rows
+        return table
+
+
+def _check_rows(
+    rows: List[List[ECPoint]],
+    points: Sequence[ECPoint],
+    alpha: int,
+    p: int,
+    window_bits: int,
+):
+    """
+    Raises ValueError unless every entry of loaded rows is the subset sum it stands for. A wrong
+    entry in the EC_GEN table would give a wrong r for a correct nonce k, which, together with a
+    correct signature of the same message, reveals the private key.
+
+    rows[i][2^b] must be points[window_bits * i + b]. Any other entry R = rows[i][d] must be the
+    sum of P1 = rows[i][d - 2^b] and P2 = points[window_bits * i + b], where b is the top bit of d:
+    R is on the curve, and -R is on the line through P1 and P2 and distinct from them, so that it
+    is the third point where that line meets the curve.
+    """
+    x0, y0 = points[0]
+    beta = (y0 * y0 - x0 * x0 * x0 - alpha * x0) % p
+    for i, row in enumerate(rows):
+        for d in range(1, len(row)):
+            top_bit = d.bit_length() - 1
+            x2, y2 = points[window_bits * i + top_bit]
+            x, y = row[d]
+            if d == 1 << top_bit:
+                if (x, y) != (x2, y2):
+                    raise ValueError('Table does not match the points')
+                continue
+            x1, y1 = row[d - (1 << top_bit)]
+            if (
+                (y * y - x * x * x - alpha * x - beta) % p != 0 or
+                (x1 - x2) % p == 0 or
+                (x - x1) % p == 0 or
+                (x - x2) % p == 0 or
+                ((y1 - y2) * (x1 - x) - (y1 + y) * (x1 - x2)) % p != 0
+            ):
+                raise ValueError('Corrupt table entry')
+
+
+def _powers_of_two(point: ECPoint, alpha: int, p: int, n: int) -> List[ECPoint]:
+    """
+    Returns [2^j * point for j in range(n)].
+    """
+    multiples = [ec_to_jacobian(point)]
+    for _ in range(n - 1):
+        multiples.append(jacobian_double(multiples[-1], alpha, p))
+    return batch_jacobian_to_affine(multiples, p)
+
+
+def _points_digest(points: Sequence[ECPoint]) -> bytes:
+    return hashlib.sha256(b''.join(_point_to_bytes(point) for point in points)).digest()
+
+
+def _point_to_bytes(point: ECPoint) -> bytes:
+    return (
+        point[0].to_bytes(COORDINATE_BYTES, 'little') +
+        point[1].to_bytes(COORDINATE_BYTES, 'little')
+    )
+
+
+def _point_from_bytes(data: bytes, offset: int) -> ECPoint:
+    return (
+        int.from_bytes(data[offset:offset + COORDINATE_BYTES], 'little'),
+        int.from_bytes(data[offset + COORDINATE_BYTES:offset + POINT_BYTES], 'little'),
+    )
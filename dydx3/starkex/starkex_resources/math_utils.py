@@ -15,20 +15,27 @@
 ###############################################################################
 
 
-from typing import Tuple
-
-import mpmath
-import sympy
-from sympy.core.numbers import igcdex
+import math
+from typing import List, Sequence, Tuple
 
 # A type that represents a point (x,y) on an elliptic curve.
 ECPoint = Tuple[int, int]
 
+# A type that represents a point (X,Y,Z) in Jacobian coordinates, standing for the affine point
+# (X/Z^2, Y/Z^3). The point at infinity is represented by Z == 0.
+JacobianPoint = Tuple[int, int, int]
+
+JACOBIAN_INFINITY = (1, 1, 0)
+
 
 def pi_as_string(digits: int) -> str:
     """
     Returns pi as a string of decimal digits without the decimal point ("314...").
+
+    Changed by dYdX to import mpmath on first use.
     """
+    import mpmath
+
     mpmath.mp.dps = digits  # Set number of digits.
     return '3' + str(mpmath.mp.pi)[2:]
 
@@ -36,24 +43,65 @@ def pi_as_string(digits: int) -> str:
 def is_quad_residue(n: int, p: int) -> bool:
     """
     Returns True if n is a quadratic residue mod p.
+    Changed by dYdX to use Euler's criterion instead of sympy. Assumes p is an odd prime.
     """
-    return sympy.is_quad_residue(n, p)
+    n %= p
+    return n == 0 or pow(n, (p - 1) // 2, p) == 1
 
 
 def sqrt_mod(n: int, p: int) -> int:
     """
     Finds the minimum positive integer m such that (m*m) % p == n
+    Changed by dYdX to use Cipolla's algorithm instead of sympy. Assumes p is an odd prime and n is
+    a quadratic residue mod p.
     """
-    return min(sympy.sqrt_mod(n, p, all_roots=True))
+    n %= p
+    if n == 0:
+        return 0
+    if p % 4 == 3:
+        root = pow(n, (p + 1) // 4, p)
+    else:
+        root = _cipolla_sqrt_mod(n, p)
+    assert root * root % p == n, 'n is not a quadratic residue.'
+    return min(root, p - root)
+
+
+def _cipolla_sqrt_mod(n: int, p: int) -> int:
+    """
+    Returns a square root of the quadratic residue n mod p, by computing (a + w)^((p+1)/2) in
+    F_p(w), where w^2 = a^2 - n is a quadratic non-residue.
+    """
+    a = 0
+    while True:
+        a += 1
+        w_squared = (a * a - n) % p
+        if pow(w_squared, (p - 1) // 2, p) == p - 1:
+            break
+    result_0, result_1 = 1, 0
+    base_0, base_1 = a, 1
+    e = (p + 1) // 2
+    while e:
+        if e & 1:
+            result_0, result_1 = (
+                (result_0 * base_0 + result_1 * base_1 % p * w_squared) % p,
+                (result_0 * base_1 + result_1 * base_0) % p,
+            )
+        base_0, base_1 = (
+            (base_0 * base_0 + base_1 * base_1 % p * w_squared) % p,
+            2 * base_0 * base_1 % p,
+        )
+        e >>= 1
+    return result_0
 
 
 def div_mod(n: int, m: int, p: int) -> int:
     """
     Finds a nonnegative integer 0 <= x < p such that (m * x) % p == n
+
+    Changed by dYdX to use the built-in modular inverse instead of sympy.
     """
-    a, b, c = igcdex(m, p)
-    assert c == 1
-    return (n * a) % p
+    assert math.gcd(m, p) == 1
+    return (n * pow(m, -1, p)) % p
 
 
 def ec_add(point1: ECPoint, point2: ECPoint, p: int) -> ECPoint:
@@ -98,3 +146,163 @@ def ec_mult(m: int, point: ECPoint, alpha: int, p: int) -> ECPoint:
     if m % 2 == 0:
         return ec_mult(m // 2, ec_double(point, alpha, p), alpha, p)
     return ec_add(ec_mult(m - 1, point, alpha, p), point, p)
+
+
+ # Jacobian-coordinate point arithmetic.
+ #
+ # Added by dYdX. The functions above work in affine coordinates and perform a modular inversion
+ # for every addition and doubling. The functions below defer all inversions to a single call of
+ # jacobian_to_affine() at the end of a computation.
+
+def ec_to_jacobian(point: ECPoint) -> JacobianPoint:
+    """
+    Converts a point given in affine form (x, y) to Jacobian coordinates.
+    """
+    return point[0], point[1], 1
+
+
+def jacobian_to_affine(point: JacobianPoint, p: int) -> ECPoint:
+    """
+    Converts a point given in Jacobian coordinates back to affine form (x, y).
+    Assumes the point is not the point at infinity.
+    """
+    x, y, z = point
+    assert z % p != 0, 'Point at infinity has no affine form.'
+    z_inv = div_mod(1, z, p)
+    z_inv_squared = z_inv * z_inv % p
+    return x * z_inv_squared % p, y * z_inv_squared * z_inv % p
+
+
+def jacobian_double(point: JacobianPoint, alpha: int, p: int) -> JacobianPoint:
+    """
+    Doubles a point given in Jacobian coordinates on the elliptic curve with equation
+    y^2 = x^3 + alpha*x + beta mod p.
+    """
+    x, y, z = point
+    if z == 0 or y == 0:
+        return JACOBIAN_INFINITY
+    y_squared = y * y % p
+    s = 4 * x * y_squared % p
+    z_squared = z * z % p
+    m = (3 * x * x + alpha * z_squared * z_squared) % p
+    x3 = (m * m - 2 * s) % p
+    y3 = (m * (s - x3) - 8 * y_squared * y_squared) % p
+    z3 = 2 * y * z % p
+    return x3, y3, z3
+
+
+def jacobian_add(point1: JacobianPoint, point2: JacobianPoint, alpha: int, p: int) -> JacobianPoint:
+    """
+    Adds two points given in Jacobian coordinates on the elliptic curve with equation
+    y^2 = x^3 + alpha*x + beta mod p.
+    Unlike ec_add(), handles equal points, opposite points and the point at infinity.
+    """
+    x1, y1, z1 = point1
+    x2, y2, z2 = point2
+    if z1 == 0:
+        return point2
+    if z2 == 0:
+        return point1
+    z1_squared = z1 * z1 % p
+    z2_squared = z2 * z2 % p
+    u1 = x1 * z2_squared % p
+    u2 = x2 * z1_squared % p
+    s1 = y1 * z2_squared * z2 % p
+    s2 = y2 * z1_squared * z1 % p
+    h = (u2 - u1) % p
+    r = (s2 - s1) % p
+    if h == 0:
+        if r == 0:
+            return jacobian_double(point1, alpha, p)
+        return JACOBIAN_INFINITY
+    h_squared = h * h % p
+    h_cubed = h_squared * h % p
+    u1_h_squared = u1 * h_squared % p
+    x3 = (r * r - h_cubed - 2 * u1_h_squared) % p
+    y3 = (r * (u1_h_squared - x3) - s1 * h_cubed) % p
+    z3 = h * z1 * z2 % p
+    return x3, y3, z3
+
+
+def jacobian_add_affine(point1: JacobianPoint, point2: ECPoint, alpha: int, p: int) -> JacobianPoint:
+    """
+    Adds a point given in affine form (x, y) to a point given in Jacobian coordinates.
+    This "mixed" addition is cheaper than jacobian_add() since point2 has an implicit Z == 1.
+    """
+    x1, y1, z1 = point1
+    if z1 == 0:
+        return ec_to_jacobian(point2)
+    z1_squared = z1 * z1 % p
+    u2 = point2[0] * z1_squared % p
+    s2 = point2[1] * z1_squared * z1 % p
+    h = (u2 - x1) % p
+    r = (s2 - y1) % p
+    if h == 0:
+        if r == 0:
+            return jacobian_double(point1, alpha, p)
+        return JACOBIAN_INFINITY
+    h_squared = h * h % p
+    h_cubed = h_squared * h % p
+    x1_h_squared = x1 * h_squared % p
+    x3 = (r * r - h_cubed - 2 * x1_h_squared) % p
+    y3 = (r * (x1_h_squared - x3) - y1 * h_cubed) % p
+    z3 = h * z1 % p
+    return x3, y3, z3
+
+
+def jacobian_mult(m: int, point: ECPoint, alpha: int, p: int) -> JacobianPoint:
+    """
+    Multiplies by m a point given in affine form (x, y) on the elliptic curve with equation
+    y^2 = x^3 + alpha*x + beta mod p, and returns the result in Jacobian coordinates.
+    Iterative left-to-right double-and-add; performs no modular inversions.
+    """
+    assert m >= 0
+    result = JACOBIAN_INFINITY
+    for bit in bin(m)[2:]:
+        result = jacobian_double(result, alpha, p)
+        if bit == '1':
+            result = jacobian_add_affine(result, point, alpha, p)
+    return result
+
+
+def batch_div_mod(ns: Sequence[int], ms: Sequence[int], p: int) -> List[int]:
+    """
+    Same as [div_mod(n, m, p) for n, m in zip(ns, ms)], but performs a single modular inversion
+    for the whole batch (Montgomery's trick). Assumes every m is invertible mod p.
+    """
+    prefix_products = []
+    product = 1
+    for m in ms:
+        prefix_products.append(product)
+        product = product * m % p
+    inverse = div_mod(1, product, p)
+    results = [0] * len(ms)
+    for i in range(len(ms) - 1, -1, -1):
+        results[i] = ns[i] * inverse * prefix_products[i] % p
+        inverse = inverse * ms[i] % p
+    return results
+
+
+def batch_jacobian_to_affine(points: Sequence[JacobianPoint], p: int) -> List[ECPoint]:
+    """
+    Same as [jacobian_to_affine(point, p) for point in points], but performs a single modular
+    inversion for the whole batch.
+    """
+    for point in points:
+        assert point[2] % p != 0, 'Point at infinity has no affine form.'
+    z_invs = batch_div_mod([1] * len(points), [point[2] for point in points], p)
+    results = []
+    for (x, y, _), z_inv in zip(points, z_invs):
+        z_inv_squared = z_inv * z_inv % p
+        results.append((x * z_inv_squared % p, y * z_inv_squared * z_inv % p))
+    return results
+
+
+def ec_mult_jacobian(m: int, point: ECPoint, alpha: int, p: int) -> ECPoint:
+    """
+    Multiplies by m a point on the elliptic curve with equation y^2 = x^3 + alpha*x + beta mod p.
+    Same result as ec_mult(), but computed iteratively in Jacobian coordinates with a single
+    modular inversion at the end.
+    Assumes the point is given in affine form (x, y) and that 0 < m < order(point).
+    """
+    return jacobian_to_affine(jacobian_mult(m, point, alpha, p), p)
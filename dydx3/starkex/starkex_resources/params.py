@@ -0,0 +1,124 @@
+"""Shared, lazily loaded store of the STARK curve and Pedersen hash parameters.
+
+Added by dYdX. The parameters are shipped both as the original pedersen_params.json and as
+pedersen_params.bin, a precompiled binary encoding of the same data that is memory-mapped instead
+of parsed. The file is mapped once per process, on the first call to get_params(), and each
+constant point is only decoded when it is accessed.
+
+Binary layout: header (magic, number of points), the scalars in SCALAR_NAMES order, then the x and y
+coordinates of each constant point. All integers are fixed-width 32-byte little-endian.
+
+pedersen_params.bin is regenerated from pedersen_params.json with write_params_binary().
+"""
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Sequence
+from typing import List, Union
+
+PEDERSEN_PARAMS_JSON_FILENAME = os.path.join(os.path.dirname(__file__), 'pedersen_params.json')
+PEDERSEN_PARAMS_BIN_FILENAME = os.path.join(os.path.dirname(__file__), 'pedersen_params.bin')
+
+PARAMS_MAGIC = b'DYDXPPB1'
+PARAMS_HEADER = struct.Struct('<8sH')
+SCALAR_NAMES = ('FIELD_PRIME', 'FIELD_GEN', 'EC_ORDER', 'ALPHA', 'BETA')
+INT_BYTES = 32
+
+
+def encode_params(params: dict) -> bytes:
+    """Encodes the parameters, as loaded from pedersen_params.json, in the binary layout."""
+    points = params['CONSTANT_POINTS']
+    parts = [PARAMS_HEADER.pack(PARAMS_MAGIC, len(points))]
+    parts.extend(params[name].to_bytes(INT_BYTES, 'little') for name in SCALAR_NAMES)
+    for x, y in points:
+        parts.append(x.to_bytes(INT_BYTES, 'little'))
+        parts.append(y.to_bytes(INT_BYTES, 'little'))
+    return b''.join(parts)
+
+
+def write_params_binary(
+        json_filename: str = PEDERSEN_PARAMS_JSON_FILENAME,
+        bin_filename: str = PEDERSEN_PARAMS_BIN_FILENAME):
+    with open(json_filename) as f:
+        params = json.load(f)
+    with open(bin_filename, 'wb') as f:
+        f.write(encode_params(params))
+
+
+class ConstantPoints(Sequence):
+    """
+    Read-only sequence of the Pedersen constant points, backed by the binary parameters. Points are
+    decoded on access, as [x, y] lists like in pedersen_params.json.
+    """
+
+    def __init__(self, data: Union[bytes, mmap.mmap], offset: int, n_points: int):
+        self._data = data
+        self._offset = offset
+        self._n_points = n_points
+
+    def __len__(self) -> int:
+        return self._n_points
+
+    def _point(self, index: int) -> List[int]:
+        start = self._offset + 2 * INT_BYTES * index
+        return [
+            int.from_bytes(self._data[start:start + INT_BYTES], 'little'),
+            int.from_bytes(self._data[start + INT_BYTES:start + 2 * INT_BYTES], 'little'),
+        ]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._point(i) for i in range(*index.indices(self._n_points))]
+        if index < 0:
+            index += self._n_points
+        if not 0 <= index < self._n_points:
+            raise IndexError('constant point index out of range')
+        return self._point(index)
+
+
+class PedersenParams(object):
+    """The STARK curve and Pedersen hash parameters, decoded from the binary encoding."""
+
+    def __init__(self, data: Union[bytes, mmap.mmap]):
+        magic, n_points = PARAMS_HEADER.unpack_from(data)
+        points_offset = PARAMS_HEADER.size + INT_BYTES * len(SCALAR_NAMES)
+        if magic != PARAMS_MAGIC or len(data) != points_offset + 2 * INT_BYTES * n_points:
+            raise ValueError('Invalid binary Pedersen parameters')
+        for i, name in enumerate(SCALAR_NAMES):
+            start = PARAMS_HEADER.size + INT_BYTES * i
+            setattr(self, name, int.from_bytes(data[start:start + INT_BYTES], 'little'))
+        self.CONSTANT_POINTS = ConstantPoints(data, points_offset, n_points)
+
+    def as_dict(self) -> dict:
+        """Returns the parameters in the form of pedersen_params.json (without the comments)."""
+        params = {name: getattr(self, name) for name in SCALAR_NAMES}
+        params['CONSTANT_POINTS'] = self.CONSTANT_POINTS[:]
+        return params
+
+
+_params = None
+_params_lock = threading.Lock()
+
+
+def _load_params() -> PedersenParams:
+    try:
+        with open(PEDERSEN_PARAMS_BIN_FILENAME, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # The binary file is missing (or empty): fall back to the JSON parameters.
+        with open(PEDERSEN_PARAMS_JSON_FILENAME) as f:
+            data = encode_params(json.load(f))
+    return PedersenParams(data)
+
+
+def get_params() -> PedersenParams:
+    """Returns the shared parameters, loading them on the first call."""
+    global _params
+    if _params is None:
+        with _params_lock:
+            if _params is None:
+                _params = _load_params()
+    return _params
+
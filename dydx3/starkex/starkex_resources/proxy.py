@@ -1,13 +1,22 @@
-from typing import Optional, Union
+from typing import List, Optional, Sequence, Union
 
 from dydx3.starkex.starkex_resources.cpp_signature import check_cpp_lib_path
 from dydx3.starkex.starkex_resources.cpp_signature import cpp_hash
 from dydx3.starkex.starkex_resources.cpp_signature import cpp_verify
 from dydx3.starkex.starkex_resources.python_signature import ECPoint
 from dydx3.starkex.starkex_resources.python_signature import ECSignature
+from dydx3.starkex.starkex_resources.python_signature import (
+    PartialPedersenHash,
+)
 from dydx3.starkex.starkex_resources.python_signature import py_pedersen_hash
 from dydx3.starkex.starkex_resources.python_signature import py_sign
+from dydx3.starkex.starkex_resources.python_signature import py_sign_batch
 from dydx3.starkex.starkex_resources.python_signature import py_verify
+from dydx3.starkex.starkex_resources.python_signature import py_verify_batch
+from dydx3.starkex.starkex_resources.python_signature import py_verify_fast
+from dydx3.starkex.starkex_resources.python_signature import (
+    VerificationInput,
+)
 
 
 def sign(
@@ -20,20 +29,75 @@ def sign(
     return py_sign(msg_hash=msg_hash, priv_key=priv_key, seed=seed)
 
 
+def sign_batch(
+    msg_hashes: Sequence[int],
+    priv_key: int,
+    seed: Optional[int] = None,
+) -> List[ECSignature]:
+    return py_sign_batch(msg_hashes=msg_hashes, priv_key=priv_key, seed=seed)
+
+
 def verify(
     msg_hash: int,
     r: int,
     s: int,
     public_key: Union[int, ECPoint],
+    fast: bool = False,
 ) -> bool:
+    # Note: py_verify_fast() gives the same results as py_verify(), with
+    #       Jacobian-coordinate arithmetic. It is used when requested, and
+    #       by verify_batch().
     if check_cpp_lib_path():
         return cpp_verify(msg_hash=msg_hash, r=r, s=s, stark_key=public_key)
 
+    if fast:
+        return py_verify_fast(
+            msg_hash=msg_hash, r=r, s=s, public_key=public_key,
+        )
     return py_verify(msg_hash=msg_hash, r=r, s=s, public_key=public_key)
 
 
+def verify_batch(inputs: Sequence[VerificationInput]) -> List[bool]:
+    if check_cpp_lib_path():
+        return [
+            cpp_verify(msg_hash=msg_hash, r=r, s=s, stark_key=public_key)
+            for msg_hash, r, s, public_key in inputs
+        ]
+
+    return py_verify_batch(inputs)
+
+
 def get_hash(*elements: int) -> int:
     if check_cpp_lib_path():
         return cpp_hash(*elements)
 
     return py_pedersen_hash(*elements)
+
+
+class PartialHash(object):
+    """
+    Hash of two elements where one of them is known in advance.
+
+    When hashing in Python, the partial result for the known element is
+    computed once and reused by every call to hash().
+    """
+
+    def __init__(self, left: Optional[int] = None, right: Optional[int] = None):
+        if (left is None) == (right is None):
+            raise ValueError('Exactly one of left and right must be specified')
+        self.left = left
+        self.right = right
+        self._py_partial_hash = None
+
+    def hash(self, element: int) -> int:
+        if check_cpp_lib_path():
+            if self.left is not None:
+                return cpp_hash(self.left, element)
+            return cpp_hash(element, self.right)
+
+        if self._py_partial_hash is None:
+            self._py_partial_hash = PartialPedersenHash(
+                left=self.left,
+                right=self.right,
+            )
+        return self._py_partial_hash.hash(element)
@@ -15,26 +15,41 @@
 ###############################################################################
 
 import hashlib
-import json
 import math
 import os
 import random
-from typing import Optional, Tuple, Union
+import secrets
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple, Union
 
 from ecdsa.rfc6979 import generate_k
 
-from .math_utils import ECPoint, div_mod, ec_add, ec_double, ec_mult, is_quad_residue, sqrt_mod
+from .fixed_base import FixedBaseTable, SubsetSumTable
+from .math_utils import (
+    ECPoint, JacobianPoint, batch_div_mod, batch_jacobian_to_affine, div_mod, ec_add, ec_double,
+    ec_to_jacobian, is_quad_residue, jacobian_add, jacobian_double, jacobian_to_affine, sqrt_mod)
+from .params import get_params
 
-PEDERSEN_HASH_POINT_FILENAME = os.path.join(
-    os.path.dirname(__file__), 'pedersen_params.json')
-PEDERSEN_PARAMS = json.load(open(PEDERSEN_HASH_POINT_FILENAME))
+# Changes made by dYdX to read the parameters from the shared, memory-mapped parameter store instead
+# of parsing pedersen_params.json on import. PEDERSEN_PARAMS is only built on demand, see
+# __getattr__ below.
+PARAMS = get_params()
+
+FIELD_PRIME = PARAMS.FIELD_PRIME
+FIELD_GEN = PARAMS.FIELD_GEN
+ALPHA = PARAMS.ALPHA
+BETA = PARAMS.BETA
+EC_ORDER = PARAMS.EC_ORDER
+CONSTANT_POINTS = PARAMS.CONSTANT_POINTS
+
+
+def __getattr__(name: str):
+    # Added by dYdX.
+    if name == 'PEDERSEN_PARAMS':
+        return PARAMS.as_dict()
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
-FIELD_PRIME = PEDERSEN_PARAMS['FIELD_PRIME']
-FIELD_GEN = PEDERSEN_PARAMS['FIELD_GEN']
-ALPHA = PEDERSEN_PARAMS['ALPHA']
-BETA = PEDERSEN_PARAMS['BETA']
-EC_ORDER = PEDERSEN_PARAMS['EC_ORDER']
-CONSTANT_POINTS = PEDERSEN_PARAMS['CONSTANT_POINTS']
 
 N_ELEMENT_BITS_ECDSA = math.floor(math.log(FIELD_PRIME, 2))
 assert N_ELEMENT_BITS_ECDSA == 251
@@ -54,6 +69,92 @@ assert SHIFT_POINT == [0x49ee3eba8c1600700ee1b87eb599f16716b0b1022947733551fde40
 assert EC_GEN == [0x1ef15c18599971b7beced415a40f0c7deacfd9b0d1819e03d723d8bc943cfca,
                   0x5668060aa49730b7be4801df46ec62de53ecd11abe43a32873000c36e8dc1f]
 
+# Precomputed tables (added by dYdX). Each table is built lazily on first use, or loaded from its
+# file next to pedersen_params.bin if it was previously persisted with save_precomputed_tables().
+EC_GEN_TABLE_FILENAME = os.path.join(os.path.dirname(__file__), 'ec_gen_table.bin')
+EC_GEN_TABLE_WINDOW_BITS = 8
+PEDERSEN_TABLE_FILENAME = os.path.join(os.path.dirname(__file__), 'pedersen_table.bin')
+PEDERSEN_TABLE_WINDOW_BITS = 4
+_precomputed_tables = {}
+_precomputed_tables_lock = threading.Lock()
+
+
+def _create_ec_gen_table(data: Optional[bytes] = None) -> FixedBaseTable:
+    if data is not None:
+        return FixedBaseTable.from_bytes(
+            data, EC_GEN, ALPHA, FIELD_PRIME, N_ELEMENT_BITS_HASH, EC_GEN_TABLE_WINDOW_BITS)
+    return FixedBaseTable(
+        EC_GEN, ALPHA, FIELD_PRIME, N_ELEMENT_BITS_HASH, EC_GEN_TABLE_WINDOW_BITS)
+
+
+def _create_pedersen_table(data: Optional[bytes] = None) -> SubsetSumTable:
+    # A single table over the constant points of all elements: element i is hashed by the windows
+    # covering CONSTANT_POINTS[2 + i * N_ELEMENT_BITS_HASH:2 + (i + 1) * N_ELEMENT_BITS_HASH].
+    points = CONSTANT_POINTS[2:]
+    if data is not None:
+        return SubsetSumTable.from_bytes(
+            data, points, ALPHA, FIELD_PRIME, PEDERSEN_TABLE_WINDOW_BITS)
+    return SubsetSumTable(points, ALPHA, FIELD_PRIME, PEDERSEN_TABLE_WINDOW_BITS)
+
+
+PRECOMPUTED_TABLES = {
+    EC_GEN_TABLE_FILENAME: _create_ec_gen_table,
+    PEDERSEN_TABLE_FILENAME: _create_pedersen_table,
+}
+
+
+def _get_precomputed_table(filename: str) -> SubsetSumTable:
+    table = _precomputed_tables.get(filename)
+    if table is None:
+        with _precomputed_tables_lock:
+            table = _precomputed_tables.get(filename)
+            if table is None:
+                create_table = PRECOMPUTED_TABLES[filename]
+                table = _load_precomputed_table(filename, create_table) or create_table()
+                _precomputed_tables[filename] = table
+    return table
+
+
+def _load_precomputed_table(filename: str, create_table) -> Optional[SubsetSumTable]:
+    try:
+        with open(filename, 'rb') as table_file:
+            data = table_file.read()
+    except OSError:
+        return None
+    try:
+        return create_table(data)
+    except ValueError:
+        # Stale or corrupt file; recompute the table instead.
+        return None
+
+
+def get_ec_gen_table() -> FixedBaseTable:
+    return _get_precomputed_table(EC_GEN_TABLE_FILENAME)
+
+
+def get_pedersen_table() -> SubsetSumTable:
+    return _get_precomputed_table(PEDERSEN_TABLE_FILENAME)
+
+
+def save_precomputed_tables(directory: Optional[str] = None):
+    """
+    Persists the precomputed tables, so that later processes can load them instead of computing
+    them. By default, they are written next to pedersen_params.bin.
+    """
+    for filename in PRECOMPUTED_TABLES:
+        target = filename
+        if directory is not None:
+            target = os.path.join(directory, os.path.basename(filename))
+        with open(target, 'wb') as table_file:
+            table_file.write(_get_precomputed_table(filename).to_bytes())
+
+
+def ec_gen_mult(m: int) -> ECPoint:
+    """
+    Returns m * EC_GEN, using the precomputed EC_GEN table. Assumes 0 < m < EC_ORDER.
+    """
+    return get_ec_gen_table().mult(m)
+
 
 #########
 # ECDSA #
@@ -83,6 +184,43 @@ def get_y_coordinate(stark_key_x_coordinate: int) -> int:
     return sqrt_mod(y_squared, FIELD_PRIME)
 
 
+# Bounded LRU cache of decompressed public keys, mapping x to a point (x, y) on the curve (added by
+# dYdX).
+PUBLIC_KEY_CACHE_SIZE = 4096
+_public_key_points = OrderedDict()
+_public_key_points_lock = threading.Lock()
+
+
+def decompress_public_key(stark_key: int) -> ECPoint:
+    """
+    Returns a point (x, y) on the curve with the given x coordinate (added by dYdX). Results are
+    cached per key. Note that the real y coordinate is either y or -y.
+    If x is invalid stark_key it throws an error.
+    """
+    with _public_key_points_lock:
+        point = _public_key_points.get(stark_key)
+        if point is not None:
+            _public_key_points.move_to_end(stark_key)
+            return point
+    point = (stark_key, get_y_coordinate(stark_key))
+    cache_public_key_point(point)
+    return point
+
+
+def cache_public_key_point(point: ECPoint):
+    """
+    Adds a public key point, e.g. one derived from a private key, to the decompressed public key
+    cache (added by dYdX).
+    """
+    x, y = point
+    assert (y * y - (x * x * x + ALPHA * x + BETA)) % FIELD_PRIME == 0, 'Point is not on the curve.'
+    with _public_key_points_lock:
+        _public_key_points[x] = (x, y)
+        _public_key_points.move_to_end(x)
+        while len(_public_key_points) > PUBLIC_KEY_CACHE_SIZE:
+            _public_key_points.popitem(last=False)
+
+
 def get_random_private_key() -> int:
     # NOTE: It is IMPORTANT to use a strong random function here.
     return random.randint(1, EC_ORDER - 1)
@@ -90,7 +228,7 @@ def get_random_private_key() -> int:
 
 def private_key_to_ec_point_on_stark_curve(priv_key: int) -> ECPoint:
     assert 0 < priv_key < EC_ORDER
-    return ec_mult(priv_key, EC_GEN, ALPHA, FIELD_PRIME)
+    return ec_gen_mult(priv_key)
 
 
 def private_to_stark_key(priv_key: int) -> int:
@@ -122,7 +260,8 @@ def generate_k_rfc6979(msg_hash: int, priv_key: int, seed: Optional[int] = None)
  # Copied from:
  # https://github.com/starkware-libs/starkex-resources/blob/0f08e6c55ad88c93499f71f2af4a2e7ae0185cdf/crypto/starkware/crypto/signature/signature.py
  #
- # Changes made by dYdX to function name only.
+ # Changes made by dYdX to function name, and to compute k*EC_GEN using the precomputed
+ # EC_GEN table.
 
 def py_sign(msg_hash: int, priv_key: int, seed: Optional[int] = None) -> ECSignature:
     # Note: msg_hash must be smaller than 2**N_ELEMENT_BITS_ECDSA.
@@ -142,7 +281,7 @@ def py_sign(msg_hash: int, priv_key: int, seed: Optional[int] = None) -> ECSigna
             seed += 1
 
         # Cannot fail because 0 < k < EC_ORDER and EC_ORDER is prime.
-        x = ec_mult(k, EC_GEN, ALPHA, FIELD_PRIME)[0]
+        x = ec_gen_mult(k)[0]
 
         # DIFF: in classic ECDSA, we take int(x) % n.
         r = int(x)
@@ -163,6 +302,87 @@ def py_sign(msg_hash: int, priv_key: int, seed: Optional[int] = None) -> ECSigna
         return r, s
 
 
+def py_sign_batch(
+        msg_hashes: Sequence[int], priv_key: int, seed: Optional[int] = None) -> List[ECSignature]:
+    """
+    Signs several message hashes with the same private key (added by dYdX).
+    Returns the same signatures as [py_sign(msg_hash, priv_key, seed) for msg_hash in msg_hashes],
+    but converts all of the k*EC_GEN points to affine form, and computes all of the w and s values,
+    with a single modular inversion each.
+    """
+    for msg_hash in msg_hashes:
+        assert 0 <= msg_hash < 2**N_ELEMENT_BITS_ECDSA, 'Message not signable.'
+    if not msg_hashes:
+        return []
+
+    ec_gen_table = get_ec_gen_table()
+    ks = [generate_k_rfc6979(msg_hash, priv_key, seed) for msg_hash in msg_hashes]
+    rs = [
+        point[0] for point in
+        batch_jacobian_to_affine([ec_gen_table.mult_jacobian(k) for k in ks], FIELD_PRIME)
+    ]
+
+    # With d = msg_hash + r * priv_key: w = k / d and s = d / k. Both are obtained from the
+    # inverse of k * d, so that a single batch inversion is needed.
+    signatures = [None] * len(msg_hashes)
+    valid_indices = []
+    for i, (msg_hash, r) in enumerate(zip(msg_hashes, rs)):
+        if 1 <= r < 2**N_ELEMENT_BITS_ECDSA and (msg_hash + r * priv_key) % EC_ORDER != 0:
+            valid_indices.append(i)
+    ds = {i: (msg_hashes[i] + rs[i] * priv_key) % EC_ORDER for i in valid_indices}
+    kd_invs = batch_div_mod(
+        [1] * len(valid_indices), [ks[i] * ds[i] for i in valid_indices], EC_ORDER)
+    for i, kd_inv in zip(valid_indices, kd_invs):
+        w = ks[i] * ks[i] * kd_inv % EC_ORDER
+        if 1 <= w < 2**N_ELEMENT_BITS_ECDSA:
+            signatures[i] = (rs[i], ds[i] * ds[i] * kd_inv % EC_ORDER)
+
+    # Bad values of k occur with negligible probability. Let py_sign() retry with the next seed.
+    for i, signature in enumerate(signatures):
+        if signature is None:
+            signatures[i] = py_sign(msg_hashes[i], priv_key, seed)
+    return signatures
+
+
+# A precomputed, message-independent part of a signature: (r, k^-1 mod EC_ORDER) for a random
+# nonce k. Each presignature must be used for at most one signature.
+Presignature = Tuple[int, int]
+
+
+def generate_presignatures(count: int) -> List[Presignature]:
+    """
+    Generates presignatures from cryptographically random nonces (added by dYdX). The k*EC_GEN
+    points and the inverses of k are computed with one batch inversion each.
+    """
+    ec_gen_table = get_ec_gen_table()
+    ks = [secrets.randbelow(EC_ORDER - 1) + 1 for _ in range(count)]
+    points = batch_jacobian_to_affine([ec_gen_table.mult_jacobian(k) for k in ks], FIELD_PRIME)
+    k_invs = batch_div_mod([1] * count, ks, EC_ORDER)
+    return [
+        (point[0], k_inv) for point, k_inv in zip(points, k_invs)
+        # Bad value. This fails with negligible probability.
+        if 1 <= point[0] < 2**N_ELEMENT_BITS_ECDSA
+    ]
+
+
+def py_sign_presigned(
+        msg_hash: int, priv_key: int, presignature: Presignature) -> Optional[ECSignature]:
+    """
+    Signs a message hash using a presignature (added by dYdX). Only needs a few modular
+    multiplications and one inversion. Returns None if the presignature cannot be used for this
+    message, which happens with negligible probability; a new presignature should then be used.
+    """
+    assert 0 <= msg_hash < 2**N_ELEMENT_BITS_ECDSA, 'Message not signable.'
+    r, k_inv = presignature
+    s = (msg_hash + r * priv_key) * k_inv % EC_ORDER
+    if s == 0:
+        return None
+    w = inv_mod_curve_size(s)
+    if not (1 <= w < 2**N_ELEMENT_BITS_ECDSA):
+        return None
+    return r, s
+
+
 def mimic_ec_mult_air(m: int, point: ECPoint, shift_point: ECPoint) -> ECPoint:
     """
     Computes m * point + shift_point using the same steps like the AIR and throws an exception if
@@ -185,7 +405,8 @@ def mimic_ec_mult_air(m: int, point: ECPoint, shift_point: ECPoint) -> ECPoint:
  # Copied from:
  # https://github.com/starkware-libs/starkex-resources/blob/0f08e6c55ad88c93499f71f2af4a2e7ae0185cdf/crypto/starkware/crypto/signature/signature.py
  #
- # Changes made by dYdX to function name only.
+ # Changes made by dYdX to function name, and to look up the y coordinate in the decompressed
+ # public key cache.
 
 def py_verify(msg_hash: int, r: int, s: int, public_key: Union[int, ECPoint]) -> bool:
     # Compute w = s^-1 (mod EC_ORDER).
@@ -203,7 +424,7 @@ def py_verify(msg_hash: int, r: int, s: int, public_key: Union[int, ECPoint]) ->
         # Only the x coordinate of the point is given, check the two possibilities for the y
         # coordinate.
         try:
-            y = get_y_coordinate(public_key)
+            y = decompress_public_key(public_key)[1]
         except InvalidPublicKeyError:
             return False
         assert pow(y, 2, FIELD_PRIME) == (
@@ -236,6 +457,162 @@ def py_verify(msg_hash: int, r: int, s: int, public_key: Union[int, ECPoint]) ->
     return r == x
 
 
+# A type for the inputs of a signature verification: (msg_hash, r, s, public_key).
+VerificationInput = Tuple[int, int, int, Union[int, ECPoint]]
+
+
+def py_verify_fast(msg_hash: int, r: int, s: int, public_key: Union[int, ECPoint]) -> bool:
+    """
+    Same as py_verify, computed with Jacobian-coordinate arithmetic (added by dYdX). See
+    py_verify_batch.
+    """
+    return py_verify_batch([(msg_hash, r, s, public_key)])[0]
+
+
+def _x_differs(point1: JacobianPoint, point2: JacobianPoint) -> bool:
+    """
+    Returns True if two points given in Jacobian coordinates, neither of them the point at
+    infinity, have different affine x coordinates: X1 * Z2^2 != X2 * Z1^2 (added by dYdX).
+    """
+    return (
+        point1[0] * point2[2] * point2[2] - point2[0] * point1[2] * point1[2]
+    ) % FIELD_PRIME != 0
+
+
+def _air_doublings(point: JacobianPoint) -> Optional[List[JacobianPoint]]:
+    """
+    Returns the points 2^j * point, for j < N_ELEMENT_BITS_ECDSA, that mimic_ec_mult_air adds up,
+    in Jacobian coordinates (added by dYdX). Returns None if and only if one of its ec_double
+    calls would fail, i.e. one of these points has y == 0.
+    """
+    doublings = []
+    for j in range(N_ELEMENT_BITS_ECDSA):
+        if j:
+            point = jacobian_double(point, ALPHA, FIELD_PRIME)
+        if point[1] % FIELD_PRIME == 0:
+            return None
+        doublings.append(point)
+    return doublings
+
+
+def _mimic_ec_mult_air_jacobian(
+        m: int, doublings: Sequence[JacobianPoint],
+        shift_point: JacobianPoint) -> Optional[JacobianPoint]:
+    """
+    Same as mimic_ec_mult_air(m, point, shift_point), in Jacobian coordinates, given
+    _air_doublings(point) (added by dYdX). Returns None if and only if mimic_ec_mult_air throws.
+    """
+    if not 0 < m < 2**N_ELEMENT_BITS_ECDSA:
+        return None
+    partial_sum = shift_point
+    for point in doublings:
+        if not _x_differs(partial_sum, point):
+            return None
+        if m & 1:
+            partial_sum = jacobian_add(partial_sum, point, ALPHA, FIELD_PRIME)
+        m >>= 1
+    return partial_sum
+
+
+_ec_gen_air_doublings = None
+
+
+def _get_ec_gen_air_doublings() -> List[JacobianPoint]:
+    global _ec_gen_air_doublings
+    if _ec_gen_air_doublings is None:
+        # The EC_GEN table already holds the powers of two of EC_GEN.
+        _ec_gen_air_doublings = [
+            ec_to_jacobian(point)
+            for point in get_ec_gen_table().points[:N_ELEMENT_BITS_ECDSA]
+        ]
+    return _ec_gen_air_doublings
+
+
+def _is_valid_verification_input(
+        msg_hash: int, r: int, s: int, public_key: Union[int, ECPoint]) -> bool:
+    """
+    Returns False for the inputs on which py_verify raises an AssertionError, other than the
+    w range check (added by dYdX).
+    """
+    if not (1 <= s < EC_ORDER and 1 <= r < 2**N_ELEMENT_BITS_ECDSA and
+            0 <= msg_hash < 2**N_ELEMENT_BITS_ECDSA):
+        return False
+    if isinstance(public_key, int):
+        return True
+    x, y = public_key
+    return (y * y - (x * x * x + ALPHA * x + BETA)) % FIELD_PRIME == 0
+
+
+def py_verify_batch(inputs: Sequence[VerificationInput]) -> List[bool]:
+    """
+    Verifies several signatures (added by dYdX). Returns the same results as
+    [py_verify(*verification_input) for verification_input in inputs], except that an input on
+    which py_verify raises an AssertionError, such as r == 0 or s >= EC_ORDER, is reported as
+    invalid instead.
+
+    The steps of py_verify, including the checks mimicking the AIR, are performed in Jacobian
+    coordinates: x coordinates are compared projectively, as X1 * Z2^2 != X2 * Z1^2. A single
+    batch inversion is needed for all the w values, and one for all the resulting points.
+    """
+    results = [False] * len(inputs)
+    valid_indices = [
+        i for i, verification_input in enumerate(inputs)
+        if _is_valid_verification_input(*verification_input)
+    ]
+    ws = batch_div_mod([1] * len(valid_indices), [inputs[i][2] for i in valid_indices], EC_ORDER)
+
+    ec_gen_air_doublings = _get_ec_gen_air_doublings()
+    shift_point = ec_to_jacobian(SHIFT_POINT)
+    minus_shift_point = ec_to_jacobian(MINUS_SHIFT_POINT)
+    # Candidate points, as (index of the input, Jacobian point) pairs.
+    candidates = []
+    for i, w in zip(valid_indices, ws):
+        msg_hash, r, _, public_key = inputs[i]
+        if not 1 <= w < 2**N_ELEMENT_BITS_ECDSA:
+            continue
+
+        if isinstance(public_key, int):
+            # Only the x coordinate of the point is given, check the two possibilities for the y
+            # coordinate.
+            try:
+                point = decompress_public_key(public_key)
+            except InvalidPublicKeyError:
+                continue
+            public_key_doublings = _air_doublings(ec_to_jacobian(point))
+            if public_key_doublings is None:
+                continue
+            all_public_key_doublings = [public_key_doublings, [
+                (x, (-y) % FIELD_PRIME, z) for x, y, z in public_key_doublings
+            ]]
+        else:
+            public_key_doublings = _air_doublings(ec_to_jacobian(public_key))
+            if public_key_doublings is None:
+                continue
+            all_public_key_doublings = [public_key_doublings]
+
+        zG = _mimic_ec_mult_air_jacobian(msg_hash, ec_gen_air_doublings, minus_shift_point)
+        if zG is None:
+            continue
+        for public_key_doublings in all_public_key_doublings:
+            rQ = _mimic_ec_mult_air_jacobian(r, public_key_doublings, shift_point)
+            if rQ is None or not _x_differs(zG, rQ):
+                continue
+            sum_doublings = _air_doublings(jacobian_add(zG, rQ, ALPHA, FIELD_PRIME))
+            if sum_doublings is None:
+                continue
+            wB = _mimic_ec_mult_air_jacobian(w, sum_doublings, shift_point)
+            if wB is None or not _x_differs(wB, minus_shift_point):
+                continue
+            candidates.append((i, jacobian_add(wB, minus_shift_point, ALPHA, FIELD_PRIME)))
+
+    affine_points = batch_jacobian_to_affine([point for _, point in candidates], FIELD_PRIME)
+    for (i, _), (x, _) in zip(candidates, affine_points):
+        # DIFF: Here we drop the mod n from classic ECDSA.
+        if x == inputs[i][1]:
+            results[i] = True
+    return results
+
+
 #################
 # Pedersen hash #
 #################
@@ -245,10 +622,53 @@ def py_verify(msg_hash: int, r: int, s: int, public_key: Union[int, ECPoint]) ->
  # Copied from:
  # https://github.com/starkware-libs/starkex-resources/blob/0f08e6c55ad88c93499f71f2af4a2e7ae0185cdf/crypto/starkware/crypto/signature/signature.py
  #
- # Changes made by dYdX to function name only.
+ # Changes made by dYdX to function name, and to compute the hash using the precomputed Pedersen
+ # table.
 
 def py_pedersen_hash(*elements: int) -> int:
-    return pedersen_hash_as_point(*elements)[0]
+    return jacobian_to_affine(pedersen_hash_jacobian(*elements), FIELD_PRIME)[0]
+
+
+def pedersen_hash_jacobian(*elements: int) -> JacobianPoint:
+    """
+    Same as pedersen_hash_as_point, but computed in Jacobian coordinates using the precomputed
+    Pedersen table (added by dYdX).
+    Note: Unlike pedersen_hash_as_point, this does not raise for the (negligible probability)
+    inputs that the AIR cannot hash.
+    """
+    table = get_pedersen_table()
+    assert len(elements) * N_ELEMENT_BITS_HASH <= len(table.points)
+    packed = 0
+    for i, x in enumerate(elements):
+        assert 0 <= x < FIELD_PRIME
+        packed |= x << (i * N_ELEMENT_BITS_HASH)
+    return table.mult_jacobian(packed, ec_to_jacobian(SHIFT_POINT))
+
+
+class PartialPedersenHash(object):
+    """
+    Pedersen hash of two elements where one of them is known in advance (added by dYdX).
+    The partial EC point for the known element is computed once, so that each call to hash() only
+    adds in the contribution of the other element.
+    """
+
+    def __init__(self, left: Optional[int] = None, right: Optional[int] = None):
+        assert (left is None) != (right is None), 'Exactly one element must be given.'
+        self.left = left
+        self.right = right
+        if left is not None:
+            self._partial_point = pedersen_hash_jacobian(left)
+        else:
+            self._partial_point = pedersen_hash_jacobian(0, right)
+
+    def hash(self, element: int) -> int:
+        """
+        Returns py_pedersen_hash(left, element) or py_pedersen_hash(element, right).
+        """
+        assert 0 <= element < FIELD_PRIME
+        shift = N_ELEMENT_BITS_HASH if self.left is not None else 0
+        point = get_pedersen_table().mult_jacobian(element << shift, self._partial_point)
+        return jacobian_to_affine(point, FIELD_PRIME)[0]
 
 
 def pedersen_hash_as_point(*elements: int) -> ECPoint:
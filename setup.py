@@ -23,6 +23,7 @@ setup(
         'dydx3': [
             'abi/*.json',
             'starkex/starkex_resources/*.json',
+            'starkex/starkex_resources/pedersen_params.bin',
         ],
     },
     description='dYdX Python REST API for Limit Orders',
@@ -33,17 +34,19 @@ setup(
     license='Apache 2.0',
     author_email='contact@dydx.exchange',
     install_requires=REQUIREMENTS,
+    python_requires='>=3.8',
+    extras_require={
+        # Columnar candles from Public.backfill_candles().
+        'numpy': ['numpy>=1.17.0'],
+    },
     keywords='dydx exchange rest api defi ethereum eth',
     classifiers=[
         'Intended Audience :: Developers',
         'License :: OSI Approved :: Apache Software License',
         'Operating System :: OS Independent',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
+        'Programming Language :: Python :: 3 :: Only',
+        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3.11',
         'Programming Language :: Python',
@@ -0,0 +1,76 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+ECHO_ETAG = '"echo"'
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    '''Responds to every request with a description of the request.'''
+
+    protocol_version = 'HTTP/1.1'
+
+    def _handle(self):
+        # Requests always carry a JSON body, which must be consumed before
+        # the connection can be reused.
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path.startswith('/v3/empty'):
+            self._respond(200, None)
+            return
+        if self.path.startswith('/v3/missing'):
+            self._respond(404, {'errors': [{'msg': 'Not found'}]})
+            return
+        if self.path.startswith('/v3/throttled'):
+            self._respond(
+                429,
+                {'errors': [{'msg': 'API rate limit exceeded'}]},
+                {'RateLimit-Remaining': '0', 'Retry-After': '200'},
+            )
+            return
+        # Echo responses all share an ETag, so they can be revalidated.
+        if self.headers.get('If-None-Match') == ECHO_ETAG:
+            self._respond(304, None, {'ETag': ECHO_ETAG})
+            return
+        self._respond(
+            200,
+            {
+                'method': self.command,
+                'path': self.path,
+                'port': self.client_address[1],
+                'body': json.loads(body) if body else None,
+                'raw_body': body.decode(),
+                'headers': dict(self.headers),
+            },
+            {'ETag': ECHO_ETAG},
+        )
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def _respond(self, status, data, headers={}):
+        body = json.dumps(data).encode() if data is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def host():
+    '''URL of a local HTTP server which echoes requests back as JSON.'''
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield 'http://127.0.0.1:{}'.format(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,267 @@
+import os
+import random
+import tempfile
+from collections import OrderedDict
+
+import pytest
+
+from dydx3.starkex.starkex_resources.fixed_base import POINT_BYTES
+from dydx3.starkex.starkex_resources.fixed_base import TABLE_HEADER
+from dydx3.starkex.starkex_resources.fixed_base import FixedBaseTable
+from dydx3.starkex.starkex_resources.fixed_base import SubsetSumTable
+from dydx3.starkex.starkex_resources.math_utils import ec_mult
+from dydx3.starkex.starkex_resources.math_utils import ec_mult_jacobian
+from dydx3.starkex.starkex_resources.math_utils import ec_to_jacobian
+from dydx3.starkex.starkex_resources.math_utils import jacobian_to_affine
+from dydx3.starkex.starkex_resources import python_signature
+from dydx3.starkex.starkex_resources.proxy import PartialHash
+from dydx3.starkex.starkex_resources.python_signature import ALPHA
+from dydx3.starkex.starkex_resources.python_signature import CONSTANT_POINTS
+from dydx3.starkex.starkex_resources.python_signature import EC_GEN
+from dydx3.starkex.starkex_resources.python_signature import EC_ORDER
+from dydx3.starkex.starkex_resources.python_signature import FIELD_PRIME
+from dydx3.starkex.starkex_resources.python_signature import SHIFT_POINT
+from dydx3.starkex.starkex_resources.python_signature import (
+    _air_doublings,
+)
+from dydx3.starkex.starkex_resources.python_signature import (
+    _mimic_ec_mult_air_jacobian,
+)
+from dydx3.starkex.starkex_resources.python_signature import (
+    cache_public_key_point,
+)
+from dydx3.starkex.starkex_resources.python_signature import (
+    decompress_public_key,
+)
+from dydx3.starkex.starkex_resources.python_signature import ec_gen_mult
+from dydx3.starkex.starkex_resources.python_signature import (
+    get_ec_gen_table,
+)
+from dydx3.starkex.starkex_resources.python_signature import (
+    get_pedersen_table,
+)
+from dydx3.starkex.starkex_resources.python_signature import (
+    mimic_ec_mult_air,
+)
+from dydx3.starkex.starkex_resources.python_signature import (
+    pedersen_hash_as_point,
+)
+from dydx3.starkex.starkex_resources.python_signature import py_pedersen_hash
+from dydx3.starkex.starkex_resources.python_signature import py_sign
+from dydx3.starkex.starkex_resources.python_signature import py_verify
+from dydx3.starkex.starkex_resources.python_signature import py_verify_batch
+from dydx3.starkex.starkex_resources.python_signature import py_verify_fast
+from dydx3.starkex.starkex_resources.python_signature import (
+    save_precomputed_tables,
+)
+
+SCALARS = [
+    1,
+    255,
+    256,
+    0x58c7d5a90b1776bde86ebac077e053ed85b0f7164f53b080304a531947f46e3,
+    EC_ORDER - 1,
+]
+
+
+class TestFixedBase():
+
+    def test_ec_gen_mult(self):
+        for m in SCALARS:
+            assert ec_gen_mult(m) == ec_mult_jacobian(
+                m, EC_GEN, ALPHA, FIELD_PRIME,
+            )
+
+    def test_small_window(self):
+        table = FixedBaseTable(EC_GEN, ALPHA, FIELD_PRIME, 252, window_bits=4)
+        for m in SCALARS:
+            assert table.mult(m) == ec_gen_mult(m)
+
+    def test_pedersen_hash(self):
+        rng = random.Random(0)
+        inputs = [(0, 0), (1, 0), (0, 1), (FIELD_PRIME - 1, FIELD_PRIME - 1)]
+        inputs += [
+            (rng.randrange(FIELD_PRIME), rng.randrange(FIELD_PRIME))
+            for _ in range(10)
+        ]
+        for left, right in inputs:
+            assert py_pedersen_hash(left, right) == (
+                pedersen_hash_as_point(left, right)[0]
+            )
+        assert py_pedersen_hash(12345) == pedersen_hash_as_point(12345)[0]
+
+    def test_partial_hash(self):
+        left, right = 0x1234abcd, FIELD_PRIME - 7
+        expected = py_pedersen_hash(left, right)
+        assert PartialHash(left=left).hash(right) == expected
+        assert PartialHash(right=right).hash(left) == expected
+        with pytest.raises(ValueError):
+            PartialHash()
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as directory:
+            save_precomputed_tables(directory)
+            with open(os.path.join(directory, 'ec_gen_table.bin'), 'rb') as f:
+                ec_gen_data = f.read()
+            pedersen_filename = os.path.join(directory, 'pedersen_table.bin')
+            with open(pedersen_filename, 'rb') as f:
+                pedersen_data = f.read()
+
+        ec_gen_table = FixedBaseTable.from_bytes(
+            ec_gen_data, EC_GEN, ALPHA, FIELD_PRIME, 252,
+        )
+        assert ec_gen_table.rows == get_ec_gen_table().rows
+        pedersen_table = SubsetSumTable.from_bytes(
+            pedersen_data, CONSTANT_POINTS[2:], ALPHA, FIELD_PRIME, 4,
+        )
+        assert pedersen_table.rows == get_pedersen_table().rows
+
+        with pytest.raises(ValueError):
+            FixedBaseTable.from_bytes(
+                ec_gen_data[:-1], EC_GEN, ALPHA, FIELD_PRIME, 252,
+            )
+        with pytest.raises(ValueError):
+            SubsetSumTable.from_bytes(
+                pedersen_data, CONSTANT_POINTS[3:507], ALPHA, FIELD_PRIME, 4,
+            )
+
+    @pytest.mark.parametrize('entry', [0, 1, 2, 200, 8159])
+    def test_load_corrupt_table(self, entry):
+        data = bytearray(get_ec_gen_table().to_bytes())
+        # Flip a bit of the x coordinate of an entry.
+        data[TABLE_HEADER.size + entry * POINT_BYTES] ^= 1
+        with pytest.raises(ValueError):
+            FixedBaseTable.from_bytes(
+                bytes(data), EC_GEN, ALPHA, FIELD_PRIME, 252,
+            )
+
+        data = bytearray(get_pedersen_table().to_bytes())
+        data[TABLE_HEADER.size + entry % 1890 * POINT_BYTES + 40] ^= 4
+        with pytest.raises(ValueError):
+            SubsetSumTable.from_bytes(
+                bytes(data), CONSTANT_POINTS[2:], ALPHA, FIELD_PRIME, 4,
+            )
+
+    def test_verify_fast_matches_verify(self):
+        rng = random.Random(1)
+        private_key = rng.randrange(1, EC_ORDER)
+        public_key = ec_gen_mult(private_key)
+        for _ in range(5):
+            msg_hash = rng.randrange(2 ** 251)
+            r, s = py_sign(msg_hash, private_key)
+            for key in [public_key, public_key[0]]:
+                assert py_verify_fast(msg_hash, r, s, key)
+                assert py_verify(msg_hash, r, s, key)
+            minus_public_key = (public_key[0], FIELD_PRIME - public_key[1])
+            assert not py_verify_fast(msg_hash, r, s, minus_public_key)
+            assert not py_verify(msg_hash, r, s, minus_public_key)
+            assert not py_verify_fast(msg_hash + 1, r, s, public_key[0])
+            assert not py_verify(msg_hash + 1, r, s, public_key[0])
+            assert not py_verify_fast(msg_hash, r, s, public_key[0] + 1)
+            assert not py_verify(msg_hash, r, s, public_key[0] + 1)
+
+    def test_mimic_ec_mult_air_jacobian(self):
+        point = ec_gen_mult(12345)
+        cases = [
+            # The AIR fails on the first step.
+            (SHIFT_POINT, SHIFT_POINT, [1, 5]),
+            # The AIR fails when reaching 32 * point, unless a lower bit of
+            # m is set.
+            (ec_mult(32, point, ALPHA, FIELD_PRIME), point, [64, 96, 65, 3]),
+            (SHIFT_POINT, point, [7, 2 ** 251 - 1]),
+        ]
+        for shift_point, base_point, scalars in cases:
+            doublings = _air_doublings(ec_to_jacobian(base_point))
+            for m in scalars:
+                try:
+                    expected = mimic_ec_mult_air(m, base_point, shift_point)
+                except AssertionError:
+                    expected = None
+                result = _mimic_ec_mult_air_jacobian(
+                    m, doublings, ec_to_jacobian(shift_point),
+                )
+                if result is not None:
+                    result = jacobian_to_affine(result, FIELD_PRIME)
+                assert result == expected
+
+    def test_verify_batch_matches_verify(self):
+        rng = random.Random(2)
+        private_key = rng.randrange(1, EC_ORDER)
+        public_key = ec_gen_mult(private_key)
+        minus_public_key = (public_key[0], FIELD_PRIME - public_key[1])
+        inputs = []
+        for _ in range(3):
+            msg_hash = rng.randrange(2 ** 251)
+            r, s = py_sign(msg_hash, private_key)
+            inputs += [
+                (msg_hash, r, s, public_key[0]),
+                (msg_hash, r, s, public_key),
+                (msg_hash, r, s, minus_public_key),
+                (msg_hash + 1, r, s, public_key[0]),
+                (msg_hash, r, s, public_key[0] + 1),
+            ]
+        expected = [
+            py_verify(*verification_input) for verification_input in inputs
+        ]
+        assert py_verify_batch(inputs) == expected
+
+        # Malformed inputs, on which py_verify raises, are invalid.
+        malformed_inputs = [
+            (1, 0, 1, public_key[0]),
+            (1, 1, 0, public_key[0]),
+            (1, 1, EC_ORDER, public_key[0]),
+            (2 ** 251, 1, 1, public_key[0]),
+            (1, 1, 1, (1, 1)),
+        ]
+        for verification_input in malformed_inputs:
+            with pytest.raises(AssertionError):
+                py_verify(*verification_input)
+        assert py_verify_batch(malformed_inputs + inputs[:1]) == [
+            False, False, False, False, False, True,
+        ]
+        # The AIR cannot compute 0 * EC_GEN.
+        r, s = inputs[0][1:3]
+        assert not py_verify(0, r, s, public_key[0])
+        assert py_verify_batch([(0, r, s, public_key[0])]) == [False]
+
+    def test_public_key_cache_eviction(self, monkeypatch):
+        monkeypatch.setattr(python_signature, 'PUBLIC_KEY_CACHE_SIZE', 3)
+        monkeypatch.setattr(
+            python_signature, '_public_key_points', OrderedDict(),
+        )
+        points = [ec_gen_mult(m) for m in range(1, 6)]
+        for point in points[:3]:
+            assert decompress_public_key(point[0])[0] == point[0]
+        # Use the first key, so that the second one is evicted first.
+        decompress_public_key(points[0][0])
+        decompress_public_key(points[3][0])
+        assert list(python_signature._public_key_points) == [
+            points[2][0], points[0][0], points[3][0],
+        ]
+        cache_public_key_point(points[4])
+        assert list(python_signature._public_key_points) == [
+            points[0][0], points[3][0], points[4][0],
+        ]
+
+    def test_public_key_cache_seeding(self, monkeypatch):
+        monkeypatch.setattr(
+            python_signature, '_public_key_points', OrderedDict(),
+        )
+        rng = random.Random(3)
+        private_key = rng.randrange(1, EC_ORDER)
+        public_key = ec_gen_mult(private_key)
+        msg_hash = rng.randrange(2 ** 251)
+        r, s = py_sign(msg_hash, private_key)
+        cache_public_key_point(public_key)
+
+        def get_y_coordinate(stark_key_x_coordinate):
+            raise AssertionError('Seeded keys must not be recovered')
+
+        monkeypatch.setattr(
+            python_signature, 'get_y_coordinate', get_y_coordinate,
+        )
+        assert decompress_public_key(public_key[0]) == public_key
+        assert py_verify(msg_hash, r, s, public_key[0])
+        assert py_verify_batch([(msg_hash, r, s, public_key[0])]) == [True]
+        with pytest.raises(AssertionError):
+            cache_public_key_point((public_key[0], public_key[1] + 1))
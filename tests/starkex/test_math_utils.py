@@ -0,0 +1,64 @@
+from dydx3.starkex.starkex_resources.math_utils import ec_add
+from dydx3.starkex.starkex_resources.math_utils import ec_double
+from dydx3.starkex.starkex_resources.math_utils import ec_mult
+from dydx3.starkex.starkex_resources.math_utils import ec_mult_jacobian
+from dydx3.starkex.starkex_resources.math_utils import ec_to_jacobian
+from dydx3.starkex.starkex_resources.math_utils import jacobian_add
+from dydx3.starkex.starkex_resources.math_utils import jacobian_double
+from dydx3.starkex.starkex_resources.math_utils import is_quad_residue
+from dydx3.starkex.starkex_resources.math_utils import jacobian_to_affine
+from dydx3.starkex.starkex_resources.math_utils import sqrt_mod
+from dydx3.starkex.starkex_resources.python_signature import ALPHA
+from dydx3.starkex.starkex_resources.python_signature import EC_GEN
+from dydx3.starkex.starkex_resources.python_signature import EC_ORDER
+from dydx3.starkex.starkex_resources.python_signature import FIELD_PRIME
+
+SCALARS = [
+    1,
+    2,
+    3,
+    0x58c7d5a90b1776bde86ebac077e053ed85b0f7164f53b080304a531947f46e3,
+    EC_ORDER - 1,
+]
+
+
+class TestMathUtils():
+
+    def test_ec_mult_jacobian_matches_affine(self):
+        for m in SCALARS:
+            assert (
+                ec_mult_jacobian(m, EC_GEN, ALPHA, FIELD_PRIME) ==
+                tuple(ec_mult(m, EC_GEN, ALPHA, FIELD_PRIME))
+            )
+
+    def test_jacobian_add_and_double(self):
+        gen = ec_to_jacobian(EC_GEN)
+        two_gen = jacobian_double(gen, ALPHA, FIELD_PRIME)
+        assert jacobian_to_affine(two_gen, FIELD_PRIME) == ec_double(
+            EC_GEN, ALPHA, FIELD_PRIME,
+        )
+        three_gen = jacobian_add(two_gen, gen, ALPHA, FIELD_PRIME)
+        assert jacobian_to_affine(three_gen, FIELD_PRIME) == ec_add(
+            ec_double(EC_GEN, ALPHA, FIELD_PRIME), EC_GEN, FIELD_PRIME,
+        )
+        # Adding equal points falls back to doubling.
+        assert jacobian_add(gen, gen, ALPHA, FIELD_PRIME) == two_gen
+
+    def test_jacobian_add_inverse_is_infinity(self):
+        gen = ec_to_jacobian(EC_GEN)
+        minus_gen = (EC_GEN[0], FIELD_PRIME - EC_GEN[1], 1)
+        assert jacobian_add(gen, minus_gen, ALPHA, FIELD_PRIME)[2] == 0
+
+    def test_sqrt_mod(self):
+        for x in [1, 2, 3, 12345, FIELD_PRIME - 1]:
+            square = x * x % FIELD_PRIME
+            assert is_quad_residue(square, FIELD_PRIME)
+            assert sqrt_mod(square, FIELD_PRIME) == min(x, FIELD_PRIME - x)
+        assert sqrt_mod(0, FIELD_PRIME) == 0
+        # FIELD_PRIME = 1 mod 4, so -1 is a quadratic residue, and 3 is the
+        # field generator, so it is not.
+        assert is_quad_residue(FIELD_PRIME - 1, FIELD_PRIME)
+        assert not is_quad_residue(3, FIELD_PRIME)
+        # A prime that is 3 mod 4.
+        assert sqrt_mod(4, 7) == 2
+        assert not is_quad_residue(3, 7)
@@ -2,6 +2,7 @@ from dydx3.constants import MARKET_ETH_USD
 from dydx3.constants import NETWORK_ID_SEPOLIA
 from dydx3.constants import ORDER_SIDE_BUY
 from dydx3.helpers.request_helpers import iso_to_epoch_seconds
+from dydx3.starkex.order import OrderTemplate
 from dydx3.starkex.order import SignableOrder
 
 # Test data where the public key y-coordinate is odd.
@@ -98,3 +99,39 @@ class TestOrder():
             ),
         )
         assert order.to_starkware().expiration_epoch_hours == 448553
+
+    def test_order_template(self):
+        template = OrderTemplate(
+            network_id=ORDER_PARAMS['network_id'],
+            market=ORDER_PARAMS['market'],
+            side=ORDER_PARAMS['side'],
+            position_id=ORDER_PARAMS['position_id'],
+        )
+        for human_size, client_id in [
+            (ORDER_PARAMS['human_size'], ORDER_PARAMS['client_id']),
+            ('1.5', 'another client ID'),
+        ]:
+            order_params = dict(
+                ORDER_PARAMS,
+                human_size=human_size,
+                client_id=client_id,
+            )
+            order = template.create_order(
+                human_size=order_params['human_size'],
+                human_price=order_params['human_price'],
+                limit_fee=order_params['limit_fee'],
+                client_id=order_params['client_id'],
+                expiration_epoch_seconds=(
+                    order_params['expiration_epoch_seconds']
+                ),
+            )
+            assert order.hash == SignableOrder(**order_params).hash
+
+        order = template.create_order(
+            human_size=ORDER_PARAMS['human_size'],
+            human_price=ORDER_PARAMS['human_price'],
+            limit_fee=ORDER_PARAMS['limit_fee'],
+            client_id=ORDER_PARAMS['client_id'],
+            expiration_epoch_seconds=ORDER_PARAMS['expiration_epoch_seconds'],
+        )
+        assert order.sign(MOCK_PRIVATE_KEY) == MOCK_SIGNATURE
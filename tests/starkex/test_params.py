@@ -0,0 +1,39 @@
+import json
+
+from dydx3.starkex.starkex_resources import params
+from dydx3.starkex.starkex_resources import python_signature
+
+
+class TestParams():
+
+    def test_binary_matches_json(self):
+        with open(params.PEDERSEN_PARAMS_JSON_FILENAME) as f:
+            expected = json.load(f)
+        loaded = params.get_params()
+        for name in params.SCALAR_NAMES:
+            assert getattr(loaded, name) == expected[name]
+        assert len(loaded.CONSTANT_POINTS) == len(expected['CONSTANT_POINTS'])
+        assert loaded.CONSTANT_POINTS[:] == expected['CONSTANT_POINTS']
+        assert loaded.CONSTANT_POINTS[-1] == expected['CONSTANT_POINTS'][-1]
+        assert (
+            python_signature.PEDERSEN_PARAMS['CONSTANT_POINTS'] ==
+            expected['CONSTANT_POINTS']
+        )
+
+    def test_write_and_json_fallback(self, tmp_path, monkeypatch):
+        bin_filename = str(tmp_path / 'pedersen_params.bin')
+        params.write_params_binary(bin_filename=bin_filename)
+        with open(params.PEDERSEN_PARAMS_BIN_FILENAME, 'rb') as f:
+            with open(bin_filename, 'rb') as g:
+                assert f.read() == g.read()
+
+        monkeypatch.setattr(
+            params,
+            'PEDERSEN_PARAMS_BIN_FILENAME',
+            str(tmp_path / 'missing.bin'),
+        )
+        fallback = params._load_params()
+        assert fallback.EC_ORDER == params.get_params().EC_ORDER
+        assert fallback.CONSTANT_POINTS[:3] == (
+            params.get_params().CONSTANT_POINTS[:3]
+        )
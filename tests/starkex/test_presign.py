@@ -0,0 +1,48 @@
+from dydx3.starkex import presign
+from dydx3.starkex.order import SignableOrder
+from dydx3.starkex.presign import PresignPool
+
+from tests.starkex.test_order import MOCK_PRIVATE_KEY
+from tests.starkex.test_order import MOCK_PUBLIC_KEY
+from tests.starkex.test_order import ORDER_PARAMS
+
+
+class TestPresign():
+
+    def test_sign_with_presign_pool(self):
+        pool = PresignPool(size=4)
+        try:
+            order = SignableOrder(**ORDER_PARAMS)
+            signatures = set()
+            for _ in range(8):
+                signature = order.sign(MOCK_PRIVATE_KEY, presign_pool=pool)
+                assert order.verify_signature(signature, MOCK_PUBLIC_KEY)
+                signatures.add(signature)
+            # Each presignature is only used once.
+            assert len(signatures) == 8
+        finally:
+            pool.close()
+
+    def test_take_retries_unusable_nonces(self, monkeypatch):
+        pool = PresignPool(size=1)
+        pool.close()
+        pool._thread.join()
+        while pool.size():
+            pool.take()
+
+        calls = []
+        generate_presignatures = presign.generate_presignatures
+
+        def generate_unusable_first(count):
+            calls.append(count)
+            if len(calls) == 1:
+                return []
+            return generate_presignatures(count)
+
+        monkeypatch.setattr(
+            presign, 'generate_presignatures', generate_unusable_first,
+        )
+        order = SignableOrder(**ORDER_PARAMS)
+        signature = order.sign(MOCK_PRIVATE_KEY, presign_pool=pool)
+        assert order.verify_signature(signature, MOCK_PUBLIC_KEY)
+        assert calls == [1, 1]
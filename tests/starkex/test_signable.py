@@ -0,0 +1,112 @@
+from dydx3.constants import NETWORK_ID_SEPOLIA
+from dydx3.starkex import sign_batch
+from dydx3.starkex import verify_batch
+from dydx3.starkex.conditional_transfer import SignableConditionalTransfer
+from dydx3.starkex.order import SignableOrder
+from dydx3.starkex.starkex_resources import proxy
+from dydx3.starkex.transfer import SignableTransfer
+from dydx3.starkex.withdrawal import SignableWithdrawal
+
+from tests.starkex import test_conditional_transfer
+from tests.starkex import test_order
+from tests.starkex import test_transfer
+from tests.starkex import test_withdrawal
+
+MOCK_PRIVATE_KEY = (
+    '58c7d5a90b1776bde86ebac077e053ed85b0f7164f53b080304a531947f46e3'
+)
+MOCK_PUBLIC_KEY = (
+    '3b865a18323b8d147a12c556bfb1d502516c325b1477a23ba6c77af31f020fd'
+)
+
+
+class TestSignable():
+
+    def test_sign_batch(self):
+        signables = [
+            SignableOrder(**test_order.ORDER_PARAMS),
+            SignableWithdrawal(**test_withdrawal.WITHDRAWAL_PARAMS),
+            SignableTransfer(
+                **test_transfer.TRANSFER_PARAMS,
+                network_id=NETWORK_ID_SEPOLIA,
+            ),
+            SignableConditionalTransfer(
+                **test_conditional_transfer.CONDITIONAL_TRANSFER_PARAMS
+            ),
+        ]
+        assert sign_batch(signables, MOCK_PRIVATE_KEY) == [
+            test_order.MOCK_SIGNATURE,
+            test_withdrawal.MOCK_SIGNATURE,
+            test_transfer.MOCK_SIGNATURE,
+            test_conditional_transfer.MOCK_SIGNATURE,
+        ]
+
+    def test_sign_batch_matches_sign(self):
+        signables = [
+            SignableOrder(
+                **dict(test_order.ORDER_PARAMS, client_id=str(client_id))
+            )
+            for client_id in range(10)
+        ]
+        assert sign_batch(signables, MOCK_PRIVATE_KEY) == [
+            signable.sign(MOCK_PRIVATE_KEY) for signable in signables
+        ]
+
+    def test_sign_batch_empty(self):
+        assert sign_batch([], MOCK_PRIVATE_KEY) == []
+
+    def test_verify_signature_is_exact_by_default(self, monkeypatch):
+        calls = []
+
+        def py_verify(**kwargs):
+            calls.append('exact')
+            return True
+
+        def py_verify_fast(**kwargs):
+            calls.append('fast')
+            return True
+
+        monkeypatch.setattr(proxy, 'check_cpp_lib_path', lambda: False)
+        monkeypatch.setattr(proxy, 'py_verify', py_verify)
+        monkeypatch.setattr(proxy, 'py_verify_fast', py_verify_fast)
+        order = SignableOrder(**test_order.ORDER_PARAMS)
+        assert order.verify_signature(
+            test_order.MOCK_SIGNATURE,
+            MOCK_PUBLIC_KEY,
+        )
+        assert order.verify_signature(
+            test_order.MOCK_SIGNATURE,
+            MOCK_PUBLIC_KEY,
+            fast=True,
+        )
+        assert calls == ['exact', 'fast']
+
+    def test_verify_batch(self):
+        orders = [
+            SignableOrder(
+                **dict(test_order.ORDER_PARAMS, client_id=str(client_id))
+            )
+            for client_id in range(3)
+        ]
+        signatures = sign_batch(orders, MOCK_PRIVATE_KEY)
+        assert verify_batch(orders, signatures, MOCK_PUBLIC_KEY) == [
+            True, True, True,
+        ]
+
+        # Mismatched signatures and keys.
+        even_y_order = SignableOrder(**test_order.ORDER_PARAMS)
+        assert verify_batch(
+            [orders[0], orders[1], even_y_order, even_y_order],
+            [
+                signatures[1],
+                signatures[1],
+                test_order.MOCK_SIGNATURE_EVEN_Y,
+                test_order.MOCK_SIGNATURE_EVEN_Y,
+            ],
+            [
+                MOCK_PUBLIC_KEY,
+                MOCK_PUBLIC_KEY,
+                test_order.MOCK_PUBLIC_KEY_EVEN_Y,
+                MOCK_PUBLIC_KEY,
+            ],
+        ) == [False, True, True, False]
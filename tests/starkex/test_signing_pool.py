@@ -0,0 +1,41 @@
+from dydx3.constants import NETWORK_ID_SEPOLIA
+from dydx3.starkex.order import SignableOrder
+from dydx3.starkex.signing_pool import SigningPool
+from dydx3.starkex.transfer import SignableTransfer
+
+from tests.starkex import test_order
+from tests.starkex import test_transfer
+
+
+class TestSigningPool():
+
+    def test_sign_matches_direct_signing(self):
+        order = SignableOrder(**test_order.ORDER_PARAMS)
+        transfer = SignableTransfer(
+            **test_transfer.TRANSFER_PARAMS,
+            network_id=NETWORK_ID_SEPOLIA,
+        )
+        with SigningPool(test_order.MOCK_PRIVATE_KEY, max_workers=2) as pool:
+            assert pool.sign(order) == test_order.MOCK_SIGNATURE
+            futures = [pool.submit(order) for _ in range(4)]
+            assert all(
+                future.result() == test_order.MOCK_SIGNATURE
+                for future in futures
+            )
+            assert pool.sign_batch([order] * 5) == (
+                [test_order.MOCK_SIGNATURE] * 5
+            )
+
+        with SigningPool(test_transfer.MOCK_PRIVATE_KEY) as pool:
+            assert pool.submit_batch([transfer, transfer]).result() == [
+                test_transfer.MOCK_SIGNATURE,
+                test_transfer.MOCK_SIGNATURE,
+            ]
+
+    def test_from_starkware(self):
+        order = SignableOrder(**test_order.ORDER_PARAMS)
+        copy = SignableOrder.from_starkware(
+            order.network_id,
+            order.to_starkware(),
+        )
+        assert copy.hash == order.hash
@@ -0,0 +1,168 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from dydx3 import AsyncClient
+from dydx3 import DydxApiError
+from dydx3.constants import NETWORK_ID_SEPOLIA
+from dydx3.constants import ORDER_SIDE_BUY
+from dydx3.constants import ORDER_TYPE_LIMIT
+from dydx3.constants import TIME_IN_FORCE_GTT
+from dydx3.modules.async_private import AsyncPrivate
+from dydx3.modules.async_public import AsyncPublic
+from dydx3.starkex.order import SignableOrder
+
+from tests.starkex.test_order import MOCK_PRIVATE_KEY
+from tests.test_private import expected_order_signature
+from tests.test_private import order_ladder
+
+API_KEY_CREDENTIALS = {
+    'key': 'key',
+    'secret': 'c2VjcmV0',
+    'passphrase': 'passphrase',
+}
+
+
+class TestAsyncClient():
+
+    def test_public(self, host):
+        async def run():
+            async with AsyncClient(host=host) as client:
+                assert isinstance(client.public, AsyncPublic)
+                responses = await asyncio.gather(*[
+                    client.public.get_orderbook(market)
+                    for market in ('BTC-USD', 'ETH-USD', 'LINK-USD')
+                ])
+                with pytest.raises(DydxApiError) as error:
+                    await client.public._get('/v3/missing')
+                assert error.value.status_code == 404
+            return responses
+
+        responses = asyncio.run(run())
+        assert [response.data['path'] for response in responses] == [
+            '/v3/orderbook/BTC-USD',
+            '/v3/orderbook/ETH-USD',
+            '/v3/orderbook/LINK-USD',
+        ]
+
+    def test_private(self, host):
+        async def run():
+            async with AsyncClient(
+                host=host,
+                network_id=NETWORK_ID_SEPOLIA,
+                stark_private_key=MOCK_PRIVATE_KEY,
+                api_key_credentials=API_KEY_CREDENTIALS,
+            ) as client:
+                assert isinstance(client.private, AsyncPrivate)
+                assert client.private.transport is client.transport
+                return await client.private.create_order(
+                    position_id=12345,
+                    market='BTC-USD',
+                    side=ORDER_SIDE_BUY,
+                    order_type=ORDER_TYPE_LIMIT,
+                    post_only=False,
+                    size='1',
+                    price='20000',
+                    limit_fee='0.0015',
+                    time_in_force=TIME_IN_FORCE_GTT,
+                    expiration_epoch_seconds=1700000000,
+                )
+
+        response = asyncio.run(run())
+        assert response.data['method'] == 'POST'
+        assert response.data['path'] == '/v3/orders'
+        assert response.data['body']['signature']
+        assert response.data['headers']['DYDX-API-KEY'] == 'key'
+
+    def test_sign_on_executor(self, host):
+        async def run(executor):
+            async with AsyncClient(
+                host=host,
+                network_id=NETWORK_ID_SEPOLIA,
+                stark_private_key=MOCK_PRIVATE_KEY,
+                api_key_credentials=API_KEY_CREDENTIALS,
+                signing_executor=executor,
+            ) as client:
+                return await asyncio.gather(*[
+                    client.private.create_order(
+                        position_id=12345,
+                        market='BTC-USD',
+                        side=ORDER_SIDE_BUY,
+                        order_type=ORDER_TYPE_LIMIT,
+                        post_only=False,
+                        size='1',
+                        price='20000',
+                        limit_fee='0.0015',
+                        client_id=str(i),
+                        expiration_epoch_seconds=1700000000,
+                    )
+                    for i in range(3)
+                ])
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            responses = asyncio.run(run(executor))
+        for i, response in enumerate(responses):
+            expected_signature = SignableOrder(
+                network_id=NETWORK_ID_SEPOLIA,
+                position_id=12345,
+                client_id=str(i),
+                market='BTC-USD',
+                side=ORDER_SIDE_BUY,
+                human_size='1',
+                human_price='20000',
+                limit_fee='0.0015',
+                expiration_epoch_seconds=1700000000,
+            ).sign(MOCK_PRIVATE_KEY)
+            assert response.data['body']['signature'] == expected_signature
+
+    def test_create_orders(self, host):
+        orders = order_ladder(4)
+        orders[1] = dict(orders[1], expiration_epoch_seconds=None)
+
+        async def run(executor):
+            async with AsyncClient(
+                host=host,
+                network_id=NETWORK_ID_SEPOLIA,
+                stark_private_key=MOCK_PRIVATE_KEY,
+                api_key_credentials=API_KEY_CREDENTIALS,
+                signing_executor=executor,
+            ) as client:
+                return await client.private.create_orders(
+                    orders,
+                    max_concurrency=2,
+                )
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            results = asyncio.run(run(executor))
+        assert isinstance(results[1], ValueError)
+        for i in (0, 2, 3):
+            assert results[i].data['body']['signature'] == (
+                expected_order_signature(orders[i])
+            )
+
+    def test_create_orders_signer_error(self, host):
+        class Signer(object):
+            def sign(self, signable):
+                raise OSError('Signer is down')
+
+        orders = order_ladder(2)
+        orders[1] = dict(orders[1], signature='presigned')
+
+        async def run():
+            async with AsyncClient(
+                host=host,
+                network_id=NETWORK_ID_SEPOLIA,
+                stark_signer=Signer(),
+                api_key_credentials=API_KEY_CREDENTIALS,
+            ) as client:
+                with pytest.raises(ValueError):
+                    await client.private.create_orders(
+                        orders,
+                        max_concurrency=0,
+                    )
+                return await client.private.create_orders(orders)
+
+        results = asyncio.run(run())
+        assert isinstance(results[0], OSError)
+        assert results[1].data['body']['signature'] == 'presigned'
@@ -0,0 +1,189 @@
+import sys
+import threading
+
+import pytest
+
+from dydx3.constants import CANDLE_RESOLUTION_ONE_MINUTE
+from dydx3.errors import DydxApiError
+from dydx3.helpers.backfill import backfill_candles
+from dydx3.helpers.backfill import split_time_range
+from dydx3.helpers.request_helpers import epoch_seconds_to_iso
+from dydx3.helpers.request_helpers import iso_to_epoch_seconds
+from dydx3.helpers.requests import Response
+from dydx3.modules.async_public import AsyncPublic
+from dydx3.modules.public import Public
+
+FROM_ISO = '2021-01-01T00:00:00.000Z'
+TO_ISO = '2021-01-01T10:00:00.000Z'
+
+
+def _candle(market, epoch_seconds):
+    return {
+        'market': market,
+        'resolution': CANDLE_RESOLUTION_ONE_MINUTE,
+        'startedAt': epoch_seconds_to_iso(epoch_seconds),
+        'updatedAt': epoch_seconds_to_iso(epoch_seconds + 59),
+        'open': '100.5',
+        'high': '101',
+        'low': '99.25',
+        'close': '100',
+        'baseTokenVolume': '1.5',
+        'usdVolume': '150.75',
+        'trades': str(int(epoch_seconds) % 7),
+        'startingOpenInterest': '10',
+    }
+
+
+class _ErrorResponse(object):
+    text = 'Too many requests'
+    headers = {'Retry-After': '1'}
+
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+    def json(self):
+        return {'errors': [{'msg': self.text}]}
+
+
+class FakePublic(Public):
+    '''Serves one-minute candles, newest first, like the API.'''
+
+    def __init__(self, failed_requests=0, error_status_code=429):
+        super(FakePublic, self).__init__('http://localhost')
+        self.failed_requests = failed_requests
+        self.error_status_code = error_status_code
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def get_candles(
+        self,
+        market,
+        resolution=None,
+        from_iso=None,
+        to_iso=None,
+        limit=None,
+    ):
+        with self.lock:
+            self.requests.append((market, from_iso, to_iso))
+            if self.failed_requests:
+                self.failed_requests -= 1
+                raise DydxApiError(_ErrorResponse(self.error_status_code))
+        start = int(iso_to_epoch_seconds(from_iso))
+        end = int(iso_to_epoch_seconds(to_iso))
+        candles = [
+            _candle(market, epoch_seconds)
+            for epoch_seconds in range(end - end % 60, start - 1, -60)
+        ]
+        return Response({'candles': candles[:limit]})
+
+
+class TestBackfill():
+
+    def test_split_time_range(self):
+        windows = split_time_range(FROM_ISO, TO_ISO, 4 * 60 * 60)
+        assert windows == [
+            (FROM_ISO, '2021-01-01T04:00:00.000Z'),
+            ('2021-01-01T04:00:00.000Z', '2021-01-01T08:00:00.000Z'),
+            ('2021-01-01T08:00:00.000Z', TO_ISO),
+        ]
+        assert split_time_range(FROM_ISO, FROM_ISO, 60) == []
+        with pytest.raises(ValueError):
+            split_time_range(FROM_ISO, TO_ISO, 0)
+
+    @pytest.mark.parametrize('limit', [0, 1])
+    def test_backfill_candles_invalid_limit(self, limit):
+        public = FakePublic()
+        with pytest.raises(ValueError):
+            backfill_candles(
+                public,
+                'BTC-USD',
+                CANDLE_RESOLUTION_ONE_MINUTE,
+                FROM_ISO,
+                TO_ISO,
+                limit=limit,
+            )
+        assert public.requests == []
+
+    def test_backfill_candles_without_numpy(self, monkeypatch):
+        # A None entry in sys.modules makes the import fail.
+        monkeypatch.setitem(sys.modules, 'numpy', None)
+        public = FakePublic()
+        with pytest.raises(ImportError) as error:
+            public.backfill_candles(
+                'BTC-USD',
+                CANDLE_RESOLUTION_ONE_MINUTE,
+                FROM_ISO,
+                TO_ISO,
+            )
+        assert 'dydx-v3-python[numpy]' in str(error.value)
+        assert public.requests == []
+
+    def test_backfill_candles(self):
+        public = FakePublic(failed_requests=2)
+        candles_by_market = backfill_candles(
+            public,
+            ['BTC-USD', 'ETH-USD'],
+            CANDLE_RESOLUTION_ONE_MINUTE,
+            FROM_ISO,
+            TO_ISO,
+            max_workers=4,
+        )
+        start = iso_to_epoch_seconds(FROM_ISO)
+        for market in ('BTC-USD', 'ETH-USD'):
+            assert candles_by_market[market] == [
+                _candle(market, start + 60 * i) for i in range(10 * 60 + 1)
+            ]
+        # 601 candles take 7 windows of 100 per market, plus the retries.
+        assert len(public.requests) == 2 * 7 + 2
+
+    def test_backfill_candles_raises_other_errors(self):
+        public = FakePublic(failed_requests=1, error_status_code=500)
+        with pytest.raises(DydxApiError) as error:
+            backfill_candles(
+                public,
+                'BTC-USD',
+                CANDLE_RESOLUTION_ONE_MINUTE,
+                FROM_ISO,
+                TO_ISO,
+                max_workers=1,
+            )
+        assert error.value.status_code == 500
+
+    def test_backfill_candles_as_columns(self):
+        np = pytest.importorskip('numpy')
+        columns = FakePublic().backfill_candles(
+            'BTC-USD',
+            CANDLE_RESOLUTION_ONE_MINUTE,
+            FROM_ISO,
+            TO_ISO,
+        )['BTC-USD']
+        assert len(columns['startedAt']) == 10 * 60 + 1
+        assert columns['startedAt'].dtype == np.dtype('datetime64[ms]')
+        assert columns['startedAt'][0] == np.datetime64(
+            '2021-01-01T00:00:00.000',
+        )
+        assert columns['open'].dtype == np.float64
+        assert columns['low'][0] == 99.25
+        assert columns['trades'].dtype == np.int64
+        assert columns['trades'][1] == (
+            int(iso_to_epoch_seconds(FROM_ISO)) + 60
+        ) % 7
+
+    def test_backfill_candles_as_list(self):
+        candles_by_market = FakePublic().backfill_candles(
+            'BTC-USD',
+            CANDLE_RESOLUTION_ONE_MINUTE,
+            FROM_ISO,
+            TO_ISO,
+            as_columns=False,
+        )
+        assert len(candles_by_market['BTC-USD']) == 10 * 60 + 1
+
+    def test_backfill_candles_async_not_supported(self):
+        with pytest.raises(TypeError):
+            AsyncPublic('http://localhost').backfill_candles(
+                'BTC-USD',
+                CANDLE_RESOLUTION_ONE_MINUTE,
+                FROM_ISO,
+                TO_ISO,
+            )
@@ -0,0 +1,99 @@
+import random
+import time
+from datetime import datetime
+
+from dydx3 import Client
+from dydx3 import iso_to_epoch_seconds
+from dydx3.helpers.clock_sync import ClockSync
+from dydx3.helpers.request_helpers import epoch_seconds_to_iso
+from dydx3.helpers.request_helpers import format_epoch_seconds_iso
+from dydx3.helpers.requests import Response
+from tests.test_private import API_KEY_CREDENTIALS
+
+OFFSET = 3600
+
+
+class FakePublic(object):
+    '''Server one hour ahead, with a slow response every other request.'''
+
+    def __init__(self):
+        self.requests = 0
+
+    def get_time(self):
+        self.requests += 1
+        if self.requests % 2 == 0:
+            time.sleep(0.05)
+        now = time.time() + OFFSET
+        return Response({
+            'iso': epoch_seconds_to_iso(now),
+            'epoch': round(now, 3),
+        })
+
+
+class TestClockSync():
+
+    def test_offset(self):
+        public = FakePublic()
+        clock_sync = ClockSync(public, interval=0.05, max_samples=4)
+        assert abs(clock_sync.offset - OFFSET) < 0.01
+        for _ in range(3):
+            clock_sync.sync()
+        # The sample with the shortest round trip time is used.
+        assert clock_sync.rtt < 0.02
+        assert abs(clock_sync.offset - OFFSET) < 0.01
+        assert abs(clock_sync.now() - time.time() - OFFSET) < 0.01
+
+        requests = public.requests
+        clock_sync.now()
+        assert public.requests == requests
+        time.sleep(0.05)
+        clock_sync.now()
+        assert public.requests == requests + 1
+
+    def test_background_thread(self):
+        public = FakePublic()
+        clock_sync = ClockSync(public, interval=0.02)
+        clock_sync.start()
+        try:
+            time.sleep(0.1)
+            requests = public.requests
+            assert requests > 2
+            clock_sync.now()
+            assert public.requests - requests <= 1
+        finally:
+            clock_sync.stop()
+
+    def test_format_epoch_seconds_iso(self):
+        # The original strftime implementation of epoch_seconds_to_iso.
+        def strftime_iso(epoch):
+            return datetime.utcfromtimestamp(epoch).strftime(
+                '%Y-%m-%dT%H:%M:%S.%f',
+            )[:-3] + 'Z'
+
+        assert format_epoch_seconds_iso(1611234567.9999996) == (
+            '2021-01-21T13:09:28.000Z'
+        )
+        rng = random.Random(0)
+        epochs = [0, 1.5, 1611234567.123, 1611234567.9999996] + [
+            rng.uniform(0, 4e9) for _ in range(1000)
+        ]
+        for epoch in epochs:
+            assert format_epoch_seconds_iso(epoch) == strftime_iso(epoch)
+        clock_sync = ClockSync(FakePublic())
+        expiration = clock_sync.expiration_epoch_seconds(60)
+        assert abs(expiration - time.time() - OFFSET - 60) < 0.01
+        assert abs(
+            iso_to_epoch_seconds(clock_sync.now_iso()) - time.time() - OFFSET,
+        ) < 0.01
+
+    def test_private_request_timestamp(self, host):
+        client = Client(
+            host=host,
+            api_key_credentials=API_KEY_CREDENTIALS,
+            clock_sync=ClockSync(FakePublic()),
+        )
+        response = client.private.get_api_keys()
+        timestamp = response.data['headers']['DYDX-TIMESTAMP']
+        assert abs(
+            iso_to_epoch_seconds(timestamp) - time.time() - OFFSET,
+        ) < 1
@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ('web3', 'eth_account', 'sympy', 'mpmath', 'aiohttp')
+
+
+def _loaded_heavy_modules(code):
+    script = (
+        'import sys\n' +
+        code +
+        '\nprint(",".join(m for m in {!r} if m in sys.modules))'.format(
+            HEAVY_MODULES,
+        )
+    )
+    output = subprocess.check_output([sys.executable, '-c', script])
+    return [m for m in output.decode().strip().split(',') if m]
+
+
+class TestImports():
+
+    def test_public_client_imports_nothing_heavy(self):
+        assert _loaded_heavy_modules(
+            'from dydx3 import Client\n'
+            'Client(host="http://localhost:8080").public',
+        ) == []
+
+    def test_stark_signing_imports_nothing_heavy(self):
+        assert _loaded_heavy_modules(
+            'from dydx3 import Client\n'
+            'from dydx3.starkex.order import SignableOrder\n'
+            'from tests.starkex.test_order import ORDER_PARAMS\n'
+            'from tests.starkex.test_order import MOCK_PRIVATE_KEY\n'
+            'Client(\n'
+            '    host="http://localhost:8080",\n'
+            '    stark_private_key=MOCK_PRIVATE_KEY,\n'
+            '    api_key_credentials={"key": "", "secret": "",'
+            ' "passphrase": ""},\n'
+            ').private\n'
+            'SignableOrder(**ORDER_PARAMS).sign(MOCK_PRIVATE_KEY)',
+        ) == []
+
+    def test_eth_modules_load_on_first_use(self):
+        assert 'web3' in _loaded_heavy_modules(
+            'from dydx3.starkex.helpers import private_key_from_bytes\n'
+            'private_key_from_bytes(b"seed")',
+        )
+
+    def test_starkex_exports_load_on_first_use(self):
+        script = (
+            'import sys\n'
+            'import dydx3.starkex.helpers\n'
+            'print("dydx3.starkex.signing_pool" in sys.modules)\n'
+            'from dydx3.starkex import SigningPool\n'
+            'print("dydx3.starkex.signing_pool" in sys.modules)\n'
+        )
+        output = subprocess.check_output([sys.executable, '-c', script])
+        assert output.decode().split() == ['False', 'True']
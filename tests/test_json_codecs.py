@@ -0,0 +1,90 @@
+import pytest
+
+from dydx3 import Client
+from dydx3.helpers.json_codecs import JSON_CODECS
+from dydx3.helpers.json_codecs import StdlibJsonCodec
+from dydx3.helpers.json_codecs import get_json_codec
+
+PAYLOAD = {
+    'candles': [
+        {
+            'startedAt': '2021-01-05T00:00:00.000Z',
+            'market': 'BTC-USD',
+            'resolution': '1DAY',
+            'low': '40000.5',
+            'open': '41000',
+            'trades': 1234,
+            'isFinal': False,
+            'note': 'ünïcode / slash',
+            'missing': None,
+        },
+    ],
+}
+
+
+def _installed_codecs():
+    codecs = []
+    for name in JSON_CODECS:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            pass
+    return codecs
+
+
+class _RecordingCodec(StdlibJsonCodec):
+
+    def __init__(self):
+        self.calls = []
+
+    def dumps(self, data):
+        self.calls.append('dumps')
+        return super(_RecordingCodec, self).dumps(data)
+
+    def loads(self, content):
+        self.calls.append('loads')
+        return super(_RecordingCodec, self).loads(content)
+
+
+class TestJsonCodecs():
+
+    @pytest.mark.parametrize(
+        'codec',
+        _installed_codecs(),
+        ids=lambda codec: codec.name,
+    )
+    def test_round_trip(self, codec):
+        encoded = codec.dumps(PAYLOAD)
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == PAYLOAD
+        assert codec.loads(encoded.decode()) == PAYLOAD
+        assert StdlibJsonCodec().loads(encoded) == PAYLOAD
+
+    @pytest.mark.parametrize(
+        'codec',
+        _installed_codecs(),
+        ids=lambda codec: codec.name,
+    )
+    def test_big_ints(self, codec):
+        data = {'big': 10 ** 23, 'negative': -2 ** 64, 'small': 2 ** 64 - 1}
+        encoded = codec.dumps(data)
+        assert StdlibJsonCodec().loads(encoded) == data
+        decoded = codec.loads(StdlibJsonCodec().dumps(data))
+        assert decoded == data
+        assert isinstance(decoded['big'], int)
+
+    def test_get_json_codec(self):
+        assert isinstance(get_json_codec(), StdlibJsonCodec)
+        assert get_json_codec('json').name == 'json'
+        codec = StdlibJsonCodec()
+        assert get_json_codec(codec) is codec
+        with pytest.raises(ValueError):
+            get_json_codec('yaml')
+
+    def test_client_codec(self, host):
+        codec = _RecordingCodec()
+        client = Client(host=host, json_codec=codec)
+        assert client.public.transport.json_codec is codec
+        response = client.public.get_markets()
+        assert response.data['path'] == '/v3/markets'
+        assert codec.calls == ['dumps', 'loads']
@@ -0,0 +1,168 @@
+import pytest
+
+from dydx3.errors import PaginationError
+from dydx3.helpers.pagination import iter_pages
+from dydx3.helpers.requests import Response
+from dydx3.modules.async_public import AsyncPublic
+from dydx3.modules.public import Public
+
+# Rows are sorted newest first. Several rows share timestamps, so they may
+# be returned again at page boundaries.
+ROWS = [
+    {'id': str(i), 'createdAt': '2021-01-01T00:00:{:02d}.000Z'.format(ts)}
+    for i, ts in enumerate(
+        [59, 58, 58, 58, 50, 40, 40, 30, 30, 30, 30, 30, 20, 10, 10, 5],
+    )
+]
+
+
+def _fake_endpoint(rows, page_size, requests=None):
+    def fetch_page(before_or_at):
+        if requests is not None:
+            requests.append(before_or_at)
+        page = [
+            row for row in rows
+            if before_or_at is None or row['createdAt'] <= before_or_at
+        ]
+        return Response({'rows': page[:page_size]})
+    return fetch_page
+
+
+class TestPagination():
+
+    @pytest.mark.parametrize('prefetch', [False, True])
+    @pytest.mark.parametrize('page_size', [6, 7, 100])
+    def test_iter_pages(self, page_size, prefetch):
+        requests = []
+        rows = list(iter_pages(
+            _fake_endpoint(ROWS, page_size, requests),
+            'rows',
+            'createdAt',
+            limit=page_size,
+            prefetch=prefetch,
+        ))
+        assert rows == ROWS
+        assert len(requests) < 2 * len(ROWS)
+
+    @pytest.mark.parametrize('prefetch', [False, True])
+    @pytest.mark.parametrize('page_size,timestamp', [
+        (2, '2021-01-01T00:00:58.000Z'),
+        (3, '2021-01-01T00:00:58.000Z'),
+        (4, '2021-01-01T00:00:30.000Z'),
+        (5, '2021-01-01T00:00:30.000Z'),
+    ])
+    def test_iter_pages_too_many_rows_at_timestamp(
+        self,
+        page_size,
+        timestamp,
+        prefetch,
+    ):
+        # Three rows share the timestamp :58 and five :30, so pages must be
+        # longer than that to paginate through them.
+        rows = []
+        with pytest.raises(PaginationError) as error:
+            for row in iter_pages(
+                _fake_endpoint(ROWS, page_size),
+                'rows',
+                'createdAt',
+                limit=page_size,
+                prefetch=prefetch,
+            ):
+                rows.append(row)
+        assert error.value.page_size == page_size
+        assert error.value.timestamp == timestamp
+        # Every row newer than the timestamp is yielded once, newest first.
+        assert rows == ROWS[:len(rows)]
+        assert all(
+            row in rows for row in ROWS if row['createdAt'] > timestamp
+        )
+
+    def test_iter_pages_same_timestamp_fills(self):
+        # One taker order sweeping several makers creates fills which share
+        # a timestamp.
+        fills = [
+            {'id': str(i), 'createdAt': '2021-01-01T00:00:00.005Z'}
+            for i in range(3)
+        ] + [{'id': 'old', 'createdAt': '2021-01-01T00:00:00.001Z'}]
+        ids = []
+        with pytest.raises(PaginationError):
+            for fill in iter_pages(
+                _fake_endpoint(fills, 2),
+                'rows',
+                'createdAt',
+                limit=2,
+            ):
+                ids.append(fill['id'])
+        assert ids == ['0', '1']
+
+        ids = [
+            fill['id'] for fill in iter_pages(
+                _fake_endpoint(fills, 4),
+                'rows',
+                'createdAt',
+                limit=4,
+            )
+        ]
+        assert ids == ['0', '1', '2', 'old']
+
+    def test_iter_pages_same_timestamp_last_rows(self):
+        # All of the rows at the oldest timestamp fit in the page.
+        rows = [
+            {'id': str(i), 'createdAt': '2021-01-01T00:00:00.005Z'}
+            for i in range(3)
+        ]
+        assert list(iter_pages(
+            _fake_endpoint(rows, 4),
+            'rows',
+            'createdAt',
+            limit=4,
+        )) == rows
+
+    def test_iter_pages_without_limit(self):
+        rows = list(iter_pages(
+            _fake_endpoint(ROWS, 6),
+            'rows',
+            'createdAt',
+            before_or_at='2021-01-01T00:00:40.000Z',
+        ))
+        assert rows == ROWS[5:]
+
+        # Without a limit, a page as long as the longest one received so
+        # far may be full, so rows beyond it may be missed.
+        with pytest.raises(PaginationError):
+            list(iter_pages(
+                _fake_endpoint(ROWS, 5),
+                'rows',
+                'createdAt',
+                before_or_at='2021-01-01T00:00:40.000Z',
+            ))
+
+    def test_iter_pages_is_lazy(self):
+        requests = []
+        pages = iter_pages(
+            _fake_endpoint(ROWS, 5, requests),
+            'rows',
+            'createdAt',
+            limit=5,
+        )
+        assert requests == []
+        assert next(pages) == ROWS[0]
+        assert len(requests) == 1
+        pages.close()
+
+    def test_iter_trades(self):
+        public = Public('http://localhost')
+        public.get_trades = lambda market, starting_before_or_at: Response({
+            'trades': [
+                row for row in ROWS
+                if (
+                    starting_before_or_at is None or
+                    row['createdAt'] <= starting_before_or_at
+                )
+            ][:6],
+        })
+        assert list(public.iter_trades('BTC-USD', prefetch=True)) == ROWS
+
+    def test_async_module_not_supported(self):
+        with pytest.raises(TypeError):
+            next(AsyncPublic('http://localhost').iter_trades('BTC-USD'))
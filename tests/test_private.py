@@ -0,0 +1,169 @@
+import base64
+import hashlib
+import hmac
+
+import pytest
+
+from dydx3 import Client
+from dydx3.constants import NETWORK_ID_SEPOLIA
+from dydx3.constants import ORDER_SIDE_BUY
+from dydx3.constants import ORDER_TYPE_LIMIT
+from dydx3.starkex.order import SignableOrder
+
+from tests.starkex.test_order import MOCK_PRIVATE_KEY
+
+API_KEY_CREDENTIALS = {
+    'key': 'key',
+    'secret': base64.urlsafe_b64encode(b'secret').decode(),
+    'passphrase': 'passphrase',
+}
+
+
+def order_ladder(n):
+    return [
+        {
+            'position_id': 12345,
+            'market': 'BTC-USD',
+            'side': ORDER_SIDE_BUY,
+            'order_type': ORDER_TYPE_LIMIT,
+            'post_only': True,
+            'size': '1',
+            'price': str(20000 - i),
+            'limit_fee': '0.0015',
+            'client_id': str(i),
+            'expiration_epoch_seconds': 1700000000,
+        }
+        for i in range(n)
+    ]
+
+
+def expected_order_signature(order):
+    return SignableOrder(
+        network_id=NETWORK_ID_SEPOLIA,
+        position_id=order['position_id'],
+        client_id=order['client_id'],
+        market=order['market'],
+        side=order['side'],
+        human_size=order['size'],
+        human_price=order['price'],
+        limit_fee=order['limit_fee'],
+        expiration_epoch_seconds=order['expiration_epoch_seconds'],
+    ).sign(MOCK_PRIVATE_KEY)
+
+
+def _expected_signature(response):
+    headers = response.data['headers']
+    message = (
+        headers['DYDX-TIMESTAMP'] +
+        response.data['method'] +
+        response.data['path'] +
+        response.data['raw_body']
+    )
+    digest = hmac.new(b'secret', message.encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).decode()
+
+
+class TestPrivate():
+
+    def test_signs_the_bytes_sent(self, host):
+        client = Client(host=host, api_key_credentials=API_KEY_CREDENTIALS)
+
+        response = client.private.send_link_request('REMOVE', '0xabc')
+        assert response.data['raw_body'] == (
+            '{"action":"REMOVE","address":"0xabc"}'
+        )
+        assert response.data['headers']['DYDX-SIGNATURE'] == (
+            _expected_signature(response)
+        )
+        assert response.data['headers']['DYDX-API-KEY'] == 'key'
+        assert response.data['headers']['DYDX-PASSPHRASE'] == 'passphrase'
+
+        response = client.private.get_accounts()
+        assert response.data['raw_body'] == ''
+        assert response.data['headers']['DYDX-SIGNATURE'] == (
+            _expected_signature(response)
+        )
+
+    def test_sign_matches_request_signature(self, host):
+        client = Client(host=host, api_key_credentials=API_KEY_CREDENTIALS)
+        response = client.private.send_link_request('REMOVE', '0xabc')
+        headers = response.data['headers']
+        assert client.private.sign(
+            request_path='/v3/users/links',
+            method='POST',
+            iso_timestamp=headers['DYDX-TIMESTAMP'],
+            data=response.data['body'],
+        ) == headers['DYDX-SIGNATURE']
+
+    def test_credentials_change(self, host):
+        client = Client(host=host, api_key_credentials=API_KEY_CREDENTIALS)
+        client.private.get_accounts()
+        client.private.api_key_credentials = dict(
+            API_KEY_CREDENTIALS,
+            key='other',
+        )
+        response = client.private.get_accounts()
+        assert response.data['headers']['DYDX-API-KEY'] == 'other'
+
+    def test_create_orders(self, host):
+        client = Client(
+            host=host,
+            network_id=NETWORK_ID_SEPOLIA,
+            stark_private_key=MOCK_PRIVATE_KEY,
+            api_key_credentials=API_KEY_CREDENTIALS,
+        )
+        orders = order_ladder(6)
+        orders[2] = dict(orders[2], expiration_epoch_seconds=None)
+        orders[4] = dict(orders[4], signature='presigned')
+
+        results = client.private.create_orders(orders, max_concurrency=3)
+        assert isinstance(results[2], ValueError)
+        assert results[4].data['body']['signature'] == 'presigned'
+        for i in (0, 1, 3, 5):
+            body = results[i].data['body']
+            assert body['clientId'] == str(i)
+            assert body['price'] == orders[i]['price']
+            assert body['signature'] == expected_order_signature(orders[i])
+        assert client.private.create_orders([]) == []
+
+    def test_create_orders_signer_error(self, host):
+        class Signer(object):
+            def sign(self, signable):
+                raise OSError('Signer is down')
+
+        client = Client(
+            host=host,
+            network_id=NETWORK_ID_SEPOLIA,
+            stark_signer=Signer(),
+            api_key_credentials=API_KEY_CREDENTIALS,
+        )
+        orders = order_ladder(3)
+        orders[1] = dict(orders[1], signature='presigned')
+        results = client.private.create_orders(orders)
+        assert isinstance(results[0], OSError)
+        assert results[1].data['body']['signature'] == 'presigned'
+        assert results[2] is results[0]
+
+        with pytest.raises(ValueError):
+            client.private.create_orders(orders, max_concurrency=0)
+
+    def test_create_orders_with_stark_signer(self, host):
+        signed = []
+
+        class Signer(object):
+            def sign(self, signable):
+                signed.append(signable)
+                return signable.sign(MOCK_PRIVATE_KEY)
+
+        client = Client(
+            host=host,
+            network_id=NETWORK_ID_SEPOLIA,
+            stark_signer=Signer(),
+            api_key_credentials=API_KEY_CREDENTIALS,
+        )
+        orders = order_ladder(3)
+        results = client.private.create_orders(orders)
+        assert len(signed) == 3
+        assert [result.data['body']['signature'] for result in results] == [
+            expected_order_signature(order) for order in orders
+        ]
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dydx3 import DydxApiError
+from dydx3.helpers.async_requests import AsyncTransport
+from dydx3.helpers.rate_limiter import RATE_LIMIT_BUCKET_CANCELS
+from dydx3.helpers.rate_limiter import RATE_LIMIT_BUCKET_ORDERS
+from dydx3.helpers.rate_limiter import RATE_LIMIT_BUCKET_READS
+from dydx3.helpers.rate_limiter import RateLimiter
+from dydx3.helpers.requests import Transport
+
+# Two requests per 200ms, i.e. one token every 100ms.
+LIMITS = {
+    RATE_LIMIT_BUCKET_ORDERS: (2, 0.2),
+    RATE_LIMIT_BUCKET_CANCELS: (2, 0.2),
+    RATE_LIMIT_BUCKET_READS: (2, 0.2),
+}
+
+
+def _timed(function, *args):
+    start = time.monotonic()
+    function(*args)
+    return time.monotonic() - start
+
+
+class TestRateLimiter():
+
+    def test_get_bucket(self):
+        get_bucket = RateLimiter.get_bucket
+        assert get_bucket('post', 'https://a/v3/orders') == (
+            RATE_LIMIT_BUCKET_ORDERS
+        )
+        assert get_bucket('delete', 'https://a/v3/orders/123') == (
+            RATE_LIMIT_BUCKET_CANCELS
+        )
+        assert get_bucket('delete', 'https://a/v3/orders?market=BTC-USD') == (
+            RATE_LIMIT_BUCKET_CANCELS
+        )
+        assert get_bucket('delete', 'https://a/v3/active-orders') == (
+            RATE_LIMIT_BUCKET_CANCELS
+        )
+        assert get_bucket('get', 'https://a/v3/orders') == (
+            RATE_LIMIT_BUCKET_READS
+        )
+        assert get_bucket('post', 'https://a/v3/withdrawals') is None
+
+    def test_token_bucket(self):
+        rate_limiter = RateLimiter(LIMITS)
+        read = RATE_LIMIT_BUCKET_READS
+        assert _timed(rate_limiter.acquire, read) < 0.05
+        assert _timed(rate_limiter.acquire, read) < 0.05
+        assert 0.05 < _timed(rate_limiter.acquire, read) < 0.2
+        # Other buckets are independent.
+        assert _timed(rate_limiter.acquire, RATE_LIMIT_BUCKET_ORDERS) < 0.05
+        # Requests which are not limited never wait.
+        assert _timed(rate_limiter.acquire, None) < 0.05
+
+    def test_update_from_headers(self):
+        rate_limiter = RateLimiter(LIMITS)
+        read = RATE_LIMIT_BUCKET_READS
+        rate_limiter.update(read, {'RateLimit-Remaining': '1'}, 200)
+        assert rate_limiter.get_tokens(read) < 1.5
+
+        reset = (time.time() + 0.3) * 1000
+        rate_limiter.update(
+            read,
+            {'RateLimit-Remaining': '0', 'RateLimit-Reset': str(reset)},
+            200,
+        )
+        assert 0.2 < _timed(rate_limiter.acquire, read) < 0.45
+
+        rate_limiter.update(read, {'Retry-After': '300'}, 429)
+        assert rate_limiter.get_tokens(read) < 1
+        assert 0.2 < _timed(rate_limiter.acquire, read) < 0.45
+
+    def test_cancels_first(self):
+        rate_limiter = RateLimiter(LIMITS)
+        for _ in range(2):
+            rate_limiter.acquire(RATE_LIMIT_BUCKET_CANCELS)
+
+        sent = []
+
+        def send(bucket_name):
+            rate_limiter.acquire(bucket_name)
+            sent.append(bucket_name)
+
+        cancel = threading.Thread(
+            target=send,
+            args=(RATE_LIMIT_BUCKET_CANCELS,),
+        )
+        cancel.start()
+        time.sleep(0.02)
+        # The read bucket is full, but the read waits for the cancel.
+        send(RATE_LIMIT_BUCKET_READS)
+        cancel.join()
+        assert sent == [RATE_LIMIT_BUCKET_CANCELS, RATE_LIMIT_BUCKET_READS]
+
+    def test_acquire_async(self):
+        rate_limiter = RateLimiter(LIMITS)
+
+        async def acquire_reads():
+            start = time.monotonic()
+            for _ in range(3):
+                await rate_limiter.acquire_async(RATE_LIMIT_BUCKET_READS)
+            return time.monotonic() - start
+
+        assert 0.05 < asyncio.run(acquire_reads()) < 0.2
+
+    def test_transport(self, host):
+        transport = Transport(rate_limiter=RateLimiter(LIMITS))
+        transport.request(host + '/v3/markets', 'get')
+        assert transport.rate_limiter.get_tokens(RATE_LIMIT_BUCKET_READS) < 2
+
+        with pytest.raises(DydxApiError) as error:
+            transport.request(host + '/v3/throttled', 'get')
+        assert error.value.status_code == 429
+        assert 0.15 < _timed(
+            transport.request,
+            host + '/v3/markets',
+            'get',
+        ) < 0.35
+
+    def test_async_transport(self, host):
+        async def main():
+            transport = AsyncTransport(rate_limiter=RateLimiter(LIMITS))
+            try:
+                with pytest.raises(DydxApiError):
+                    await transport.request(host + '/v3/throttled', 'get')
+                start = time.monotonic()
+                await transport.request(host + '/v3/markets', 'get')
+                return time.monotonic() - start
+            finally:
+                await transport.close()
+
+        assert 0.15 < asyncio.run(main()) < 0.35
@@ -0,0 +1,48 @@
+import random
+
+import dateutil.parser as dp
+import pytest
+
+from dydx3.helpers.request_helpers import epoch_seconds_to_iso
+from dydx3.helpers.request_helpers import iso_to_epoch_seconds
+
+
+class TestRequestHelpers():
+
+    def test_iso_to_epoch_seconds(self):
+        random.seed(0)
+        for _ in range(1000):
+            epoch = random.randint(0, 4000000000) + random.random()
+            iso = epoch_seconds_to_iso(epoch)
+            assert iso_to_epoch_seconds(iso) == dp.parse(iso).timestamp()
+        assert iso_to_epoch_seconds('2021-01-01T00:00:00.001Z') == (
+            1609459200.001
+        )
+
+    def test_iso_to_epoch_seconds_fallback(self):
+        assert iso_to_epoch_seconds('2021-01-01T00:00:00Z') == 1609459200
+        assert iso_to_epoch_seconds('2021-01-01T00:00:00.5+00:00') == (
+            1609459200.5
+        )
+
+    @pytest.mark.parametrize('iso', [
+        '2021-02-29T00:00:00.000Z',
+        '2021-01-01T24:00:00.000Z',
+        '2021-01-01T00:00:60.000Z',
+    ])
+    def test_iso_to_epoch_seconds_invalid(self, iso):
+        with pytest.raises(ValueError):
+            iso_to_epoch_seconds(iso)
+
+    def test_epoch_seconds_to_iso(self):
+        assert epoch_seconds_to_iso(0) == '1970-01-01T00:00:00.000Z'
+        assert epoch_seconds_to_iso(1609459200.001) == (
+            '2021-01-01T00:00:00.001Z'
+        )
+        # Microseconds are rounded, and milliseconds truncated.
+        assert epoch_seconds_to_iso(1609459200.9999996) == (
+            '2021-01-01T00:00:01.000Z'
+        )
+        assert epoch_seconds_to_iso(1609459200.9994) == (
+            '2021-01-01T00:00:00.999Z'
+        )
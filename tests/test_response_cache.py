@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from dydx3 import Client
+from dydx3 import DydxApiError
+from dydx3.helpers.requests import Response
+from dydx3.helpers.response_cache import ResponseCache
+from dydx3.modules.async_public import AsyncPublic
+from dydx3.modules.public import Public
+
+URI = 'https://api.dydx.exchange/v3/markets'
+
+
+class TestResponseCache():
+
+    def test_ttl(self):
+        cache = ResponseCache({'markets': 0.1})
+        fetched = []
+
+        def fetch(headers):
+            fetched.append(headers)
+            return Response({'markets': len(fetched)}, headers={})
+
+        assert cache.get(URI, fetch).data == {'markets': 1}
+        assert cache.get(URI, fetch).data == {'markets': 1}
+        time.sleep(0.15)
+        assert cache.get(URI, fetch).data == {'markets': 2}
+        assert fetched == [None, None]
+        assert cache.get_stats() == {
+            'markets': {
+                'hits': 1,
+                'misses': 2,
+                'coalesced': 0,
+                'revalidated': 0,
+            },
+        }
+
+        cache.clear()
+        assert cache.get(URI, fetch).data == {'markets': 3}
+
+    def test_uncached_endpoint(self):
+        cache = ResponseCache()
+        uri = 'https://api.dydx.exchange/v3/trades/BTC-USD'
+        responses = [
+            cache.get(uri, lambda headers: Response({})) for _ in range(2)
+        ]
+        assert responses[0] is not responses[1]
+        assert cache.get_stats()['trades']['misses'] == 2
+
+    def test_single_flight(self):
+        cache = ResponseCache()
+        uri = 'https://api.dydx.exchange/v3/orderbook/BTC-USD'
+        started = threading.Event()
+        release = threading.Event()
+        fetched = []
+
+        def fetch(headers):
+            fetched.append(headers)
+            started.set()
+            release.wait()
+            return Response({'bids': []}, headers={})
+
+        responses = []
+        threads = [
+            threading.Thread(
+                target=lambda: responses.append(cache.get(uri, fetch)),
+            )
+            for _ in range(8)
+        ]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(fetched) == 1
+        assert len(responses) == 8
+        assert all(response is responses[0] for response in responses)
+        stats = cache.get_stats()['orderbook']
+        assert stats['misses'] == 1
+        assert stats['coalesced'] == 7
+
+    def test_single_flight_error(self):
+        cache = ResponseCache()
+
+        class _NotFound(object):
+            status_code = 404
+            text = 'Not found'
+
+            def json(self):
+                raise ValueError()
+
+        def fetch(headers):
+            raise DydxApiError(_NotFound())
+
+        with pytest.raises(DydxApiError):
+            cache.get(URI, fetch)
+        # A failed request is not cached.
+        assert cache.get(URI, lambda headers: Response({})).data == {}
+
+    def test_etag_revalidation(self, host):
+        cache = ResponseCache({'markets': 0})
+        public = Public(host, response_cache=cache)
+        response = public.get_markets()
+        assert 'If-None-Match' not in response.data['headers']
+        assert public.get_markets() is response
+        assert cache.get_stats()['markets'] == {
+            'hits': 0,
+            'misses': 2,
+            'coalesced': 0,
+            'revalidated': 1,
+        }
+
+    def test_client(self, host):
+        client = Client(host=host, response_cache=ResponseCache())
+        response = client.public.get_config()
+        assert client.public.get_config() is response
+        assert client.public.get_markets() is not response
+
+    def test_async(self, host):
+        async def main():
+            public = AsyncPublic(host, response_cache=ResponseCache())
+            try:
+                responses = await asyncio.gather(
+                    *[public.get_orderbook('BTC-USD') for _ in range(5)],
+                )
+                return responses, public.response_cache.get_stats()
+            finally:
+                await public.transport.close()
+
+        responses, stats = asyncio.run(main())
+        assert all(response is responses[0] for response in responses)
+        assert stats['orderbook']['misses'] == 1
+        assert stats['orderbook']['coalesced'] == 4
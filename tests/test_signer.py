@@ -0,0 +1,116 @@
+import errno
+import os
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from dydx3.constants import NETWORK_ID_SEPOLIA
+from dydx3.signer import SignerClient
+from dydx3.signer import SignerError
+from dydx3.signer import SignerServer
+from dydx3.starkex.conditional_transfer import SignableConditionalTransfer
+from dydx3.starkex.order import SignableOrder
+from dydx3.starkex.starkex_resources.proxy import get_hash
+from dydx3.starkex.transfer import SignableTransfer
+from dydx3.starkex.withdrawal import SignableWithdrawal
+
+from tests.starkex import test_conditional_transfer
+from tests.starkex import test_order
+from tests.starkex import test_transfer
+from tests.starkex import test_withdrawal
+
+
+@pytest.fixture
+def signer_socket():
+    directory = tempfile.mkdtemp()
+    socket_path = os.path.join(directory, 'signer.sock')
+    server = SignerServer(socket_path, test_order.MOCK_PRIVATE_KEY)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield socket_path
+    finally:
+        server.shutdown()
+        server.server_close()
+        os.rmdir(directory)
+
+
+class TestSigner():
+
+    def test_sign_signables(self, signer_socket):
+        order = SignableOrder(**test_order.ORDER_PARAMS)
+        with SignerClient(signer_socket) as client:
+            assert client.get_public_key() == int(
+                test_order.MOCK_PUBLIC_KEY,
+                16,
+            )
+            assert client.sign(order) == test_order.MOCK_SIGNATURE
+            assert client.sign_batch([order, order]) == [
+                test_order.MOCK_SIGNATURE,
+                test_order.MOCK_SIGNATURE,
+            ]
+            assert client.sign_hashes([order.hash]) == [
+                tuple(
+                    int(test_order.MOCK_SIGNATURE[i:i + 64], 16)
+                    for i in (0, 64)
+                ),
+            ]
+            assert client.get_hash(1, 2) == get_hash(1, 2)
+
+    def test_all_signable_types_round_trip(self, signer_socket):
+        signables = [
+            SignableOrder(**test_order.ORDER_PARAMS),
+            SignableTransfer(
+                **test_transfer.TRANSFER_PARAMS,
+                network_id=NETWORK_ID_SEPOLIA,
+            ),
+            SignableWithdrawal(**test_withdrawal.WITHDRAWAL_PARAMS),
+            SignableConditionalTransfer(
+                **test_conditional_transfer.CONDITIONAL_TRANSFER_PARAMS,
+            ),
+        ]
+        with SignerClient(signer_socket) as client:
+            signatures = client.sign_batch(signables)
+        for signable, signature in zip(signables, signatures):
+            assert signable.verify_signature(
+                signature,
+                test_order.MOCK_PUBLIC_KEY,
+            )
+
+    def test_error(self, signer_socket):
+        with SignerClient(signer_socket) as client:
+            with pytest.raises(SignerError):
+                client.sign_hashes([2 ** 255])
+            # The connection is still usable after an error.
+            assert client.get_hash(1, 2) == get_hash(1, 2)
+
+    def test_socket_in_use(self, signer_socket):
+        with pytest.raises(OSError) as error:
+            SignerServer(signer_socket, test_order.MOCK_PRIVATE_KEY)
+        assert error.value.errno == errno.EADDRINUSE
+        # The running server still owns the socket.
+        with SignerClient(signer_socket) as client:
+            assert client.get_hash(1, 2) == get_hash(1, 2)
+
+    def test_stale_socket(self):
+        directory = tempfile.mkdtemp()
+        socket_path = os.path.join(directory, 'signer.sock')
+        try:
+            # A socket file left behind by a server which is not running.
+            stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            stale.bind(socket_path)
+            stale.close()
+            server = SignerServer(socket_path, test_order.MOCK_PRIVATE_KEY)
+            server.server_close()
+
+            with open(socket_path, 'w'):
+                pass
+            with pytest.raises(OSError) as error:
+                SignerServer(socket_path, test_order.MOCK_PRIVATE_KEY)
+            assert error.value.errno == errno.EEXIST
+            assert os.path.isfile(socket_path)
+            os.unlink(socket_path)
+        finally:
+            os.rmdir(directory)
@@ -0,0 +1,67 @@
+import pytest
+
+from dydx3 import Client
+from dydx3 import DydxApiError
+from dydx3.helpers.json_codecs import StdlibJsonCodec
+from dydx3.helpers.requests import Transport
+
+
+class TestTransport():
+
+    def test_request(self, host):
+        transport = Transport(pool_maxsize=4, pool_block=True)
+        response = transport.request(host + '/v3/markets', 'get')
+        assert response.data['path'] == '/v3/markets'
+        with pytest.raises(DydxApiError):
+            transport.request(host + '/v3/missing', 'get')
+
+    def test_lazy_response(self, host):
+        decoded = []
+
+        class Codec(StdlibJsonCodec):
+            def loads(self, content):
+                decoded.append(content)
+                return super(Codec, self).loads(content)
+
+        transport = Transport(json_codec=Codec())
+        response = transport.request(host + '/v3/markets', 'get')
+        assert isinstance(response.raw, bytes)
+        assert decoded == []
+        assert response.data['path'] == '/v3/markets'
+        assert response.data is response.data
+        assert decoded == [response.raw]
+
+        response = transport.request(host + '/v3/empty', 'delete')
+        assert response.raw == b''
+        assert response.data == {}
+
+    def test_keep_alive(self, host):
+        transport = Transport()
+        ports = {
+            transport.request(host + '/v3/time', 'get').data['port']
+            for _ in range(3)
+        }
+        assert len(ports) == 1
+
+        transport = Transport(keep_alive=False)
+        ports = {
+            transport.request(host + '/v3/time', 'get').data['port']
+            for _ in range(3)
+        }
+        assert len(ports) == 3
+
+    def test_client_modules_share_transport(self, host):
+        client = Client(
+            host=host,
+            pool_maxsize=32,
+            api_key_credentials={
+                'key': 'key',
+                'secret': 'c2VjcmV0',
+                'passphrase': 'passphrase',
+            },
+        )
+        assert client.public.transport is client.transport
+        assert client.private.transport is client.transport
+        adapter = client.transport.session.get_adapter(host)
+        assert adapter._pool_maxsize == 32
+        assert client.public.get_markets().data['path'] == '/v3/markets'